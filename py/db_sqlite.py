@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 
 import sqlite3 as s
+import threading
+import time
+from contextlib import contextmanager
 
 
 class s3db:
@@ -46,6 +49,19 @@ class s3db:
         self.opt_set('Journal_Mode', 'WAL')
         self.opt_set('Cache_Size', '16384')
 
+    def opt_perf(self, cache_size=None, mmap_size=None, temp_store=None):
+        """设置性能相关的参数,None为不设置.
+            cache_size - 页缓存大小,正数为页数,负数为KB数
+            mmap_size - 内存映射读取的字节数上限,0为关闭
+            temp_store - 临时表与索引的存储位置:'DEFAULT'/'FILE'/'MEMORY'
+            返回值:是否全部成功
+        """
+        ret = True
+        for cmd, val in (('Cache_Size', cache_size), ('Mmap_Size', mmap_size), ('Temp_Store', temp_store)):
+            if val is not None:
+                ret = self.opt_set(cmd, val) and ret
+        return ret
+
     def close(self):
         """关闭数据库连接"""
         if self.conn is None:
@@ -88,8 +104,30 @@ q=dbs.s3query(db)
 rows,msg=q.query('select * from tbl_infos')
 for row in rows:
     print(row[0],row[1])
+
+rows,msg=q.iquery('select * from tbl_infos')  # 大结果集,流式迭代
+for row in rows:
+    print(row[0],row[1])
+
+with q.batch(1000):  # 块内的提交请求每1000次才真正提交一次
+    for row in rows:
+        q.exec('insert into tbl_bak values(?,?)', row)
 '''
 
+_orm_sqls = {}  # 轻量级ORM插入语句缓存 {(表名,字段元组,模式):sql}
+
+
+def orm_sql(tbl, fds, mode='insert'):
+    """生成轻量级ORM插入语句,按(表名,字段元组,模式)缓存.
+        mode - 'insert'常规插入;'replace'冲突时替换(upsert);'ignore'冲突时忽略
+    """
+    key = (tbl, fds, mode)
+    sql = _orm_sqls.get(key)
+    if sql is None:
+        verb = 'insert' if mode == 'insert' else 'insert or %s' % mode
+        sql = _orm_sqls[key] = '%s into %s (%s) values(%s)' % (verb, tbl, ','.join(fds), ','.join('?' * len(fds)))
+    return sql
+
 
 class s3query:
     """sqlite3数据查询功能封装"""
@@ -107,6 +145,58 @@ class s3query:
             db = self.db
         self.conn = db.conn
         self.cur = db.conn.cursor()
+        self._batch = None  # 批量提交状态 [每批提交请求数,已累计数],None为立即提交
+
+    def _commit(self):
+        """处理提交请求:批量提交状态下累计到数量才真正提交"""
+        if self._batch is None:
+            self.conn.commit()
+            return
+        self._batch[1] += 1
+        if self._batch[1] >= self._batch[0]:
+            self._batch[1] = 0
+            self.conn.commit()
+
+    def _rollback(self):
+        """出错回滚:批量提交状态下sqlite已撤销出错的语句,保留本批次之前的执行结果"""
+        if self._batch is None:
+            self.conn.rollback()
+
+    def _sp_begin(self):
+        """批量提交状态下,为多语句的操作建立保存点,出错时仅撤销本次操作已执行的部分.
+            尚无事务时先开启事务,否则保存点自行开启的事务在释放时会被直接提交,批量块出错时无法回滚.
+        """
+        if self._batch is not None:
+            if not self.conn.in_transaction:
+                self.conn.execute('begin')
+            self.conn.execute('savepoint s3q_op')
+
+    def _sp_end(self, ok):
+        """结束_sp_begin建立的保存点:ok为真时释放,否则回滚到保存点后释放"""
+        if self._batch is None:
+            return
+        try:
+            if not ok:
+                self.conn.execute('rollback to s3q_op')
+            self.conn.execute('release s3q_op')
+        except s.Error:
+            pass  # 保存点未能建立
+
+    @contextmanager
+    def batch(self, size=1000):
+        """批量提交上下文:块内exec/append等方法的提交请求被合并,每累计size次真正提交一次,块结束时提交剩余部分;
+            块内发生异常时回滚尚未提交的部分.
+        """
+        self._batch = [max(1, size), 0]
+        try:
+            yield self
+        except BaseException:
+            self.conn.rollback()
+            raise
+        else:
+            self.conn.commit()
+        finally:
+            self._batch = None
 
     def exec(self, sql, param=None, cmt=True):
         """执行sql语句,不要求获取结果集.
@@ -119,10 +209,28 @@ class s3query:
             else:
                 self.cur.execute(sql, param)
             if cmt:
-                self.conn.commit()
+                self._commit()
             return True, self.cur.rowcount
         except Exception as e:
-            self.conn.rollback()
+            self._rollback()
+            return False, str(e)
+
+    def execmany(self, sql, params, cmt=True):
+        """使用params中的多组参数(可为迭代器,不会被整体展开)批量执行sql语句,适用于批量的插入/更新/upsert.
+            返回值:成功时 - (True,影响的行数)
+                  失败时 - (False,错误信息),已执行的部分被回滚
+        """
+        try:
+            self._sp_begin()
+            self.cur.executemany(sql, params)
+            rc = self.cur.rowcount
+            self._sp_end(True)
+            if cmt:
+                self._commit()
+            return True, rc
+        except Exception as e:
+            self._sp_end(False)
+            self._rollback()
             return False, str(e)
 
     def query(self, sql, param=None, fetchsize=None):
@@ -142,6 +250,34 @@ class s3query:
         except Exception as e:
             return None, str(e)
 
+    def iquery(self, sql, param=None, arraysize=1000):
+        """执行sql查询,得到结果行的迭代器.使用独立的游标,每次从数据库获取arraysize行,不会将结果集整体装入内存.
+            返回值:成功时 - (结果行迭代器,'')
+                  失败时 - (None,错误信息)
+        """
+        cur = self.conn.cursor()
+        cur.arraysize = arraysize
+        try:
+            if param is None:
+                cur.execute(sql)
+            else:
+                cur.execute(sql, param)
+        except Exception as e:
+            cur.close()
+            return None, str(e)
+
+        def rows():
+            try:
+                while True:
+                    lst = cur.fetchmany()
+                    if not lst:
+                        break
+                    yield from lst
+            finally:
+                cur.close()
+
+        return rows(), ''
+
     def fetch(self, fetchsize):
         """在query使用了fetchsize分批获取之后,继续获取结果集的后续部分
             返回值:成功时 - (结果集,'')
@@ -152,47 +288,62 @@ class s3query:
         except Exception as e:
             return None, str(e)
 
-    def append(self, obj, cmt=True):
-        """轻量级ORM插入实现,obj的类型为表名,obj内含属性为表中字段与对应的值
+    def append(self, obj, cmt=True, mode='insert'):
+        """轻量级ORM插入实现,obj的类型为表名,obj内含属性为表中字段与对应的值;obj为列表时进行批量插入.
+            mode - 'insert'常规插入;'replace'冲突时替换(upsert);'ignore'冲突时忽略
             返回值:成功时 - (True,影响的行数)
                   失败时 - (False,错误信息)
         """
-
-        def _insert(obj, cmt):
-            tbl = type(obj).__name__
-            val = []
-            fds = []
-            dmy = []
-            for f in obj.__dict__:
-                fds.append(f)
-                val.append(obj.__dict__[f])
-                dmy.append('?')
-            sql = 'insert into %s (%s) values(%s)' % (tbl, ','.join(fds), ','.join(dmy))
-            return self.exec(sql, val, cmt)
-
         if isinstance(obj, list) or isinstance(obj, tuple):
-            for o in obj:
-                _insert(o, False)
+            return self.appendx(obj, cmt, mode)
+        d = obj.__dict__
+        return self.exec(orm_sql(type(obj).__name__, tuple(d), mode), tuple(d.values()), cmt)
+
+    def appendx(self, objs, cmt=True, mode='insert', size=1000):
+        """轻量级ORM批量插入,objs可为对象的迭代器.相邻的同类型同字段对象每size个合并为一次executemany.
+            返回值:成功时 - (True,影响的行数)
+                  失败时 - (False,错误信息),已执行的部分被回滚
+        """
+        rc = 0
+        key = None
+        vals = []
+        try:
+            self._sp_begin()
+            for obj in objs:
+                d = obj.__dict__
+                k = (type(obj).__name__, tuple(d))
+                if k != key or len(vals) >= size:
+                    if vals:
+                        self.cur.executemany(orm_sql(key[0], key[1], mode), vals)
+                        rc += self.cur.rowcount
+                    key = k
+                    vals = []
+                vals.append(tuple(d.values()))
+            if vals:
+                self.cur.executemany(orm_sql(key[0], key[1], mode), vals)
+                rc += self.cur.rowcount
+            self._sp_end(True)
             if cmt:
-                return self.db.commit()
-            else:
-                return True, ''
-        else:
-            return _insert(obj, cmt)
+                self._commit()
+            return True, rc
+        except Exception as e:
+            self._sp_end(False)
+            self._rollback()
+            return False, str(e)
 
     def extract(self, sql, filter_fun, param=None, fetchsize=100):
         """执行查询,给出sql和参数param,对结果行进行filter_fun过滤,可设定提取批尺寸fetchsize.
            返回值:(结果数量,错误信息)
         """
         rc = 0
-        rows, msg = self.query(sql, param, fetchsize)
+        rows, msg = s3query.iquery(self, sql, param, fetchsize)
         if msg: return rc, msg
-        while len(rows):
+        try:
             for row in rows:
                 filter_fun(row)
                 rc += 1
-            rows, msg = self.fetch(fetchsize)
-            if msg: return rc, msg
+        except s.Error as e:
+            return rc, str(e)
         return rc, msg
 
     def has(self, name, type='table'):
@@ -214,6 +365,94 @@ class s3query:
         self.db = None
 
 
+class s3pool:
+    """sqlite3连接池:每个线程拥有各自的WAL模式只读连接,读操作互不阻塞;全部写操作共享单一的写连接,由写锁串行化并统计锁等待.
+        内存数据库无法共享,读操作也使用写连接.
+    """
+
+    def __init__(self, dbpath, cache_size=16384, mmap_size=None, temp_store=None, synchronous='OFF'):
+        self.dbpath = dbpath
+        self.opts = (cache_size, mmap_size, temp_store)
+        self.writer = s3db(dbpath)  # 共享的写连接
+        if self.writer.opened():
+            self.writer.opt_set('Synchronous', synchronous)
+            self.writer.opt_set('Journal_Mode', 'WAL')
+            self.writer.opt_perf(*self.opts)
+        self.wlock = threading.RLock()
+        self._wowner = None  # 持有写锁的线程标识,用于统计写锁争用
+        self.stats = {'writes': 0, 'contends': 0, 'wait': 0.0, 'max_wait': 0.0, 'hold': 0.0}  # 写锁统计:获取次数,需等待次数,等待与持有的累计秒数
+        self._tls = threading.local()
+        self._readers = []  # 全部读连接,关闭时使用
+        self._rlock = threading.Lock()
+
+    def opened(self):
+        return self.writer.opened()
+
+    def reader(self):
+        """获取当前线程的只读查询对象s3query,首次调用时建立连接"""
+        q = getattr(self._tls, 'q', None)
+        if q is not None:
+            return q
+        if self.dbpath == ':memory:':
+            q = s3query(self.writer)
+        else:
+            db = s3db(self.dbpath)
+            if not db.opened():
+                return None
+            db.opt_perf(*self.opts)
+            db.opt_set('Query_Only', 1)
+            q = s3query(db)
+            with self._rlock:
+                self._readers.append(db)
+        self._tls.q = q
+        return q
+
+    def query(self, sql, param=None, fetchsize=None):
+        """使用当前线程的读连接进行查询
+            返回值:成功时 - (结果集,'')
+                  失败时 - (None,错误信息)
+        """
+        q = self.reader()
+        if q is None:
+            return None, 'reader open fail'
+        return q.query(sql, param, fetchsize)
+
+    @contextmanager
+    def write(self):
+        """获取写连接的上下文,块内独占写连接,记录写锁的等待与持有时间.
+            写锁由with语句获取,获取后的全部代码都在with块内,线程被强制停止(异步异常)时也能释放写锁.
+        """
+        btime = time.time()
+        owner = self._wowner
+        contend = owner is not None and owner != threading.get_ident()  # 写锁正被其他线程持有
+        with self.wlock:
+            prev = self._wowner  # 同一线程嵌套获取时为自身
+            try:
+                self._wowner = threading.get_ident()
+                atime = time.time()
+                st = self.stats
+                st['writes'] += 1
+                if contend:
+                    st['contends'] += 1
+                    st['wait'] += atime - btime
+                    st['max_wait'] = max(st['max_wait'], atime - btime)
+                try:
+                    yield self.writer
+                finally:
+                    st['hold'] += time.time() - atime
+            finally:
+                self._wowner = prev
+
+    def close(self):
+        """关闭全部连接"""
+        with self._rlock:
+            for db in self._readers:
+                db.close()
+            self._readers.clear()
+        self._tls = threading.local()
+        self.writer.close()
+
+
 # sqlite3简易table功能封装
 class s3tbl(s3query):
     def __init__(self, db):
@@ -241,11 +480,12 @@ class s3tbl(s3query):
         """
         return super().exec(self.sql_insert, vals, cmt)
 
-    def insertx(self, lst):
-        """插入多条记录lst"""
-        for t in lst:
-            self.insert(t, False)
-        self.conn.commit()
+    def insertx(self, lst, cmt=True):
+        """使用executemany插入多条记录lst(可为迭代器)
+            返回值:成功时 - (True,影响的行数)
+                  失败时 - (False,错误信息)
+        """
+        return self.execmany(self.sql_insert, lst, cmt)
 
     def update(self, vals, where=None, cmt=True):
         """更新记录
@@ -266,9 +506,48 @@ class s3tbl(s3query):
             sql = self.sql_select
         return super().query(sql, param)
 
+    def iquery(self, param=None, sql=None, arraysize=1000):
+        """流式查询结果
+            返回值:成功时 - (结果行迭代器,'')
+                  失败时 - (None,错误信息)
+        """
+        if sql is None:
+            sql = self.sql_select
+        return super().iquery(sql, param, arraysize)
+
     def close(self):
         """关闭"""
         super().close()
         self.sql_insert = None
         self.sql_update = None
         self.sql_select = None
+
+
+if __name__ == '__main__':
+    class row_t:
+        def __init__(self, id):
+            self.id = id
+
+    db = s3db(':memory:')
+    q = s3query(db)
+    q.exec('create table row_t(id integer primary key)')
+
+    # 批量块中途出错时,块内execmany/appendx已执行的部分都应被回滚
+    for many in (lambda: q.execmany('insert into row_t values(?)', [(1,), (2,)]),
+                 lambda: q.appendx([row_t(1), row_t(2)])):
+        try:
+            with q.batch():
+                assert many() == (True, 2)
+                assert q.exec('insert into row_t values(3)')[0]
+                raise ValueError()
+        except ValueError:
+            pass
+        assert q.query('select count(*) from row_t')[0][0][0] == 0
+
+    # 出错的操作仅撤销自身,批量块内之前的结果保留
+    with q.batch():
+        assert q.exec('insert into row_t values(1)')[0]
+        assert not q.execmany('insert into row_t values(?)', [(2,), (1,)])[0]
+    assert q.query('select id from row_t')[0] == [(1,)]
+    q.close()
+    db.close()
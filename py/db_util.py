@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from concurrent.futures import ThreadPoolExecutor
 from util_base import *
 
 '''
@@ -213,10 +214,36 @@ class db_fetch_t:
             self.logger.warn('db query error: %s' % (res))
             return None, None
 
+        return self._apply((self.on_make_info(r, exparam) for r in res), exparam, auto_skip), res
+
+    def page_key(self):
+        """得到存根对应的分页起点:(last_time,last_id,是否包含此位置).last_id为需要重试的记录,需包含在结果中"""
+        return self.last_time, self.last_id, True
+
+    def fetch_page(self, key, exparam=None, size=1000):
+        """键集分页获取key=(时间,唯一值,是否包含)位置之后的一页数据,不改变存根状态.
+            返回值:(是否成功,原始数据列表或错误,信息列表,下一页的起点)
+        """
+        sql, param = self.on_make_page_sql(key[0], key[1], key[2], size, exparam)
+        st, res = self.on_exec(self.db, sql, param, exparam)
+        if not st:
+            return False, res, None, None
+
+        raws = []
+        for r in res:  # 结果集可以是服务端游标,逐行获取,且不超过页尺寸
+            raws.append(r)
+            if len(raws) >= size:
+                break
+        infos = [self.on_make_info(r, exparam) for r in raws]
+        if infos:
+            key = (self.on_get_lasttime(infos[-1], exparam), self.on_make_unique(infos[-1], exparam), False)
+        return True, raws, infos, key
+
+    def _apply(self, infos, exparam=None, auto_skip=False):
+        """对查询得到的信息进行接续与过滤处理,并更新存根的时间点.返回值:信息列表"""
         rst = []
         info = None
-        for r in res:  # 对查询结果进行遍历
-            info = self.on_make_info(r, exparam)
+        for info in infos:  # 对查询结果进行遍历
             if self.last_id:
                 if self.on_make_unique(info, exparam) != self.last_id:
                     continue
@@ -230,11 +257,16 @@ class db_fetch_t:
             self.last_time = self.on_get_lasttime(info, exparam)
         elif auto_skip:  # 使用当前时间作为最后的时间点
             self.last_time = get_curr_date('%Y-%m-%d %H:%M:%S.%f')
-        return rst, res
+        return rst
 
     def on_make_sql(self, exparam):
         """构造查询sql,以及对应的查询参数"""
 
+    def on_make_page_sql(self, last_time, last_id, inclusive, size, exparam):
+        """构造键集分页查询sql与参数:按(时间,唯一值)排序,获取(last_time,last_id)位置之后(inclusive为真时包含此位置)的最多size条记录.
+            last_id为None时仅按last_time定位,条件应与on_make_sql一致.返回值:(sql,param)
+        """
+
     def on_exec(self, db, sql, param, exparam):
         """基于conn执行sql查询,param是查询参数,exparam是外部给出的扩展参数.返回值:(bool状态,结果集)"""
 
@@ -259,7 +291,17 @@ def proc_fetch(anz_fun, fetcher, pusher=None, logger=None):
         # 如果查询失败或没有信息则返回
         if logs is None:
             return False, 0, 0
+    except Exception as e:
+        if logger:
+            logger.error(ei(e))
+        return False, 0, 0
+
+    return _proc_logs(anz_fun, fetcher, pusher, logger, logs, raws)
 
+
+def _proc_logs(anz_fun, fetcher, pusher, logger, logs, raws):
+    """对一批查询结果进行分析/推送,并将存根落盘;返回值:是否完全执行成功,提取数量,推送数量"""
+    try:
         if len(logs) == 0:
             fetcher.save_stub()
             # 原始数据存在但有效数据不存在,说明当前数据需要被忽略,继续下一批
@@ -291,3 +333,42 @@ def proc_fetch(anz_fun, fetcher, pusher=None, logger=None):
     # 执行点存根信息落盘
     fetcher.save_stub()
     return fail is None, len(raws), idx
+
+
+def proc_fetch_pages(anz_fun, fetcher, pusher=None, logger=None, size=1000, max_pages=0):
+    """使用键集分页进行流水线式的查询/分析/推送:分析与推送当前页的同时,预取下一页.
+        每页的处理与存根落盘和proc_fetch一致;推送失败时停止,存根记录失败点,预取的数据被丢弃.
+        max_pages限定本次处理的最大页数,0为不限制.
+        返回值:是否完全执行成功,提取数量,推送数量
+    """
+    raws_cnt = 0
+    push_cnt = 0
+    pages = 0
+    with ThreadPoolExecutor(1) as pool:
+        fut = pool.submit(fetcher.fetch_page, fetcher.page_key(), None, size)
+        while fut:
+            try:
+                st, raws, infos, key = fut.result()
+            except Exception as e:
+                if logger:
+                    logger.error(ei(e))
+                return False, raws_cnt, push_cnt
+            if not st:
+                fetcher.logger.warn('db query error: %s' % (raws))
+                return False, raws_cnt, push_cnt
+
+            pages += 1
+            fut = None
+            if len(raws) >= size and (not max_pages or pages < max_pages):
+                fut = pool.submit(fetcher.fetch_page, key, None, size)  # 预取下一页
+
+            if not raws and pages > 1:
+                break  # 上一页恰好是最后的数据
+            ok, cnt, idx = _proc_logs(anz_fun, fetcher, pusher, logger, fetcher._apply(infos), raws)
+            raws_cnt += cnt
+            push_cnt += idx
+            if not ok:
+                if fut:
+                    fut.cancel()
+                return False, raws_cnt, push_cnt
+    return True, raws_cnt, push_cnt
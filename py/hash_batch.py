@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+    simhash/super_shingle的numpy向量化批量计算.
+    计算结果与hash_util中的逐位计算完全一致(python整数运算不截断,这里对其进行了等价的64位模拟).
+"""
+import numpy as np
+import hash_util as hu
+
+_char_hashes = {}  # 单字符的rx_hash_skeeto30哈希缓存 {ord:hash}
+_bits64 = np.arange(64, dtype=np.uint64)
+
+
+def string_hash(v, bitsmask=(1 << 64) - 1):
+    """与hash_util.string_hash(v, rx_hash_skeeto30, bitsmask)结果一致,缓存了单字符哈希"""
+    if not v:
+        return 0
+    x = len(v) * 378551
+    for c in v:
+        c = ord(c)
+        h = _char_hashes.get(c)
+        if h is None:
+            h = _char_hashes[c] = hu.rx_hash_skeeto30(c)
+        x = ((x << 5) ^ (x >> 27)) ^ h
+    return x & bitsmask
+
+
+def _token_hashes(sh: hu.simhash, docs, use_weight):
+    """计算docs中全部词的哈希与权重,返回值:(哈希数组,权重数组,各文档的词起点列表)"""
+    hashes = []
+    weights = []
+    offsets = []
+    fast = sh.hashfunc is hu.rx_hash_skeeto30
+    for tokens in docs:
+        offsets.append(len(hashes))
+        for x in tokens:
+            hashes.append(string_hash(x, sh.bitsmask) if fast else hu.string_hash(x, sh.hashfunc, sh.bitsmask))
+            weights.append(sh._weight_func(x, use_weight))
+    return np.array(hashes, dtype=np.uint64), weights, offsets
+
+
+def simhash_many(sh: hu.simhash, docs, use_weight=True):
+    """使用simhash计算器sh的配置,批量计算多个文档(词列表)的指纹.返回值:[指纹],与sh.hash的结果一致"""
+    if sh.hashbits > 64:
+        return [sh.hash(tokens, use_weight) for tokens in docs]
+    docs = [list(tokens) for tokens in docs]
+    hashes, weights, offsets = _token_hashes(sh, docs, use_weight)
+    rst = [sh.bitsmask] * len(docs)  # 空文档的各比特权重和均为0,指纹为全1
+    if not len(hashes):
+        return rst
+
+    # 全部词的哈希展开为比特矩阵(T,hashbits),按权重正负累计
+    bits = ((hashes[:, None] >> _bits64[:sh.hashbits]) & np.uint64(1)).astype(bool)
+    is_int = all(isinstance(w, int) for w in weights)
+    w = np.array(weights, dtype=np.int64 if is_int else np.float64)[:, None]
+    signed = np.where(bits, w, -w)
+
+    idxs = [i for i, tokens in enumerate(docs) if tokens]
+    starts = [offsets[i] for i in idxs]
+    if is_int:
+        sums = np.add.reduceat(signed, starts, axis=0)  # 整数权重,累加顺序不影响结果
+    else:
+        # 浮点权重需保持与逐词累加相同的顺序,用按行的累积和取各文档的末行
+        ends = starts[1:] + [len(hashes)]
+        sums = np.empty((len(idxs), sh.hashbits), dtype=np.float64)
+        for r, (b, e) in enumerate(zip(starts, ends)):
+            sums[r] = np.cumsum(signed[b:e], axis=0)[-1]
+
+    fps = ((sums >= 0).astype(np.uint64) << _bits64[:sh.hashbits]).sum(axis=1, dtype=np.uint64)
+    for r, i in enumerate(idxs):
+        rst[i] = int(fps[r])
+    return rst
+
+
+def simhash_tokens(sh: hu.simhash, tokens, use_weight=True):
+    """向量化计算单个文档(词列表)的指纹,结果与sh.hash一致"""
+    return simhash_many(sh, [tokens], use_weight)[0]
+
+
+def _skeeto3_low32(x, f):
+    """对小于2^32的uint64数组x计算rx_hash_skeeto3(x,f)的低32位.
+        python整数计算时中间值最多约96位,且右移会将高位带入低位,这里将第二次乘法拆分为高低两部分进行等价计算.
+    """
+    f = [np.uint64(v) for v in f]
+    x = x ^ (x >> f[0])
+    x = x * f[1]  # 不超过64位,无截断
+    x ^= x >> f[2]
+    a = (x & np.uint64(0xffffffff)) * f[3]  # x*f3 = b*2^32 + a
+    b = (x >> np.uint64(32)) * f[3]
+    lo = (b << np.uint64(32)) + a  # x*f3的低64位
+    sh = (b << (np.uint64(32) - f[4])) + (a >> f[4])  # (x*f3)>>f4的低64位
+    x = lo ^ sh
+    x = x * f[5]  # 结果只需要低32+f6位,低64位足够
+    x ^= x >> f[6]
+    return x & np.uint64(0xffffffff)
+
+
+def _shingles(ss: hu.super_shingle, s):
+    """计算字符串s的全部子片哈希值"""
+    loop = max(1, len(s) - ss.k + 1)  # n-gram循环数量做最小限定
+    return [string_hash(s[i:i + ss.k], ss.bitsmask) for i in range(0, loop, ss.s)]
+
+
+def super_shingle_many(ss: hu.super_shingle, texts):
+    """使用super_shingle计算器ss的配置,批量计算多个字符串的哈希集合.返回值:[{int}或None],与ss.hash的结果一致"""
+    if ss.hashbits > 32:
+        return [ss.hash(s) for s in texts]
+    texts = list(texts)
+    rst = [None] * len(texts)
+    allsh = []
+    starts = []
+    idxs = []
+    for i, s in enumerate(texts):
+        if not s:
+            continue
+        idxs.append(i)
+        starts.append(len(allsh))
+        allsh.extend(_shingles(ss, s))
+    if not idxs:
+        return rst
+
+    allsh = np.array(allsh, dtype=np.uint64)
+    mask = np.uint64(ss.bitsmask)
+    # mins[j,r]为第j个二级哈希函数下,第r个字符串全部子片的最小哈希
+    mins = np.empty((ss.m, len(idxs)), dtype=np.uint64)
+    for j in range(ss.m):
+        mins[j] = np.minimum.reduceat(_skeeto3_low32(allsh, hu._skeeto_3f[j + 1]) & mask, starts)
+
+    ends = starts[1:] + [len(allsh)]
+    for r, i in enumerate(idxs):
+        vals = set()
+        for j in range(ss.m):
+            minval = int(mins[j, r])
+            if minval in vals:  # 冲突预防,使用后面的hash算法重新生成
+                minval = int((_skeeto3_low32(allsh[starts[r]:ends[r]], hu._skeeto_3f[j + ss.m + 1]) & mask).min())
+            vals.add(minval)
+        rst[i] = vals
+    return rst
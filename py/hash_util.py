@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+from array import array
+import os
+import struct
 
 # skeeto三绕哈希函数配置参数(36个)
 _skeeto_3f = [
@@ -248,3 +251,144 @@ def super_shingle_equ(s1, s2, limit=2):
     """判断两个super_shingle哈希结果是否相同"""
     si, su = jacard_sim(s1, s2)
     return si >= limit
+
+
+class simhash_index:
+    """simhash指纹的近似重复索引.
+        根据抽屉原理,海明距离不超过k的两个指纹,拆分为k+1段后至少有一段完全相同;
+        因此每段建立一个哈希表,查询时仅需比较同段值相同的候选指纹.
+    """
+
+    magic = b'SHIX'
+    ver = 1
+
+    def __init__(self, k=3, hashbits=64):
+        self.k = k  # 近似判定的最大海明距离
+        self.hashbits = hashbits
+        self.bands = []  # 分段信息[(移位,掩码)]
+        nb = k + 1
+        for i in range(nb):
+            b = hashbits * i // nb
+            e = hashbits * (i + 1) // nb
+            self.bands.append((hashbits - e, (1 << (e - b)) - 1))  # 与uint16_split一致,由高位到低位分段
+        self.clear()
+
+    def clear(self):
+        self.hashes = array('Q')  # 各槽位的指纹
+        self.ids = array('q')  # 各槽位的记录id,-1为空闲槽位
+        self.slots = {}  # {id:槽位}
+        self.frees = []  # 空闲槽位列表
+        self.tables = [{} for _ in self.bands]  # 各分段的哈希表 {分段值:槽位或array(槽位)}
+
+    def __len__(self):
+        return len(self.slots)
+
+    def _split(self, hash):
+        """将指纹拆分为分段值列表"""
+        if self.hashbits == 64 and len(self.bands) == 4:
+            return uint16_split(hash)
+        return [(hash >> sh) & mask for sh, mask in self.bands]
+
+    def insert(self, hash, id):
+        """添加指纹hash并关联整数记录id(已存在的id会被替换),返回值:槽位"""
+        if id in self.slots:
+            self.remove(id)
+        if self.frees:
+            slot = self.frees.pop()
+            self.hashes[slot] = hash
+            self.ids[slot] = id
+        else:
+            slot = len(self.hashes)
+            self.hashes.append(hash)
+            self.ids.append(id)
+        self.slots[id] = slot
+
+        for tbl, bv in zip(self.tables, self._split(hash)):
+            old = tbl.get(bv)
+            if old is None:
+                tbl[bv] = slot  # 单值直接记录槽位,节省内存
+            elif isinstance(old, array):
+                old.append(slot)
+            else:
+                tbl[bv] = array('i', (old, slot))
+        return slot
+
+    def remove(self, id):
+        """删除记录id对应的指纹,返回值:是否删除成功"""
+        slot = self.slots.pop(id, None)
+        if slot is None:
+            return False
+        for tbl, bv in zip(self.tables, self._split(self.hashes[slot])):
+            old = tbl[bv]
+            if isinstance(old, array):
+                old.remove(slot)
+                if len(old) == 1:
+                    tbl[bv] = old[0]
+            else:
+                del tbl[bv]
+        self.ids[slot] = -1
+        self.frees.append(slot)
+        return True
+
+    def query(self, hash, k=None, limit=None):
+        """查询与指纹hash的海明距离不超过k(不超过索引的k)的记录.返回值:[(距离,id)]按距离排序"""
+        if k is None or k > self.k:
+            k = self.k
+        rst = []
+        seen = set()
+        hashes, ids = self.hashes, self.ids
+        for tbl, bv in zip(self.tables, self._split(hash)):
+            slots = tbl.get(bv)
+            if slots is None:
+                continue
+            for slot in (slots if isinstance(slots, array) else (slots,)):
+                if slot in seen:
+                    continue
+                seen.add(slot)
+                dst = bin(hashes[slot] ^ hash).count('1')
+                if dst <= k:
+                    rst.append((dst, ids[slot]))
+        rst.sort()
+        return rst if limit is None else rst[:limit]
+
+    def exists(self, hash, k=None):
+        """判断是否存在与指纹hash近似重复的记录"""
+        return len(self.query(hash, k, 1)) > 0
+
+    def save(self, fname):
+        """保存索引到文件fname,返回值:(True,'')或(False,err)"""
+        try:
+            hashes = array('Q')
+            ids = array('q')
+            for id, slot in self.slots.items():
+                hashes.append(self.hashes[slot])
+                ids.append(id)
+            with open(fname + '.tmp', 'wb') as fp:
+                fp.write(self.magic)
+                fp.write(struct.pack('<IIIQ', self.ver, self.k, self.hashbits, len(ids)))
+                fp.write(hashes.tobytes())
+                fp.write(ids.tobytes())
+            os.replace(fname + '.tmp', fname)
+            return True, ''
+        except Exception as e:
+            return False, str(e)
+
+    def load(self, fname):
+        """从文件fname装载索引(会根据文件中的k重建分段),返回值:(记录数量,'')或(None,err)"""
+        try:
+            with open(fname, 'rb') as fp:
+                if fp.read(4) != self.magic:
+                    return None, 'bad magic'
+                ver, k, hashbits, count = struct.unpack('<IIIQ', fp.read(20))
+                if ver != self.ver:
+                    return None, f'bad version <{ver}>'
+                hashes = array('Q')
+                hashes.frombytes(fp.read(count * 8))
+                ids = array('q')
+                ids.frombytes(fp.read(count * 8))
+            self.__init__(k, hashbits)
+            for hash, id in zip(hashes, ids):
+                self.insert(hash, id)
+            return count, ''
+        except Exception as e:
+            return None, str(e)
@@ -1,5 +1,9 @@
 # -*- coding: utf-8 -*-
 
+import os
+import json
+import time
+from collections import OrderedDict
 import util_base as ub
 
 
@@ -7,8 +11,8 @@ class lru_fifo_t:
     """先进先出保留固定数量的最近使用记录"""
 
     def __init__(self, fname=None, limit=1000):
-        self._ids = set()
-        self._dat = {'limit': limit, 'lst': []}
+        self._ids = OrderedDict()  # 按加入顺序记录的标识,淘汰最早的元素为O(1)
+        self._limit = limit
         self._fname = fname
         self.load()
         self.limit(limit)
@@ -20,24 +24,21 @@ class lru_fifo_t:
         dat = ub.dict_load(self._fname, 'utf-8')
         if dat is None:
             return False
-        self._dat = dat
-        for iid in self._dat['lst']:
-            self._ids.add(iid)
+        self._limit = dat['limit']
+        self._ids = OrderedDict.fromkeys(dat['lst'])
         return True
 
     def limit(self, newlimit=None):
         """获取或设置新的数量上限;新上限小于原上限的时候,则清理部分旧数据"""
-        oldlimit = self._dat['limit']
+        oldlimit = self._limit
         if newlimit is None:
             return oldlimit
 
-        self._dat['limit'] = newlimit
+        self._limit = newlimit
         if oldlimit > newlimit:
             rmcnt = len(self._ids) - newlimit
-            if rmcnt > 0:
-                for i in range(rmcnt):
-                    iid = self._dat['lst'].pop(0)
-                    self._ids.remove(iid)
+            for i in range(rmcnt):
+                self._ids.popitem(last=False)
         return newlimit
 
     def size(self):
@@ -52,16 +53,227 @@ class lru_fifo_t:
         if not add:
             return False
 
-        if len(self._ids) >= self._dat['limit']:
-            old = self._dat['lst'].pop(0)
-            self._ids.remove(old)
+        if len(self._ids) >= self._limit:
+            self._ids.popitem(last=False)
 
-        self._dat['lst'].append(iid)
-        self._ids.add(iid)
+        self._ids[iid] = None
         return False
 
     def save(self):
         """将内部状态存盘"""
         if self._fname is None:
             return False
-        return ub.dict_save(self._fname, self._dat, 'utf-8')
+        return ub.dict_save(self._fname, {'limit': self._limit, 'lst': list(self._ids)}, 'utf-8')
+
+
+class lru_ttl_t:
+    """保留固定数量最近使用记录的LRU(命中时移到最新位置),可为元素指定存活时间.
+        存盘使用追加式日志文件,每行一个json操作记录:
+            ["L",limit] 数量上限; ["A",iid,expire] 添加或命中(expire为0则不过期); ["D",iid] 删除
+        save时仅追加上次存盘后的变化,日志行数超过元素数量的compact倍时才整体重写.
+    """
+
+    def __init__(self, fname=None, limit=1000, ttl=0, compact=4):
+        self._ids = OrderedDict()  # {iid:expire},末尾为最近使用的元素
+        self._limit = limit
+        self.ttl = ttl  # 默认存活秒数,0为不过期
+        self.compact = compact
+        self._fname = fname
+        self._pending = OrderedDict()  # 待追加的操作 {iid:op}
+        self._limit_dirty = False  # 数量上限是否待存盘
+        self._lines = 0  # 日志文件的现有行数
+        self.load()
+        self.limit(limit)
+
+    def load(self):
+        """装载日志文件并回放,返回值:是否成功"""
+        if self._fname is None or not os.path.exists(self._fname):
+            return True
+        try:
+            ids = OrderedDict()
+            limit = self._limit
+            lines = 0
+            with open(self._fname, 'rb+') as fp:
+                good = 0  # 最后一个完整行的结束位置
+                newline = False  # 最后一行完整但缺少换行符
+                for line in fp:
+                    try:
+                        op = json.loads(line.decode('utf-8'))
+                        if op[0] == 'A':
+                            op = ('A', op[1], op[2])
+                        elif op[0] == 'D':
+                            op = ('D', op[1])
+                        elif op[0] == 'L':
+                            op = ('L', int(op[1]))
+                    except (ValueError, LookupError, TypeError):
+                        op = None
+                    if not line.endswith(b'\n'):  # 只有最后一行可能缺少换行符
+                        if op is None:
+                            break  # 末尾未写完的残行,截掉
+                        newline = True
+                    good += len(line)
+                    lines += 1
+                    if op is None:
+                        continue  # 中间损坏的行仅跳过,其后的记录照常回放
+                    if op[0] == 'A':
+                        ids[op[1]] = op[2]
+                        ids.move_to_end(op[1])
+                    elif op[0] == 'D':
+                        ids.pop(op[1], None)
+                    elif op[0] == 'L':
+                        limit = op[1]
+                # 截掉残缺的尾部,否则后续追加的记录会接在残行上而无法回放
+                fp.seek(good)
+                fp.truncate()
+                if newline:
+                    fp.write(b'\n')
+            self._ids = ids
+            self._limit = limit
+            self._lines = lines
+            self._trim()
+            self.purge()
+            self._pending.clear()  # 回放时的淘汰不需要再次存盘
+            return True
+        except Exception as e:
+            return False
+
+    def _trim(self, limit=None):
+        """淘汰超过数量上限limit(默认为当前上限)的最久未使用元素"""
+        if limit is None:
+            limit = self._limit
+        while len(self._ids) > limit:
+            iid, exp = self._ids.popitem(last=False)
+            self._log(iid, ('D',))
+
+    def limit(self, newlimit=None):
+        """获取或设置新的数量上限;新上限小于现有数量的时候,则清理最久未使用的数据"""
+        if newlimit is None:
+            return self._limit
+        if newlimit != self._limit:
+            self._limit_dirty = True
+        self._limit = newlimit
+        self._trim()
+        return newlimit
+
+    def size(self):
+        """获取现有元素数量(可能含有尚未清理的过期元素)"""
+        return len(self._ids)
+
+    def purge(self, now=None):
+        """清理全部过期元素,返回值:清理的数量"""
+        if now is None:
+            now = time.time()
+        dels = [iid for iid, exp in self._ids.items() if exp and exp <= now]
+        for iid in dels:
+            del self._ids[iid]
+            self._log(iid, ('D',))
+        return len(dels)
+
+    def hit(self, iid, add=False, ttl=None):
+        """判断给定的标识是否存在(命中时更新为最近使用);如果不存在,则进行追加;返回值:True已存在,False不存在"""
+        exp = self._ids.get(iid)
+        if exp is not None:
+            if exp and exp <= time.time():
+                del self._ids[iid]  # 已过期,视为不存在
+                self._log(iid, ('D',))
+            else:
+                self._ids.move_to_end(iid)
+                self._log(iid, ('A', exp))
+                return True
+
+        if not add:
+            return False
+
+        if ttl is None:
+            ttl = self.ttl
+        exp = time.time() + ttl if ttl else 0
+        self._trim(self._limit - 1)
+        self._ids[iid] = exp
+        self._log(iid, ('A', exp))
+        return False
+
+    def remove(self, iid):
+        """删除指定的标识,返回值:是否存在"""
+        if self._ids.pop(iid, None) is None:
+            return False
+        self._log(iid, ('D',))
+        return True
+
+    def _log(self, iid, op):
+        """记录待存盘的操作,同一元素只保留最后的操作"""
+        if self._fname is None:
+            return
+        self._pending[iid] = op
+        self._pending.move_to_end(iid)
+
+    def save(self):
+        """将变化追加到日志文件;日志过长时整体重写.返回值:是否成功"""
+        if self._fname is None:
+            return False
+        try:
+            if self._lines + len(self._pending) > max(len(self._ids), 1) * self.compact:
+                return self._rewrite()
+            if not self._pending and not self._limit_dirty:
+                return True
+            with open(self._fname, 'a', encoding='utf-8') as fp:
+                if self._limit_dirty:  # 回放结束时才按上限淘汰,上限记录的位置不影响结果
+                    fp.write(json.dumps(['L', self._limit]) + '\n')
+                    self._lines += 1
+                for iid, op in self._pending.items():
+                    fp.write(json.dumps([op[0], iid] + list(op[1:]), ensure_ascii=False) + '\n')
+            self._lines += len(self._pending)
+            self._pending.clear()
+            self._limit_dirty = False
+            return True
+        except Exception as e:
+            return False
+
+    def _rewrite(self):
+        """整体重写日志文件,只保留当前的有效元素"""
+        self.purge()
+        tmp = self._fname + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as fp:
+            fp.write(json.dumps(['L', self._limit]) + '\n')
+            for iid, exp in self._ids.items():
+                fp.write(json.dumps(['A', iid, exp], ensure_ascii=False) + '\n')
+        os.replace(tmp, self._fname)
+        self._lines = len(self._ids) + 1
+        self._pending.clear()
+        self._limit_dirty = False
+        return True
+
+
+if __name__ == '__main__':
+    import tempfile
+
+    fname = os.path.join(tempfile.mkdtemp(), 'lru_ttl.log')
+    lru = lru_ttl_t(fname, limit=100)
+    for i in range(10):
+        lru.hit('a%d' % i, True)
+    assert lru.save()
+
+    with open(fname, 'a', encoding='utf-8') as fp:
+        fp.write('["A","torn')  # 模拟写入中断的残行
+
+    lru = lru_ttl_t(fname, limit=100)
+    assert lru.size() == 10
+    for i in range(10, 20):
+        lru.hit('a%d' % i, True)
+    assert lru.save()
+
+    lru = lru_ttl_t(fname, limit=100)
+    assert lru.size() == 20
+    assert lru.hit('a19') and not lru.hit('torn')
+
+    with open(fname, 'a', encoding='utf-8') as fp:
+        fp.write('["A", "a20", 0]')  # 完整但缺少换行符的尾行
+    lru = lru_ttl_t(fname, limit=100)
+    lru.hit('a21', True)
+    assert lru.save()
+    lru = lru_ttl_t(fname, limit=100)
+    assert lru.size() == 22
+
+    with open(fname, 'a', encoding='utf-8') as fp:
+        fp.write('["A", "bad"\n["A", "a22", 0]\n')  # 中间损坏的行,其后的记录仍有效
+    lru = lru_ttl_t(fname, limit=100)
+    assert lru.size() == 23 and lru.hit('a22') and not lru.hit('bad')
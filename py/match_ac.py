@@ -4,6 +4,14 @@ from enum import Enum, unique
 from collections.abc import Iterable
 from match_util import rep_rec_t
 from copy import deepcopy
+from array import array
+from bisect import bisect_left
+import os
+import mmap
+import hashlib
+import pickle
+import struct
+import multiprocessing
 
 
 @unique
@@ -15,7 +23,7 @@ class mode_t(Enum):
         """后项最大匹配,记录最后出现的有效结果"""
 
         def rec(node):
-            if node == root:
+            if node is root:
                 return
             b, e, v = pos - node.words, pos, node.end
             while rst and b < rst[-1][1]:  # 新结果的起点小于已有结果的终点
@@ -29,7 +37,7 @@ class mode_t(Enum):
         """记录原文字符pos处匹配的节点node的全部可能值"""
         fails = node.get_fails()
         for fail in reversed(fails):
-            if fail != root:
+            if fail is not root:
                 rst.append((pos - fail.words, pos, fail.end))
 
     @staticmethod
@@ -37,7 +45,7 @@ class mode_t(Enum):
         """交叉保留,丢弃重叠包含的匹配"""
 
         def rec(node):
-            if node == root:
+            if node is root:
                 return
             b, e, v = pos - node.words, pos, node.end
             while rst and b <= rst[-1][0]:  # 新结果的起点小于已有结果的起点
@@ -51,7 +59,7 @@ class mode_t(Enum):
         """交叉合并"""
 
         def rec(node):
-            if node == root:
+            if node is root:
                 return
             last = None
             b, e, v = pos - node.words, pos, node.end
@@ -114,6 +122,7 @@ class ac_match_t:
 
     def __init__(self, fname=None):
         self.root = self.node_t()
+        self.arrays = None  # 编译后的数组结构ac_array_t,为None时使用节点树进行匹配
         if fname:
             self.dict_load(fname)
 
@@ -121,6 +130,18 @@ class ac_match_t:
         if self.root:
             self.root.childs.clear()
         self.root = self.node_t()
+        if self.arrays is not None:
+            self.arrays.close()
+        self.arrays = None
+
+    def _thaw(self):
+        """词表变更前,丢弃编译态结构,必要时由数组还原节点树"""
+        if self.arrays is None:
+            return
+        if self.root is None:
+            self.root = self.arrays.to_tree()
+        self.arrays.close()
+        self.arrays = None
 
     def dict_add(self, keyword, val=delimit, strip=True):
         """添加关键词条到词表
@@ -135,6 +156,7 @@ class ac_match_t:
         if not word:
             return None, None
 
+        self._thaw()
         pnode = self.root  # 从根进行节点树的遍历
         for i, char in enumerate(word):  # 遍历关键词的每个字符,构建子节点树
             if char not in pnode.childs:  # 如果当前层级的字符未出现在当前节点的下一级
@@ -159,6 +181,7 @@ class ac_match_t:
         """在添加词表结束后,构建完整的fail跳转路径.
             如果不进行fail路径的构建,则匹配行为就是简单的trie树(前项匹配)
         """
+        self._thaw()
         root = self.root
         queue = deque()  # 待处理节点队列,FIFO
         for char in root.childs:  # 将根节点的全部子节点放入待处理队列
@@ -195,6 +218,43 @@ class ac_match_t:
 
                 node.first = get_fail_end(node)  # 记录当前节点的首个端点fail指针
 
+    def dict_compile(self, drop_tree=True):
+        """在dict_end之后,将节点树冻结为紧凑的数组结构,后续匹配在数组上进行.
+            这是仅用于节省内存的模式:大词典的内存占用可降至节点树的十分之一以下,但匹配速度明显慢于节点树
+            (纯python下数组索引与二分查找的代价高于节点属性与字典查找,实测约慢1.3~2倍),不能用于降低匹配延迟;
+            对延迟敏感而内存充足的场景应保持使用节点树(未调用本方法时的默认方式).
+            drop_tree - 是否释放原节点树(之后再添加词条时会由数组自动还原)
+            返回值:节点数量
+        """
+        if self.arrays is None:
+            self.arrays = ac_array_t(self.root)
+        if drop_tree:
+            self.root = None
+        return len(self.arrays)
+
+    def snap_save(self, fname, srcs=None):
+        """将构建完成(dict_end之后)的自动机保存为快照文件fname,srcs为源词典文件列表(也可含有内存中的源数据),用于装载时的过期检查.
+            返回值:(True,'')或(False,err)
+        """
+        arrays = self.arrays if self.arrays is not None else ac_array_t(self.root)
+        return arrays.save(fname, srcs)
+
+    def snap_load(self, fname, srcs=None, use_mmap=True):
+        """从快照文件fname装载自动机,替代dict_load/dict_end的完整构建过程.
+            快照装载后为数组结构(同dict_compile的内存模式),缩短的是启动装载时间,匹配速度慢于节点树.
+            srcs - 源词典文件列表,给出时若快照已过期则装载失败
+            use_mmap - 是否使用内存映射,多进程可共享同一份物理内存页
+            返回值:(节点数量,'')或(None,err)
+        """
+        arrays = ac_array_t()
+        rc, err = arrays.load(fname, srcs, use_mmap)
+        if rc is None:
+            return rc, err
+        self.clear()
+        self.root = None
+        self.arrays = arrays
+        return rc, ''
+
     def dict_load(self, fname, isend=True, defval='', sep='@', encoding='utf-8'):
         """从文本文件fname装载词条.此函数可多次调用, 最后一次确保isend为真即可.
             文件单行为一个词条配置,用sep分隔的左边值将被替换为右边值.没有sep分隔时,替换值为defval
@@ -219,16 +279,25 @@ class ac_match_t:
         except Exception as e:
             return None, str(e)
 
-    def do_loop(self, cb, message, msg_len=None, offset=0):
+    def do_loop(self, cb, message, msg_len=None, offset=0, rec=True):
         """底层方法:对给定长度为msg_len的消息文本message从offset处进行循环匹配,将匹配结果回调反馈给cb(pos,node).
+            rec - 是否记录字符命中信息(仅需回调结果时可关闭)
             返回值:[(char,pos,node)],记录message中哪些字符被哪个节点命中过
         """
+        return self._do_loop(cb, message, msg_len, offset, rec)[0]
+
+    def _do_loop(self, cb, message, msg_len=None, offset=0, rec=True, node=None):
+        """底层方法:从状态节点node(None为根节点)开始进行循环匹配,返回值:(命中记录列表,最后的状态节点)"""
+        if self.arrays is not None:
+            return self.arrays._do_loop(cb, message, msg_len, offset, rec, node)
+
         rc = []  # 记录一共命中过哪些字符
         pos = offset
         if msg_len is None:
             msg_len = len(message)
 
-        node = self.root  # 从根节点开始匹配,node就是状态机的当前状态
+        if node is None:
+            node = self.root  # 从根节点开始匹配,node就是状态机的当前状态
         while pos < msg_len:
             char = message[pos]
             pos += 1
@@ -241,19 +310,73 @@ class ac_match_t:
                 continue
 
             node = node.childs[char]  # 状态转移到当前字符匹配的子节点
-            rc.append((char, pos - 1, node))  # 记录完整的匹配信息
+            if rec:
+                rc.append((char, pos - 1, node))  # 记录完整的匹配信息
             if node.first:
                 # 如果当前节点fail路径是存在的,则处理可能的匹配结果
                 cb(pos, node)
 
-        return rc
+        return rc, node
 
     def do_check(self, message, msg_len=None, offset=0, mode: mode_t = mode_t.is_all):
         """对给定的消息进行词条匹配测试,返回值:匹配结果[三元组(begin,end,val)]列表"""
         rst = []
-        self.do_loop(lambda pos, node: mode(rst, pos, node, self.root), message, msg_len, offset)
+        root = self.root if self.arrays is None else self.arrays.root
+        self.do_loop(lambda pos, node: mode(rst, pos, node, root), message, msg_len, offset, False)
         return rst
 
+    def do_check_many(self, messages, mode: mode_t = mode_t.is_all, flat=False):
+        """对多条消息进行批量词条匹配测试,复用回调与结果缓冲,省去逐条调用的开销.
+            messages - 待匹配的消息列表或可迭代对象
+            flat - 是否返回扁平结构(offsets,rsts),第i条消息的结果为rsts[offsets[i]:offsets[i+1]]
+            返回值:[[三元组(begin,end,val)]]列表,或扁平结构
+        """
+        root = self.root if self.arrays is None else self.arrays.root
+        loop = self.do_loop
+        buf = []
+
+        def cb(pos, node):
+            mode(buf, pos, node, root)
+
+        if not flat:
+            rsts = []
+            for msg in messages:
+                buf = []
+                loop(cb, msg, None, 0, False)
+                rsts.append(buf)
+            return rsts
+
+        offsets = array('i', [0])
+        rsts = []
+        for msg in messages:
+            loop(cb, msg, None, 0, False)
+            rsts.extend(buf)  # 匹配模式可能回溯丢弃本条消息的结果,需逐条暂存后再合并
+            buf.clear()
+            offsets.append(len(rsts))
+        return offsets, rsts
+
+    def do_check_stream(self, chunks, mode: mode_t = mode_t.max_match):
+        """对分块的文本流chunks(如read_chunks(fp))进行词条匹配,逐一产出结果三元组(begin,end,val),位置为全局偏移"""
+        st = ac_stream_t(self, mode)
+        for chunk in chunks:
+            yield from st.feed(chunk)
+        yield from st.flush()
+
+    def do_filter_stream(self, chunks, write, repl="*"):
+        """对分块的文本流chunks进行匹配替换,替换后的文本逐步交给write(txt)输出(如fp.write).返回值:输出的字符数"""
+        st = ac_stream_t(self, mode_t.max_match)
+        rc = 0
+        for chunk in chunks:
+            txt = st.feed_filter(chunk, repl)
+            if txt:
+                rc += len(txt)
+                write(txt)
+        txt = st.flush_filter(repl)
+        if txt:
+            rc += len(txt)
+            write(txt)
+        return rc
+
     def do_query(self, word, force=False, min_match=2, orderkey=True):
         """查询以指定词汇word为首部的相关词列表
             force - 是否强制记录word中最后匹配的首部词汇
@@ -261,6 +384,9 @@ class ac_match_t:
             orderkey - 是否进行匹配结果的排序
             返回值: ([(匹配串,对应值)],匹配深度)
         """
+        if self.arrays is not None:
+            return self.arrays.do_query(word, force, min_match, orderkey)
+
         rst = []
         wlen = len(word)
 
@@ -361,3 +487,500 @@ class ac_match_t:
                 do_rep(m[0], m[1], m[2])
 
         return ''.join(rst)
+
+
+class ac_array_t:
+    """将ac_match_t的节点树冻结为紧凑的数组结构(编译态),仅用于降低大词典的内存占用,匹配速度慢于节点树.
+        节点按广度优先顺序编号,根节点为0,同一父节点的子节点编号连续且按字符有序,
+        因此子节点区间为[cbeg[i],cbeg[i+1]),在区间内对chars进行二分查找即可完成状态转移.
+        子节点较多的热点节点(如根节点与浅层节点)另建字典转移表,以少量内存缩小与节点树的速度差距.
+    """
+
+    hot_min = 8  # 子节点数量不少于此值的节点建立字典转移表
+    views_max = 65536  # 节点视图缓存的数量上限
+
+    class node_v:
+        """编译态节点的只读视图,提供与node_t一致的属性访问,用于兼容mode_t等匹配回调.
+            匹配回调频繁访问的words/end/first在生成视图时取值,视图由ac_array_t缓存复用.
+        """
+        __slots__ = ('ac', 'idx', 'words', 'end', 'first')
+
+        def __init__(self, ac, idx):
+            self.ac = ac
+            self.idx = idx
+            self.words = ac.words[idx] if idx else None
+            vi = ac.ends[idx] if idx else -1  # 根节点不是端点
+            self.end = None if vi < 0 else ac.vals[vi]
+            fi = ac.first[idx] if idx else -1
+            self.first = self if fi == idx else ac.node(fi)
+
+        @property
+        def char(self):
+            return chr(self.ac.chars[self.idx]) if self.idx else None
+
+        @property
+        def fail(self):
+            return self.ac.node(self.ac.fail[self.idx])
+
+        @property
+        def parent(self):
+            return self.ac.node(self.ac.parent[self.idx])
+
+        @property
+        def childs(self):
+            ac = self.ac
+            return {chr(ac.chars[i]): ac.node(i) for i in range(ac.cbeg[self.idx], ac.cbeg[self.idx + 1])}
+
+        def pre_word(self):
+            """获取当前节点的前缀词"""
+            return self.ac.pre_word(self.idx)
+
+        def get_fails(self, order=0):
+            """获取当前节点的有效fail跳转路径(直接遍历数组,避免逐级生成视图)"""
+            ac = self.ac
+            ends, fail = ac.ends, ac.fail
+            fails = []
+            if ends[self.idx] >= 0:
+                fails.append(self)
+            idx = fail[self.idx]
+            while idx >= 0:
+                if ends[idx] >= 0:
+                    fails.insert(order, ac.node(idx))
+                idx = fail[idx]
+            return fails
+
+        def __eq__(self, other):
+            return isinstance(other, ac_array_t.node_v) and other.idx == self.idx and other.ac is self.ac
+
+        def __hash__(self):
+            return hash(self.idx)
+
+        def __repr__(self):
+            if self.idx == 0:
+                return f'root({len(self.childs)})'
+            else:
+                return f'"{self.pre_word()}"={self.end}/{list(self.childs.keys())}@<{self.fail}>'
+
+    def __init__(self, root=None):
+        self.chars = array('I')  # 节点对应字符的码点
+        self.parent = array('i')  # 父节点索引
+        self.cbeg = array('i')  # 子节点区间的起点,长度为节点数+1
+        self.words = array('i')  # 节点前缀词的长度
+        self.fail = array('i')  # fail指针索引,-1为空
+        self.first = array('i')  # 首个端点fail指针索引,-1为空
+        self.ends = array('i')  # 端点值在vals中的索引,-1为非端点
+        self.vals = []  # 端点值列表
+        self._views = {}  # 已生成的节点视图缓存,超过views_max时清空(视图按索引判等,根节点视图另行固定)
+        self._root_v = self.node_v(self, 0)  # 根节点视图保持唯一,调用方可用is判断
+        self._hots = None  # 热点节点的字典转移表 {节点索引:{字符:子节点索引}},首次匹配时生成
+        self._mm = None  # 快照文件的内存映射对象
+        if root is not None:
+            self.build(root)
+
+    def __len__(self):
+        return len(self.chars)
+
+    # 快照文件格式: 魔数(4)|版本(4)|头部长度(4)|头部(pickle)|对齐填充|数组区(按arr_names顺序的int32数组)
+    snap_magic = b'ACAR'
+    snap_ver = 1
+    arr_names = ('chars', 'cbeg', 'parent', 'words', 'fail', 'first', 'ends')
+
+    @staticmethod
+    def src_stats(srcs):
+        """获取源列表srcs的状态信息,用于快照的过期检查:
+            文件路径为(路径,尺寸,修改时间);其他内存中的源数据(如词条列表)为('',内容摘要)
+        """
+        rst = []
+        for fn in srcs or []:
+            if not isinstance(fn, str):
+                rst.append(('', hashlib.sha1(pickle.dumps(fn, 4)).hexdigest()))
+                continue
+            st = os.stat(fn)
+            rst.append((os.path.abspath(fn), st.st_size, st.st_mtime_ns))
+        return rst
+
+    def save(self, fname, srcs=None):
+        """将数组结构保存为快照文件fname,srcs为构建时使用的源词典文件列表.返回值:(True,'')或(False,err)"""
+        tmp = fname + '.tmp'
+        try:
+            head = pickle.dumps({'count': len(self.chars), 'srcs': self.src_stats(srcs), 'vals': self.vals})
+            with open(tmp, 'wb') as fp:
+                fp.write(self.snap_magic)
+                fp.write(struct.pack('<II', self.snap_ver, len(head)))
+                fp.write(head)
+                fp.write(b'\x00' * (-fp.tell() % 8))  # 数组区按8字节对齐
+                for name in self.arr_names:
+                    arr = getattr(self, name)
+                    fp.write(arr if isinstance(arr, memoryview) else arr.tobytes())
+            os.replace(tmp, fname)  # 整体替换,避免其他进程读到不完整的快照
+            return True, ''
+        except Exception as e:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return False, str(e)
+
+    def load(self, fname, srcs=None, use_mmap=True):
+        """从快照文件fname装载数组结构.
+            srcs - 源词典文件列表,给出时检查快照是否已过期(源文件有变化)
+            use_mmap - 是否使用内存映射,多进程可共享同一份物理内存页
+            返回值:(节点数量,'')或(None,err)
+        """
+        try:
+            with open(fname, 'rb') as fp:
+                if fp.read(4) != self.snap_magic:
+                    return None, 'bad magic'
+                ver, hlen = struct.unpack('<II', fp.read(8))
+                if ver != self.snap_ver:
+                    return None, f'bad version <{ver}>'
+                head = pickle.loads(fp.read(hlen))
+                if srcs is not None and head['srcs'] != self.src_stats(srcs):
+                    return None, 'stale'
+                offset = 12 + hlen
+                offset += -offset % 8
+                if use_mmap:
+                    mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+                    buf = memoryview(mm)
+                else:
+                    mm = None
+                    fp.seek(0)
+                    buf = memoryview(fp.read())
+
+            self.close()
+            count = head['count']
+            for name in self.arr_names:
+                size = (count + 1 if name == 'cbeg' else count) * 4
+                setattr(self, name, buf[offset:offset + size].cast('I' if name == 'chars' else 'i'))
+                offset += size
+            buf.release()  # 各数组视图仍持有映射区的引用
+            self.vals = head['vals']
+            self._mm = mm
+            return count, ''
+        except Exception as e:
+            return None, str(e)
+
+    def close(self):
+        """释放快照文件的内存映射"""
+        self._views.clear()
+        self._hots = None
+        if self._mm is None:
+            return
+        for name in self.arr_names:
+            arr = getattr(self, name)
+            if isinstance(arr, memoryview):
+                arr.release()
+            setattr(self, name, array('I' if name == 'chars' else 'i'))
+        self._mm.close()
+        self._mm = None
+
+    def build(self, root):
+        """由ac_match_t的根节点root构建数组结构"""
+        self.__init__()
+        nodes = [root]
+        idxs = {id(root): 0}
+        # 广度优先遍历,同时完成节点编号
+        i = 0
+        while i < len(nodes):
+            node = nodes[i]
+            self.cbeg.append(len(nodes))
+            for char in sorted(node.childs):
+                child = node.childs[char]
+                idxs[id(child)] = len(nodes)
+                nodes.append(child)
+            i += 1
+        self.cbeg.append(len(nodes))
+
+        vmap = {}  # 值对象去重 {id(val):idx}
+        for i, node in enumerate(nodes):
+            self.chars.append(ord(node.char) if i else 0)
+            self.parent.append(idxs[id(node.parent)] if node.parent is not None else -1)
+            self.words.append(node.words or 0)
+            self.fail.append(idxs[id(node.fail)] if node.fail is not None else -1)
+            self.first.append(idxs[id(node.first)] if node.first is not None else -1)
+            if node.end is None:
+                self.ends.append(-1)
+            else:
+                vi = vmap.get(id(node.end))
+                if vi is None:
+                    vi = vmap[id(node.end)] = len(self.vals)
+                    self.vals.append(node.end)
+                self.ends.append(vi)
+        return len(nodes)
+
+    def to_tree(self):
+        """将数组结构还原为node_t节点树,返回值:根节点"""
+        nodes = []
+        for i in range(len(self.chars)):
+            node = ac_match_t.node_t()
+            if i:
+                node.char = chr(self.chars[i])
+                node.words = self.words[i]
+                node.parent = nodes[self.parent[i]]
+                node.parent.childs[node.char] = node
+            vi = self.ends[i]
+            node.end = None if vi < 0 else self.vals[vi]
+            nodes.append(node)
+        for i, node in enumerate(nodes):
+            node.fail = nodes[self.fail[i]] if self.fail[i] >= 0 else None
+            node.first = nodes[self.first[i]] if self.first[i] >= 0 else None
+        return nodes[0]
+
+    def node(self, idx):
+        """获取节点索引idx对应的节点视图,idx<0时返回None"""
+        if idx < 0:
+            return None
+        if idx == 0:
+            return self._root_v
+        view = self._views.get(idx)
+        if view is None:
+            if len(self._views) >= self.views_max:
+                self._views.clear()
+            view = self._views[idx] = self.node_v(self, idx)
+        return view
+
+    def _hot_tables(self):
+        """生成热点节点(子节点数量不少于hot_min)的字典转移表"""
+        chars, cbeg = self.chars, self.cbeg
+        hots = {}
+        for idx in range(len(chars)):
+            lo, hi = cbeg[idx], cbeg[idx + 1]
+            if hi - lo >= self.hot_min:
+                hots[idx] = {chr(chars[i]): i for i in range(lo, hi)}
+        self._hots = hots
+        return hots
+
+    @property
+    def root(self):
+        return self.node(0)
+
+    def goto(self, idx, char):
+        """从节点idx沿字符char进行状态转移,返回值:子节点索引,-1为不存在"""
+        lo, hi = self.cbeg[idx], self.cbeg[idx + 1]
+        if lo == hi:
+            return -1
+        code = ord(char)
+        p = bisect_left(self.chars, code, lo, hi)
+        return p if p < hi and self.chars[p] == code else -1
+
+    def pre_word(self, idx):
+        """获取节点idx的前缀词"""
+        rst = []
+        while idx > 0:
+            rst.append(chr(self.chars[idx]))
+            idx = self.parent[idx]
+        return ''.join(reversed(rst))
+
+    def do_loop(self, cb, message, msg_len=None, offset=0, rec=True):
+        """对给定长度为msg_len的消息文本message从offset处进行循环匹配,将匹配结果回调反馈给cb(pos,node).
+            rec - 是否记录字符命中信息
+            返回值:[(char,pos,node)],记录message中哪些字符被哪个节点命中过
+        """
+        return self._do_loop(cb, message, msg_len, offset, rec)[0]
+
+    def _do_loop(self, cb, message, msg_len=None, offset=0, rec=True, node=None):
+        """从状态节点node(视图,None为根节点)开始进行循环匹配,返回值:(命中记录列表,最后的状态节点视图)"""
+        rc = []
+        pos = offset
+        if msg_len is None:
+            msg_len = len(message)
+
+        chars, cbeg, fail, first = self.chars, self.cbeg, self.fail, self.first
+        hots = self._hots if self._hots is not None else self._hot_tables()
+        node = 0 if node is None else node.idx
+        while pos < msg_len:
+            char = message[pos]
+            pos += 1
+            # 如果当前字符与当前状态节点不匹配,则跳转至状态节点的fail节点
+            while node >= 0:
+                hot = hots.get(node)
+                if hot is not None:
+                    p = hot.get(char, -1)
+                    if p >= 0:
+                        break
+                else:
+                    lo, hi = cbeg[node], cbeg[node + 1]
+                    if lo < hi:
+                        code = ord(char)
+                        p = bisect_left(chars, code, lo, hi)
+                        if p < hi and chars[p] == code:
+                            break
+                node = fail[node]
+
+            if node < 0:  # 当前字符不存在匹配,则状态节点重新指向根节点
+                node = 0
+                continue
+
+            node = p  # 状态转移到当前字符匹配的子节点
+            if rec:
+                rc.append((char, pos - 1, self.node(node)))
+            if first[node] >= 0:
+                cb(pos, self.node(node))
+
+        return rc, self.node(node)
+
+    def do_query(self, word, force=False, min_match=2, orderkey=True):
+        """查询以指定词汇word为首部的相关词列表,语义同ac_match_t.do_query"""
+        rst = []
+
+        def _rec(idx):
+            vi = self.ends[idx]
+            if vi >= 0 and self.vals[vi]:
+                rst.append((self.pre_word(idx), self.vals[vi]))
+            for c in range(self.cbeg[idx], self.cbeg[idx + 1]):  # 子节点天然有序
+                _rec(c)
+
+        node, pos = 0, 0
+        while pos < len(word):
+            nxt = self.goto(node, word[pos])
+            if nxt < 0:
+                if force and pos >= min_match:
+                    _rec(node)
+                return rst, pos
+            node = nxt
+            pos += 1
+
+        if pos >= min_match:
+            _rec(node)
+        return rst, pos
+
+
+class ac_stream_t:
+    """AC自动机的可恢复流式匹配状态,用于对文件/网络数据进行分块匹配.
+        记录当前状态节点与已处理的绝对位置,匹配结果使用全局偏移,跨越分块边界的词条也能被正确匹配.
+    """
+
+    def __init__(self, matcher: ac_match_t, mode: mode_t = mode_t.max_match):
+        self.matcher = matcher
+        self.mode = mode
+        self.reset()
+
+    def reset(self):
+        """复位流状态,准备处理新的数据流"""
+        self.node = None  # 当前状态节点,None为根节点
+        self.pos = 0  # 已喂入的字符总数(绝对位置)
+        self.rst = []  # 尚可能被后续匹配调整的结果
+        self.fin = []  # 已确定但尚未被过滤输出的结果
+        self.txt = ''  # 过滤模式下尚未输出的原文
+        self.cur = 0  # 过滤模式下原文的输出位置(绝对位置)
+
+    def _safe_pos(self):
+        """获取安全位置:后续匹配结果的起点不会小于此位置"""
+        words = self.node.words if self.node is not None else None
+        return self.pos - (words or 0)
+
+    def _take(self, safe):
+        """取出终点在安全位置之前的结果,这些结果不会再被匹配模式回溯调整"""
+        i = 0
+        while i < len(self.rst) and self.rst[i][1] < safe:
+            i += 1
+        out = self.rst[:i]
+        del self.rst[:i]
+        return out
+
+    def feed(self, chunk):
+        """喂入一块文本chunk,返回值:已确定的匹配结果[(begin,end,val)]列表(全局偏移)"""
+        if not chunk:
+            return []
+        m = self.matcher
+        root = m.root if m.arrays is None else m.arrays.root
+        base, rst, mode = self.pos, self.rst, self.mode
+
+        def cb(pos, node):
+            mode(rst, base + pos, node, root)
+
+        self.node = m._do_loop(cb, chunk, None, 0, False, self.node)[1]
+        self.pos += len(chunk)
+        return self._take(self._safe_pos())
+
+    def flush(self):
+        """数据流结束,返回值:剩余的全部匹配结果"""
+        out = self.rst
+        self.rst = []
+        self.node = None
+        return out
+
+    def feed_filter(self, chunk, repl='*'):
+        """喂入一块文本chunk并进行匹配替换,返回值:可以确定输出的替换后文本(可能滞后于输入)"""
+        self.txt += chunk
+        self.fin.extend(self.feed(chunk))
+        return self._emit(repl, False)
+
+    def flush_filter(self, repl='*'):
+        """数据流结束,返回值:剩余的替换后文本"""
+        self.fin.extend(self.flush())
+        return self._emit(repl, True)
+
+    def _emit(self, repl, final):
+        """输出已确定的替换结果与原文,替换规则与ac_match_t.do_filter一致"""
+        out = []
+        tpos = self.cur  # txt[0]对应的绝对位置
+        txt = self.txt
+        i = 0
+        for i, m in enumerate(self.fin):
+            b, e, v = m
+            dst_len = 0 if v == ac_match_t.delimit else len(v)
+            if not final and b + dst_len > self.pos:
+                break  # 替换判断所需的后续原文尚未到达
+            out.append(txt[self.cur - tpos:b - tpos])
+            if v == ac_match_t.delimit:
+                out.append(repl * (e - b))
+            elif dst_len > e - b and txt[b - tpos:b - tpos + dst_len] == v:
+                out.append(txt[b - tpos:e - tpos])  # 替换的目标与原有值相同,不重复替换
+            else:
+                out.append(v)
+            self.cur = e
+        else:
+            i = len(self.fin)
+        del self.fin[:i]
+
+        if final:
+            limit = self.pos
+        else:
+            limit = self._safe_pos()
+            if self.fin:
+                limit = min(limit, self.fin[0][0])
+            if self.rst:
+                limit = min(limit, self.rst[0][0])
+        if limit > self.cur:
+            out.append(txt[self.cur - tpos:limit - tpos])
+            self.cur = limit
+        self.txt = txt[self.cur - tpos:]
+        return ''.join(out)
+
+
+def read_chunks(fp, size=1 << 20):
+    """从文件对象fp(或socket.makefile)中逐块读取文本,用于流式匹配"""
+    while True:
+        chunk = fp.read(size)
+        if not chunk:
+            break
+        yield chunk
+
+
+_pool_matcher = None  # 进程池工作进程中使用的匹配器
+
+
+def _pool_init(snap_fname):
+    """进程池工作进程的初始化函数,从快照装载(映射)匹配器"""
+    global _pool_matcher
+    _pool_matcher = ac_match_t()
+    rc, err = _pool_matcher.snap_load(snap_fname)
+    if rc is None:
+        raise RuntimeError(f'snap_load fail <{snap_fname}>: {err}')
+
+
+def _pool_check(args):
+    messages, mode = args
+    return _pool_matcher.do_check_many(messages, mode)
+
+
+def do_check_pool(snap_fname, messages, mode: mode_t = mode_t.is_all, workers=4, chunk=1000):
+    """便捷函数:使用进程池对大批量消息进行匹配,各工作进程通过内存映射共享快照文件snap_fname中的自动机.
+        返回值:[[三元组(begin,end,val)]]列表,顺序与messages一致
+    """
+    messages = list(messages)
+    parts = [(messages[i:i + chunk], mode) for i in range(0, len(messages), chunk)]
+    rsts = []
+    with multiprocessing.Pool(workers, _pool_init, (snap_fname,)) as pool:
+        for rst in pool.imap(_pool_check, parts):
+            rsts.extend(rst)
+    return rsts
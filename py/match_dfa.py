@@ -1,6 +1,7 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
 from match_util import *
+from array import array
 
 
 # DFA前向最大匹配算法
@@ -180,6 +181,27 @@ class dfa_match_t():
         self.do_loop(cb, message, msg_len, offset, max_match, isall, skip_match)
         return rst
 
+    def do_check_many(self, messages, max_match=True, isall=True, skip_match=False, flat=False):
+        """对多条消息进行批量关键词匹配测试,复用回调与结果缓冲,省去逐条调用的开销.
+            flat - 是否返回扁平结构(offsets,rsts),第i条消息的结果为rsts[offsets[i]:offsets[i+1]]
+            返回值:[[三元组(begin,end,val)]]列表,或扁平结构
+        """
+        rsts = []
+        offsets = array('i', [0])
+        buf = rsts if flat else None
+
+        def cb(b, e, v):
+            buf.append((b, e, v))
+
+        for msg in messages:
+            if not flat:
+                buf = []
+                rsts.append(buf)
+            self.do_loop(cb, msg, None, 0, max_match, isall, skip_match)
+            if flat:
+                offsets.append(len(rsts))
+        return (offsets, rsts) if flat else rsts
+
     def do_loop(self, cb, message, msg_len=None, offset=0, max_match=True, isall=True, skip_match=False):
         """基础方法,对给定的消息进行关键词匹配循环
             cb - 结果回调函数
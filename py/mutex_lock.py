@@ -9,6 +9,8 @@ from threading import currentThread
 import time
 import traceback
 import copy
+import ctypes
+import inspect
 import os
 
 """
@@ -65,11 +67,20 @@ class lock_t:
     def inited(self):
         return self.locker is not None
 
+    # with块直接使用底层锁(C实现)的__enter__/__exit__:获取锁与进入受保护的块之间没有python代码,
+    # 强制停止线程(stop_thread)的异步异常不会落在两者之间,导致锁无法释放.
+    @property
     def __enter__(self):
-        self.lock()
+        return self.locker.__enter__ if self.locker is not None else _nop
 
-    def __exit__(self, exc_type, exc_value, traceback):
-        self.unlock()
+    @property
+    def __exit__(self):
+        return self.locker.__exit__ if self.locker is not None else _nop
+
+
+def _nop(*args):
+    """未开启同步锁时with块使用的空操作"""
+    pass
 
 
 class sem_t:
@@ -110,28 +121,28 @@ def guard_ext(locker, timeout=2):  # 顶层装饰函数,用来接收用户参数
         def wrap(*args, **kwargs):  # 包装函数对真实函数进行锁保护的调用
             tm_begin = time.time()  # 得到锁之前先记录开始时间和可能的拥有者
             own = locker.__dict__['ownfunc']
-            locker.lock()  # 得到锁
-            tm_wait = int(time.time() - tm_begin)  # 计算等待时间
-            cur = f'{fun.__module__}.{fun.__name__}'
-            if tm_wait > timeout and own:  # 如果等待时间超过限定值,则进行上一个拥有者的记录
-                waits = locker.__dict__['waitimes']
-                key = f'{cur}@{own}'  # 记录当前调用者与上一个拥有者,以及阻塞等待时间
-                if key not in waits:
-                    waits[key] = set()
-                owns = waits[key]
-                owns.add(tm_wait)
-                if len(owns) > 20:
-                    owns.remove(min(owns))
-
-            locker.__dict__['ownfunc'] = f'{fun.__module__}.{fun.__name__}'
-            try:
-                ret = fun(*args, **kwargs)
-            except Exception as e:
-                ret = e
-                print(f"{e.__class__.__name__}:{str(e)}\n{''.join(traceback.format_tb(e.__traceback__))}")
-                pass
-            locker.__dict__['ownfunc'] = ''
-            locker.unlock()  # 释放锁
+            with locker:  # 得到锁,块结束时(包括被强制停止时)释放锁
+                tm_wait = int(time.time() - tm_begin)  # 计算等待时间
+                cur = f'{fun.__module__}.{fun.__name__}'
+                if tm_wait > timeout and own:  # 如果等待时间超过限定值,则进行上一个拥有者的记录
+                    waits = locker.__dict__['waitimes']
+                    key = f'{cur}@{own}'  # 记录当前调用者与上一个拥有者,以及阻塞等待时间
+                    if key not in waits:
+                        waits[key] = set()
+                    owns = waits[key]
+                    owns.add(tm_wait)
+                    if len(owns) > 20:
+                        owns.remove(min(owns))
+
+                locker.__dict__['ownfunc'] = f'{fun.__module__}.{fun.__name__}'
+                try:
+                    ret = fun(*args, **kwargs)
+                except Exception as e:
+                    ret = e
+                    print(f"{e.__class__.__name__}:{str(e)}\n{''.join(traceback.format_tb(e.__traceback__))}")
+                    pass
+                finally:
+                    locker.__dict__['ownfunc'] = ''
 
             return ret
 
@@ -159,14 +170,13 @@ def guard_std(locker):  # 顶层装饰函数,用来接收用户参数,返回外
     def outside(fun):  # 外层装饰函数,用来接收真实的目标函数
         @wraps(fun)  # 使用内置包装器保留fun的原属性(下面的fun已经是闭包中的一个变量了)
         def wrap(*args, **kwargs):  # 包装函数对真实函数进行锁保护的调用
-            locker.lock()
-            try:
-                ret = fun(*args, **kwargs)
-            except Exception as e:
-                ret = e
-                print('%s:\n%s' % (e.__class__.__name__, ''.join(traceback.format_tb(e.__traceback__))))
-                pass
-            locker.unlock()
+            with locker:  # 块结束时(包括被强制停止时)释放锁
+                try:
+                    ret = fun(*args, **kwargs)
+                except Exception as e:
+                    ret = e
+                    print('%s:\n%s' % (e.__class__.__name__, ''.join(traceback.format_tb(e.__traceback__))))
+                    pass
             return ret
 
         return wrap
@@ -219,7 +229,7 @@ def stop_thread(thd, exc=InterruptedError):
         tid = ctypes.c_long(tid)
         if not inspect.isclass(exctype):
             exctype = type(exctype)
-            res = ctypes.pythonapi.PyThreadState_SetAsyncExc(tid, ctypes.py_object(exctype))
+        res = ctypes.pythonapi.PyThreadState_SetAsyncExc(tid, ctypes.py_object(exctype))
         if res == 0:
             raise ValueError("invalid thread id")
         elif res != 1:
@@ -231,6 +241,11 @@ def stop_thread(thd, exc=InterruptedError):
     _async_raise(thd.ident, exc)
 
 
+def stop_thread_undo(thd):
+    """撤销已发出但尚未送达目标线程的强制停止(可由目标线程自身调用)"""
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_long(thd.ident), None)
+
+
 def wait_threads(thds, timeout=None, idle_cb=None):
     """逐一判断,等待线程列表中的线程结束.返回值:(已结束线程[],是否要求停止)"""
     rst = []
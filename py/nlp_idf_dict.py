@@ -200,6 +200,16 @@ class TDF_IDF_Maker(TDF_IDF_Core):
             self.tdf_dict[k] += 1
         self.D += 1
 
+    def remove(self, doc_tf):
+        # 移除文档后,更新整体词文档词频
+        for k, v in doc_tf.items():
+            if k not in self.tdf_dict:
+                continue
+            self.tdf_dict[k] -= 1
+            if self.tdf_dict[k] <= 0:
+                del self.tdf_dict[k]
+        self.D -= 1
+
     def update(self, avg_docs_len=None):
         'append之后,更新计算整体文档的IDF'
         if avg_docs_len is not None:
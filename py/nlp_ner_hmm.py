@@ -40,27 +40,35 @@ class ner_hmm_bio_t:
 
     def predict_text(self, txt, sep_status=tags.O.value):
         """对给定的txt文本进行ner预测.返回值:[(begin,end,[status])]"""
-        rst = []
-        lines = self.on_split_lines(txt)  # 分行
-        self.txt = txt
-        offset = 0
-
-        for line in lines:  # 逐行进行预测处理
-            linelen = len(line)
-            if linelen <= 2:
+        return self.predict_texts([txt], sep_status)[0]
+
+    def predict_texts(self, txts, sep_status=tags.O.value, batch=256):
+        """对多个文本txts进行批量ner预测,全部文本的有效行合并后分批进行维特比解码.返回值:[[(begin,end,[status])]]"""
+        rsts = [[] for _ in txts]
+        obs_list = []
+        locs = []  # 观测序列对应的(文本索引,行偏移)
+        for ti, txt in enumerate(txts):
+            offset = 0
+            for line in self.on_split_lines(txt):  # 分行
+                linelen = len(line)
+                if linelen > 2:  # 跳过短行
+                    obs_list.append(self.on_conv_seqs(line))  # 将字符转换为观测序列
+                    locs.append((ti, offset))
                 offset += linelen + 1
-                continue  # 跳过短行
 
-            # 将字符转换为观测序列
-            obs = self.on_conv_seqs(line)
-            # 预测得到状态序列
-            self.predict_seqs(obs, rst, offset, sep_status)
-            offset += linelen + 1
-        return rst
+        preds = self.hmm.predict_batch(obs_list, sep_status, batch)
+        for (ti, offset), (stlst, rglst) in zip(locs, preds):
+            self.txt = txts[ti]
+            self._take_rsts(stlst, rglst, rsts[ti], offset)
+        return rsts
 
     def predict_seqs(self, obs, rsts, offset=0, sep_status=tags.O.value):
         """预测指定的观察序列obs,得到状态序列并放入rsts,offset告知观察序列在整体样本中的偏移位置.返回值:有效结果序列的数量"""
         stlst, rglst = self.hmm.predict(obs, sep_status)
+        return self._take_rsts(stlst, rglst, rsts, offset)
+
+    def _take_rsts(self, stlst, rglst, rsts, offset):
+        """根据状态序列stlst与有效区间rglst构造结果记录并放入rsts.返回值:有效结果序列的数量"""
         rc = 0
         for rg in rglst:
             # 构造结果记录
@@ -105,6 +105,10 @@ class nt_parser_t:
         if isend:
             self.matcher.dict_end()
 
+    def dict_compile(self, drop_tree=True):
+        """在词典装载完成后,将匹配树冻结为紧凑的数组结构,仅用于降低大词典的内存占用,匹配速度慢于匹配树.返回值:节点数量"""
+        return self.matcher.dict_compile(drop_tree)
+
     def _chk_dict_words(self, fname, row, txt, word, tag):
         """默认的检查词典冲突的输出回调事件处理器"""
         fn = fname if isinstance(fname, str) else f'dict@{fname[0]}'
@@ -413,6 +417,40 @@ class nt_parser_t:
             self.matcher.dict_end()
         return ''.join(bad)
 
+    @staticmethod
+    def _snap_mods():
+        """快照内容同样依赖的模块文件:内置词表(nt_tails/数字组合)与区划数据的来源,以及自动机快照格式所在的match_ac"""
+        rst = [os.path.abspath(m.__file__) for m in (nnd, nnp, uni, cai, mac)]
+        rst.append(os.path.join(os.path.dirname(os.path.abspath(cai.__file__)), 'china_area_data.py'))
+        rst.append(os.path.abspath(__file__))
+        return rst
+
+    def loads_snap(self, dicts_list, snap_fname, path=None, dbginfo=False, encode='utf-16', use_mmap=True):
+        """优先从快照文件snap_fname装载词典;快照不存在或已过期(词典文件,列表形式的词典内容或内置词表模块有变化)时,调用loads完整构建并重新保存快照.
+            设置了listen_cb_wordadd时,词汇取舍无法由快照反映,不使用快照而直接完整构建.
+            快照缩短的是启动装载时间;装载后的匹配器为数组结构(同dict_compile),匹配速度慢于匹配树.
+            返回值:空串正常,否则为错误信息.
+        """
+        if self.listen_cb_wordadd:
+            return self.loads(dicts_list, path, True, dbginfo, encode)
+
+        srcs = [d[1] if path is None else os.path.join(path, d[1]) for d in dicts_list if isinstance(d[1], str)]
+        srcs.extend(self._snap_mods())
+        srcs.append([(d[0], None if isinstance(d[1], str) else d[1]) for d in dicts_list])  # 词典类型与列表形式的词典内容
+        rc, err = self.matcher.snap_load(snap_fname, srcs, use_mmap)
+        if rc is not None:
+            if dbginfo:
+                print(f'loaded dicts snapshot: <{snap_fname}> nodes={rc}')
+            return ''
+        if dbginfo:
+            print(f'rebuild dicts snapshot: <{snap_fname}> {err}')
+
+        bad = self.loads(dicts_list, path, True, dbginfo, encode)
+        if bad:
+            return bad
+        ok, err = self.matcher.snap_save(snap_fname, srcs)
+        return '' if ok else f'ERR<{err}>:<SNAP>@<{snap_fname}>'
+
     @staticmethod
     def _merge_bracket(segs, txt):
         """合并segs段落列表中被左右括号包裹的部分,返回值:结果列表"""
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
 from nlp_idf_dict import *
+from array import array
+from bisect import bisect_left
 import os
 
 
@@ -124,6 +126,183 @@ class BM25_Query(BM25_Core):
         return scores
 
 
+class BM25_Index(BM25_Core):
+    """基于倒排索引的BM25检索器,与BM25_Query的append/update/query用法一致,并支持remove.
+        倒排表为 词->(文档槽位数组,词频数组),查询时仅对含有查询词的文档进行评分,
+        并根据各词的评分上界进行MaxScore剪枝,跳过不可能进入结果的文档.
+    """
+
+    def __init__(self, idf_dict):
+        BM25_Core.__init__(self, idf_dict)
+        self.postings = {}  # 倒排表 {word:(array(槽位),array(词频))}
+        self.term_bounds = {}  # 各词的评分上界依据 {word:[最大词频,最小文档长度]}
+        self.dlens = array('i')  # 各文档槽位的文档长度
+        self.docids = []  # 各文档槽位对应的docid,已删除的为None
+        self.doc_terms = []  # 各文档槽位含有的词,用于删除
+        self.slots = {}  # {docid:槽位}
+        self.total_len = 0  # 有效文档的总词数
+        self._norms = array('d')  # 各文档槽位的长度归一化系数(1-B+B*dlen/avg_docs_len)
+        self._norm_key = None
+
+    def __len__(self):
+        return len(self.slots)
+
+    def append(self, doc, docid, upd_ti=True):
+        '追加文档,并计算词频(可以在多次调用本方法后,最后调用update)'
+        doc_tf = {}
+        calc_tf(doc, doc_tf)
+        if docid in self.slots:
+            self.remove(docid, upd_ti)
+
+        slot = len(self.dlens)
+        dlen = len(doc)
+        for word, tf in doc_tf.items():
+            post = self.postings.get(word)
+            if post is None:
+                post = self.postings[word] = (array('i'), array('i'))
+                self.term_bounds[word] = [tf, dlen]
+            else:
+                bound = self.term_bounds[word]
+                if tf > bound[0]:
+                    bound[0] = tf
+                if dlen < bound[1]:
+                    bound[1] = dlen
+            post[0].append(slot)
+            post[1].append(tf)
+
+        self.dlens.append(dlen)
+        self.docids.append(docid)
+        self.doc_terms.append(tuple(doc_tf))
+        self.slots[docid] = slot
+        self.total_len += dlen
+
+        if upd_ti:
+            self.idf_dict.append(doc_tf)
+
+    def remove(self, docid, upd_ti=True):
+        '删除指定docid的文档,返回值:是否删除成功'
+        slot = self.slots.pop(docid, None)
+        if slot is None:
+            return False
+
+        doc_tf = {}
+        for word in self.doc_terms[slot]:
+            slots, tfs = self.postings[word]
+            i = bisect_left(slots, slot)
+            doc_tf[word] = tfs[i]
+            del slots[i]
+            del tfs[i]
+            if not slots:
+                del self.postings[word]
+                del self.term_bounds[word]
+
+        self.total_len -= self.dlens[slot]
+        self.docids[slot] = None
+        self.doc_terms[slot] = None
+        if upd_ti and hasattr(self.idf_dict, 'remove'):
+            self.idf_dict.remove(doc_tf)
+        return True
+
+    def update(self):
+        # 每个文档内容的平均词数
+        avg_docs_len = self.total_len / len(self.slots)
+        self.idf_dict.update(avg_docs_len)
+
+    def _check_norms(self):
+        """根据当前的B系数与平均文档长度,更新各文档的长度归一化系数"""
+        avg = self.idf_dict.avg_docs_len
+        key = (self.B, avg)
+        if key != self._norm_key:
+            self._norm_key = key
+            self._norms = array('d')
+        for dlen in self.dlens[len(self._norms):]:
+            self._norms.append(1 - self.B + self.B * dlen / avg)
+
+    def _bound(self, word, idf):
+        """计算词word在任意文档中的单次评分上界"""
+        if idf <= 0:
+            return 0
+        tf, dlen = self.term_bounds[word]
+        return idf * tf * (self.K1 + 1) / (tf + self.K1 * (1 - self.B + self.B * dlen / self.idf_dict.avg_docs_len))
+
+    def _score(self, slot, terms):
+        """按查询词顺序计算文档槽位slot的评分,计算过程与BM25_Core.sim一致"""
+        score = 0
+        norm = self._norms[slot]
+        for idf, post in terms:
+            dfw = 0
+            if post is not None:
+                i = bisect_left(post[0], slot)
+                if i < len(post[0]) and post[0][i] == slot:
+                    dfw = post[1][i]
+            if not dfw:
+                if self.missing_f:
+                    dfw = self.missing_f
+                else:
+                    continue
+
+            A = idf * dfw * (self.K1 + 1)
+            score += (A / (dfw + self.K1 * norm))
+        return score
+
+    def query(self, doc, top_limit=15, score_limit=0.1):
+        '在倒排索引中检索与给定文档相似的文档,结果与BM25_Query.query一致'
+        self_score = self.sim_self(doc)
+        self._check_norms()
+
+        idfs = {word: self.idf_dict.get_idf(word) for word in set(doc)}
+        terms = [(idfs[word], self.postings.get(word)) for word in doc]  # 保持查询词顺序,确保评分计算一致
+
+        if self.missing_f:
+            cands = [slot for slot in self.slots.values()]  # 缺失词也参与评分,需要逐一计算全部文档
+            cands.sort()
+            bounds = None
+        else:
+            # 各查询词的评分上界(重复出现的词累计计算)
+            qtf = {}
+            calc_tf(doc, qtf)
+            ubs = sorted((qtf[w] * self._bound(w, idfs[w]), w) for w in qtf if w in self.postings)
+            # 评分上界累计不足阈值的词为非必要词,仅含有这些词的文档不可能进入结果
+            limit = (score_limit - 0.00005) * self_score if self_score > 0 else None  # 预留归一化评分的舍入误差
+            rest = 0
+            i = 0
+            if limit is not None:
+                while i < len(ubs) and rest + ubs[i][0] < limit:
+                    rest += ubs[i][0]
+                    i += 1
+
+            bounds = {}  # 候选文档的评分上界
+            for ub, word in ubs[i:]:
+                for slot in self.postings[word][0]:
+                    bounds[slot] = bounds.get(slot, rest) + ub
+            cands = sorted(bounds)
+            if self_score <= 0:
+                bounds = None  # 评分可能为负,无法进行剪枝
+
+        scores = []
+        for slot in cands:
+            if bounds is not None and len(scores) >= top_limit:
+                # 结果已满时,评分上界达不到当前最低归一化评分的文档直接跳过
+                if bounds[slot] < max(score_limit, scores[-1][0] - 0.00005) * self_score:
+                    continue
+
+            score = self._score(slot, terms)
+            if score == 0:
+                continue
+
+            # 对相关度评分进行归一化
+            if math.fabs(score) <= math.fabs(self_score):
+                score = round(score / self_score, 4)
+            else:
+                score = round(self_score / score, 4)
+
+            if score < score_limit:
+                continue
+            # 使用最终的评分进行TOP结果记录
+            rec_top_result(scores, score, self.docids[slot], top_limit)
+        return scores
+
+
 class bm25_calc():
     """演示bm25相似度计算的集成用法"""
 
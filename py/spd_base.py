@@ -13,8 +13,10 @@ import time
 import base64
 import requests
 import socket
+import threading
 import brotli
 import urllib.parse as up
+from concurrent.futures import ThreadPoolExecutor
 from util_xml import *
 from hash_calc import *
 from util_base import *
@@ -292,6 +294,128 @@ def default_headers(url, Head, body=None):
             Head['Content-Type'] = 'application/x-www-form-urlencoded'
 
 
+# -----------------------------------------------------------------------------
+CHS_SNIFF_SIZE = 1024 * 8  # 从回应内容中查找字符集声明的前部尺寸
+STREAM_CHUNK_SIZE = 1024 * 64  # 流式落盘的分块尺寸
+
+
+def decode_body(cnt, chs, heads=None):
+    """将回应内容cnt按字符集chs解码,失败时尝试utf-8,都失败则返回原内容"""
+    ret = cnt
+    try:
+        ret = cnt.decode(chs, errors='ignore')
+        return ret
+    except Exception as e:
+        print('STR DECODE WARN :: %s :: %s :: %s' % (heads, es(e), cnt))
+
+    try:
+        chs2 = 'utf-8'
+        ret = cnt.decode(chs2, errors='ignore')
+        return ret
+    except Exception as e:
+        print('STR DECODE ERR :: %s :: %s :: %s :: %s' % (chs, chs2, es(e), cnt))
+
+    return cnt
+
+
+class http_rst_t(dict):
+    """http_req的结果字典,rst['BODY']在首次访问时才进行字符集解码;只需要回应头或状态的调用者不必承担解码开销.
+        未解码前BODY中暂存原始字节内容.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lazy = None  # 待解码的(原始内容,字符集,回应头)
+
+    def set_lazy(self, cnt, chs, heads=None):
+        """设置待延迟解码的BODY内容"""
+        dict.__setitem__(self, 'BODY', cnt)
+        self._lazy = (cnt, chs, heads)
+
+    def _decode(self):
+        lazy = self._lazy
+        if lazy is not None:
+            self._lazy = None
+            dict.__setitem__(self, 'BODY', decode_body(*lazy))
+
+    def __getitem__(self, key):
+        if key == 'BODY':
+            self._decode()
+        return dict.__getitem__(self, key)
+
+    def __setitem__(self, key, val):
+        if key == 'BODY':
+            self._lazy = None
+        dict.__setitem__(self, key, val)
+
+    def get(self, key, default=None):
+        if key == 'BODY':
+            self._decode()
+        return dict.get(self, key, default)
+
+    def pop(self, key, *default):
+        if key == 'BODY':
+            self._decode()
+            self._lazy = None
+        return dict.pop(self, key, *default)
+
+    def items(self):
+        self._decode()
+        return dict.items(self)
+
+    def values(self):
+        self._decode()
+        return dict.values(self)
+
+    def clear(self):
+        self._lazy = None
+        dict.clear(self)
+
+
+def _save_stream(rsp, fname, rst):
+    """将回应内容分块写入文件fname,不在内存中保留完整内容.返回值:是否成功"""
+    size = 0
+    try:
+        with open(fname, 'wb') as fp:
+            for chunk in rsp.iter_content(STREAM_CHUNK_SIZE):  # 传输压缩(含br)由底层自动解压
+                fp.write(chunk)
+                size += len(chunk)
+    except Exception as e:
+        rst['error'] = es(e)
+        return False
+    finally:
+        rsp.close()
+    rst['FILE'] = fname
+    rst['SIZE'] = size
+    rst['BODY'] = b''
+    return True
+
+
+# -----------------------------------------------------------------------------
+_shared_adapter = None  # 进程内共享的http连接池适配器
+_shared_locker = threading.Lock()
+
+
+def shared_adapter(pool_connections=64, pool_maxsize=16):
+    """获取进程内共享的连接池适配器(按主机保持长连接池),首次调用时创建"""
+    global _shared_adapter
+    if _shared_adapter is None:
+        with _shared_locker:
+            if _shared_adapter is None:
+                _shared_adapter = requests.adapters.HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    return _shared_adapter
+
+
+def pooled_session(adapter=None):
+    """生成挂载了共享连接池的会话对象:cookie等会话状态独立,底层的长连接在全部会话间复用"""
+    session = requests.sessions.Session()
+    if adapter is None:
+        adapter = shared_adapter()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 # -----------------------------------------------------------------------------
 def http_req(url, rst, req=None, timeout=15, allow_redirects=True, session=None, cookieMgr=None):
     '''根据给定的req内容进行http请求,得到rst回应.返回值告知是否有错误出现.
@@ -301,13 +425,15 @@ def http_req(url, rst, req=None, timeout=15, allow_redirects=True, session=None,
         req['BODY']={}          可告知http请求的body信息,注意需要同时给出正确的Content-Type
         req['COOKIE']={}        可告知http请求的cookie信息,并进入cookie管理器进行多连接复用.(HEAD中的cookie仅单次请求有效)
         req['SSL_VERIFY']=False 可明确关闭SSL的证书校验
+        req['SAVE_TO']=None     可告知流式落盘的文件名,回应内容分块直接写入文件,不在内存中保留(用于大文件或附件)
 
         rst['error']            记录过程中出现的错误
         rst['status_code']      告知回应状态码
         rst['status_reason']    告知回应状态简述
         rst['HEAD']             告知回应头
         rst['COOKIE']           记录回应的cookie内容
-        rst['BODY']             记录回应内容,解压缩转码后的内容
+        rst['BODY']             记录回应内容,解压缩转码后的内容;rst为http_rst_t时,在首次访问时才进行转码
+        rst['FILE']/rst['SIZE'] 流式落盘时记录落盘的文件名与内容尺寸,此时BODY为空
     '''
     # 准备请求参数
     if req is None:
@@ -317,6 +443,7 @@ def http_req(url, rst, req=None, timeout=15, allow_redirects=True, session=None,
     proxy = req.get('PROXY')
     HEAD = req.get('HEAD', {})
     BODY = req.get('BODY')
+    SAVE_TO = req.get('SAVE_TO')
 
     if proxy is not None:
         proxy = {'http': proxy, 'https': proxy}
@@ -337,13 +464,13 @@ def http_req(url, rst, req=None, timeout=15, allow_redirects=True, session=None,
     # 执行请求
     try:
         if session is None:
-            session = requests.sessions.Session()
+            session = pooled_session()
         # 尝试给出默认头域
         default_headers(url, HEAD, BODY)
 
         # 发起请求
         rsp = session.request(method, url, proxies=proxy, headers=HEAD, data=BODY, cookies=CKM,
-                              timeout=timeout, allow_redirects=allow_redirects, verify=SSL_VERIFY)
+                              timeout=timeout, allow_redirects=allow_redirects, verify=SSL_VERIFY, stream=SAVE_TO is not None)
     except Exception as e:
         rst['error'] = es(e)
         rst['status_code'] = 999
@@ -372,6 +499,9 @@ def http_req(url, rst, req=None, timeout=15, allow_redirects=True, session=None,
     for k in session.cookies:
         r[k.name] = k.value
 
+    if SAVE_TO is not None:
+        return _save_stream(rsp, SAVE_TO, rst)  # 流式落盘,不进行转码
+
     # 判断是否需要进行额外的br解压缩处理
     rsp_cnt = ''
     if is_br_content(rsp.headers):
@@ -387,34 +517,19 @@ def http_req(url, rst, req=None, timeout=15, allow_redirects=True, session=None,
     if 'Content-disposition' in rsp.headers:
         chs = ''  # 回应是附件文件,不要进行解码处理
     else:
-        chs = find_chs_by_cnt(rsp_cnt)
+        chs = find_chs_by_cnt(rsp_cnt[:CHS_SNIFF_SIZE])  # 字符集声明位于内容前部,不必查找全部内容
         if chs == '' and is_text_content(rsp.headers):
             chs = find_chs_by_head(rsp.headers)
             if chs == '':
                 chs = 'utf-8'
 
-    def dc(cnt, chs):
-        ret = cnt
-        try:
-            ret = cnt.decode(chs, errors='ignore')
-            return ret
-        except Exception as e:
-            print('STR DECODE WARN :: %s :: %s :: %s' % (rsp.headers, es(e), rsp_cnt))
-
-        try:
-            chs2 = 'utf-8'
-            ret = cnt.decode(chs2, errors='ignore')
-            return ret
-        except Exception as e:
-            print('STR DECODE ERR :: %s :: %s :: %s :: %s' % (chs, chs2, es(e), rsp_cnt))
-
-        return cnt
-
     # 记录最终的结果
-    if chs != '':
-        rst['BODY'] = dc(rsp_cnt, chs)
-    else:
+    if chs == '':
         rst['BODY'] = rsp_cnt
+    elif isinstance(rst, http_rst_t):
+        rst.set_lazy(rsp_cnt, chs, rsp.headers)  # 延迟到访问时再转码
+    else:
+        rst['BODY'] = decode_body(rsp_cnt, chs, rsp.headers)
 
     return True
 
@@ -434,6 +549,56 @@ def http_get(url, req=None, timeout=15, allow_redirects=True, session=None, cook
     return rst.get('BODY', None), rst['status_code'], rst['error']
 
 
+class http_fetcher_t:
+    """连接池化的并发抓取器:按主机限定并发数量,在线程池中执行http_req,结果rst字典与http_req一致.
+        session为None时每个请求使用独立的会话(cookie独立),底层长连接通过共享连接池复用;
+        给出session时全部请求共用此会话(cookie共享).
+    """
+
+    def __init__(self, workers=8, per_host=2, timeout=15, allow_redirects=True, session=None, cookieMgr=None):
+        self.per_host = per_host  # 每个主机的最大并发请求数
+        self.timeout = timeout
+        self.allow_redirects = allow_redirects
+        self.session = session
+        self.cookieMgr = cookieMgr
+        self.hosts = {}  # 各主机的并发信号量 {host:Semaphore}
+        self.locker = threading.Lock()
+        self.pool = ThreadPoolExecutor(workers)
+
+    def _host_sem(self, url):
+        host = up.urlparse(url)[1]
+        with self.locker:
+            sem = self.hosts.get(host)
+            if sem is None:
+                sem = self.hosts[host] = threading.Semaphore(self.per_host)
+        return sem
+
+    def fetch(self, url, req=None):
+        """在当前线程中抓取url(受主机并发数量限定).返回值:rst字典,rst['error']告知错误"""
+        rst = http_rst_t()
+        if req is not None:  # http_req会向HEAD中补充默认头域,复制后使用,避免并发请求间互相影响
+            req = dict(req)
+            req['HEAD'] = dict(req.get('HEAD', {}))
+        with self._host_sem(url):
+            http_req(url, rst, req, self.timeout, self.allow_redirects, self.session, self.cookieMgr)
+        return rst
+
+    def submit(self, url, req=None):
+        """提交异步抓取任务,返回值:Future对象,其结果为rst字典;可用asyncio.wrap_future在协程中等待"""
+        return self.pool.submit(self.fetch, url, req)
+
+    def fetch_many(self, urls, reqs=None):
+        """并发抓取多个url,reqs为对应的请求参数列表或统一的请求参数字典.返回值:与urls顺序一致的[rst]"""
+        urls = list(urls)
+        if reqs is None or isinstance(reqs, dict):
+            reqs = [reqs] * len(urls)
+        futs = [self.submit(url, req) for url, req in zip(urls, reqs)]
+        return [f.result() for f in futs]
+
+    def close(self):
+        self.pool.shutdown(wait=True)
+
+
 def make_head(req_dict, head_str):
     ''' 将如下的http头域字符串转换为key/value字典,并放入请求头域
     User-Agent: Mozilla/5.0 (Windows NT 6.1; Win64; x64; rv:77.0) Gecko/20100101 Firefox/77.0
@@ -524,9 +689,9 @@ class spd_base:
         # 默认允许自动进行302跳转
         self.allow_redirects = True
         # 生成长连接会话对象
-        self.sessionMgr = requests.sessions.Session() if sessionMgr is None else sessionMgr
+        self.sessionMgr = pooled_session() if sessionMgr is None else sessionMgr
         # 定义结果对象
-        self.rst = {}
+        self.rst = http_rst_t()
         # 最后请求的url
         self.last_url = None
 
@@ -540,7 +705,7 @@ class spd_base:
                 req['PROXY'] = prx
 
         self.last_url = url
-        self.rst = {}
+        self.rst = http_rst_t()
         return http_req(url, self.rst, req, self.timeout, self.allow_redirects, self.sessionMgr, self.cookieMgr)
 
     def take2(self, url, req=None, proxy_files='./proxy_host.json'):
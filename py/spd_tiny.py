@@ -1,8 +1,14 @@
 # -*- coding: utf-8 -*-
 
 import argparse
+import atexit
+import hashlib
+import heapq
 import importlib
+import queue
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import gui_dlg as _gd
 from db_sqlite import *
@@ -57,6 +63,8 @@ _VER = '20240415/v1.0/4'
     keyword	        TEXT        信息关键词,可选
     ext	            TEXT        扩展信息,可选
     memo	        TEXT        信息备注说明,可选
+    url_fp	        integer     url的64位指纹,索引,用于排重检查
+    title_fp	    integer     title的64位指纹,索引,用于排重检查
 """
 
 sql_tbl = ['''
@@ -91,7 +99,9 @@ sql_tbl = ['''
              "addr" TEXT,
              "keyword" TEXT,
              "ext" TEXT,
-             "memo" TEXT
+             "memo" TEXT,
+             "url_fp" integer,
+             "title_fp" integer
            );
            ''',
            '''
@@ -117,8 +127,22 @@ sql_tbl = ['''
            ON "tbl_infos" (
              "url"
            );
+           ''',
+           '''
+           CREATE INDEX "idx_infos_url_fp"
+           ON "tbl_infos" (
+             "url_fp"
+           );
+           ''',
+           '''
+           CREATE INDEX "idx_infos_title_fp"
+           ON "tbl_infos" (
+             "title_fp"
+           );
            ''']
 
+info_fp_fields = ('url', 'title')  # tbl_infos中拥有指纹列(字段名_fp)的字段
+
 _proxy = None  # 全局代理地址信息
 _logger = None  # 全局日志输出对象
 _logsvr_session = None  # 外部监控日志服务器Session
@@ -187,6 +211,7 @@ class source_base:
         self.dbs = None  # 运行时绑定的数据功能对象
         self.order_level = 0  # 运行优先级,高优先级的先执行,比如需要人工交互的
         self.interval = 1000 * 60 * 30  # 采集源任务运行间隔
+        self.time_budget = 0  # 单次运行的时间预算,秒;超出后在概览翻页的间隙结束运行,超出两倍时强制中断.0为不限制
         self.id = None  # 采集源注册后得到的唯一标识
         self.name = None  # 采集源的唯一名称,注册后不要改动,否则需要同时改库
         self.url = None  # 采集源对应的站点url
@@ -210,6 +235,7 @@ class source_base:
         self.last_list_url = None  # 记录最后一次概览地址
         self.list_take_retry = 1  # 概览页面抓取并提取信息的动作重试次数
         self.page_take_retry = 1  # 细览页面抓取动作重试次数
+        self.page_take_workers = 1  # 细览页面并发抓取的线程数量;大于1时on_page_take会在工作线程中被调用,需保证其线程安全
         self.on_list_empty_limit = 3  # 概览内容提取为空的次数上限,连续超过此数量时概览循环终止
         self.on_list_rulenames = []  # 概览页面的信息提取规则名称列表,需与info_t的字段名字相符且与on_list_rules的顺序一致
         self.on_list_rules = []  # 概览页面的信息xpath提取规则列表
@@ -541,7 +567,7 @@ class source_base:
         return True
 
     def on_save_info(self, info, updid):
-        """使用dbs保存info到数据库中,updid告知是否为信息更新模式.返回值:保存的信息数量."""
+        """使用dbs保存info到数据库中,updid告知是否为信息更新模式.返回值:保存的信息数量(批量写入模式下为进入写队列的数量)."""
         if self.dbs.save_info(info, updid):
             return 1
         return 0
@@ -644,7 +670,7 @@ class source_base:
         """抓取指定附件.
             返回值:(size,data)
                 size: -1下载错误;-2验证码错误;>=0数据长度
-                data: 下载的数据内容
+                data: 下载的数据内容;req中给出了SAVE_TO流式落盘时,为落盘的文件名
         """
         # 根据给定的参数,抓取指定的附件
         if not self.spider.http.take2(att_url, req):
@@ -653,6 +679,16 @@ class source_base:
         # 从入参中获取"验证码错误"的提示检查字样
         vcode_cc_re = param.get('vcode_cc_re')
 
+        if 'SAVE_TO' in req:
+            # 流式落盘模式,只检查文本回应的前部内容
+            fname = self.spider.http.rst.get('FILE')
+            if vcode_cc_re and is_text_content(self.spider.http.get_HEAD()):
+                with open(fname, 'rb') as fp:
+                    head = fp.read(CHS_SNIFF_SIZE).decode('utf-8', errors='ignore')
+                if query_re_str(head, vcode_cc_re):
+                    return -2, None
+            return self.spider.http.rst.get('SIZE', 0), fname
+
         # 尝试检查是否为验证码错误的应答
         attdata = self.spider.http.get_BODY(b'')
         if isinstance(attdata, str) and vcode_cc_re and query_re_str(attdata, vcode_cc_re):
@@ -670,9 +706,17 @@ class source_base:
                     vcode_mode - 验证码模式,默认为'classic'经典验证码
                     vcode_svr_url - 验证码识别服务器地址
                     vcode_cc_re - 判断错误验证码下载内容的re表达式
+                    att_stream - 是否将附件流式落盘,不在内存中保留完整的附件内容(适用于大文件)
         """
         errs = []
         rsts = []
+
+        def drop_tmp(req):
+            """清理流式落盘的临时文件"""
+            tmp = req.get('SAVE_TO')
+            if tmp and os.path.exists(tmp):
+                os.remove(tmp)
+
         if info.content is None:
             msg = f'ATTACH Content Empty: {info.title} | {info.url}'
             self.log_warn(msg)
@@ -701,21 +745,30 @@ class source_base:
             id_b = '%x' % hash_string(f'{att_name}_{req.get("_fileid_")}')
             fileid = f'src{id_a}_{id_b}'
 
+            # 流式落盘模式,先写入临时文件
+            if param.get('att_stream'):
+                os.makedirs('./files', exist_ok=True)
+                req['SAVE_TO'] = f'./files/.{self.id}_{fileid}.tmp'
+            streamed = 'SAVE_TO' in req
+
             # 抓取附件数据
             datalen, attdata = self.on_attach_take(dst_url, req, **param)
             if datalen == -2:
                 # 验证码错误的时候,再进行一下重试
                 dst_url, err = self.on_attach_make_url(info, i, att_url, att_name, req, 1, **param)
                 if err:
+                    drop_tmp(req)
                     self.log_warn(err)
                     errs.append(err)
                     continue
                 if not dst_url:
+                    drop_tmp(req)
                     continue
                 datalen, attdata = self.on_attach_take(dst_url, req, **param)
 
             # 处理抓取错误
             if datalen < 0 or attdata is None:
+                drop_tmp(req)
                 err = 'verification code error.' if datalen == -2 else 'download error.'
                 msg = f'ATTACH TAKE FAIL <{err}>: {info.title} | {dst_url}'
                 self.log_warn(msg)
@@ -731,7 +784,11 @@ class source_base:
 
             # 扩展名不能直接获取时则尝试根据数据内容进行猜测
             if not ename or len(ename) >= 8:
-                ename = guess_mime(attdata, True)
+                if streamed:
+                    with open(attdata, 'rb') as fp:
+                        ename = guess_mime(fp.read(8192), True)
+                else:
+                    ename = guess_mime(attdata, True)
 
             # 生成落地后的多级路径,构造落地后的附件文件名
             fpath = f'/files/{info.pub_time}/'
@@ -739,7 +796,17 @@ class source_base:
             file_path = f'{fpath}/{fname}'
 
             # 附件存盘落地
-            if not save_to_file2(f'.{fpath}', fname, attdata, encode=None, mode='wb'):
+            if streamed:
+                try:
+                    os.makedirs(f'.{fpath}', exist_ok=True)
+                    os.replace(attdata, f'.{file_path}')  # 流式落盘的临时文件直接移动到目标位置
+                    saved = True
+                except OSError as e:
+                    saved = False
+            else:
+                saved = save_to_file2(f'.{fpath}', fname, attdata, encode=None, mode='wb')
+            if not saved:
+                drop_tmp(req)
                 msg = f'ATTACH SAVE FAIL: .{file_path} => {info.title} | {info.url}'
                 self.log_warn(msg)
                 errs.append(msg)
@@ -768,12 +835,27 @@ class spider_base:
     """爬虫任务基类,提供采集任务运行所需功能的核心接口"""
 
     def __init__(self, source):
+        self._tls = threading.local()  # 细览并发抓取时,工作线程绑定各自的http对象
         self.http = spd_base.spd_base()
         self.source = source
         self.source.spider = self  # 给采集源对象绑定当前的爬虫对象实例
         self.http.timeout = self.source.http_timeout
         self.begin_time = 0  # 最后一次运行的开始时间
+        self.deadline = 0  # 本次运行的截止时间,由采集源的时间预算决定,0为不限制
         self.cnt_input_vcode = 0  # 记录手动输入验证码次数
+        self._page_lock = lock_t(True)  # 细览并发抓取的http对象池与站点限速的锁
+        self._page_https = []  # 细览并发抓取工作线程可复用的http对象池
+        self._page_next = {}  # 各站点下一次允许发起细览请求的时间 {host:time}
+
+    @property
+    def http(self):
+        """当前线程使用的http对象;细览并发抓取的工作线程使用各自独立的对象"""
+        http = getattr(self._tls, 'http', None)
+        return self._http if http is None else http
+
+    @http.setter
+    def http(self, http):
+        self._http = http
 
     # 对采集源待调用方法进行统一包装,防范意外错误
     def call_src_method(self, method, *args):
@@ -868,16 +950,52 @@ class spider_base:
             req['PROXY'] = _proxy  # 再尝试绑定全局代理服务器
         return req
 
-    def _do_page_take(self, info, list_url, page_url, req_param):
-        """尝试对细览页进行循环重试抓取,返回值:(页面抓取状态,信息提取状态)"""
+    def _page_rate_wait(self, page_url):
+        """细览并发抓取时,按站点进行限速:同一站点的相邻请求至少间隔page_url_sleep秒"""
+        sec = self.source.page_url_sleep
+        if not sec:
+            return
+        host = up.urlparse(page_url)[1]
+        with self._page_lock:
+            now = time.time()
+            at = max(now, self._page_next.get(host, 0))
+            self._page_next[host] = at + sec
+        if at > now:
+            time.sleep(at - now)
+
+    def _do_page_fetch(self, info, page_url, req_param):
+        """细览并发抓取的工作线程入口,使用独立的http对象调用on_page_take.返回值:(页面抓取状态,抓取结果,最后请求的url)"""
+        with self._page_lock:
+            http = self._page_https.pop() if self._page_https else None
+        if http is None:
+            http = spd_base.spd_base(self._http.ckm_filename)
+            http.cookieMgr = self._http.cookieMgr  # 与主http对象共享cookie
+        http.timeout = self._http.timeout
+        http.allow_redirects = self._http.allow_redirects
+        self._tls.http = http
+        try:
+            self._page_rate_wait(page_url)
+            take_stat = self.call_src_method('on_page_take', info, page_url, req_param)
+            return take_stat, http.rst, http.last_url
+        finally:
+            self._tls.http = None
+            with self._page_lock:
+                self._page_https.append(http)
+
+    def _do_page_take(self, info, list_url, page_url, req_param, fut=None):
+        """尝试对细览页进行循环重试抓取,fut为并发预抓取的结果.返回值:(页面抓取状态,信息提取状态)"""
         take_stat = False
         info_stat = True
         for i in range(self.source.page_take_retry):
             self.source.page_url_trys = i + 1  # 记录当前这是第几次重试抓取细览页
-            if len(self.http.rst) and self.source.page_url_sleep:
-                self.source.log_info('page sleeping %d second ...' % self.source.page_url_sleep)
-                spd_sleep(self.source.page_url_sleep)  # 细览页面需要间隔休眠
-            take_stat = self.call_src_method('on_page_take', info, page_url, req_param)
+            if i == 0 and fut is not None:
+                # 首次抓取已由工作线程完成,将其结果交付给主http对象,后续提取处理不变
+                take_stat, self.http.rst, self.http.last_url = fut.result()
+            else:
+                if len(self.http.rst) and self.source.page_url_sleep:
+                    self.source.log_info('page sleeping %d second ...' % self.source.page_url_sleep)
+                    spd_sleep(self.source.page_url_sleep)  # 细览页面需要间隔休眠
+                take_stat = self.call_src_method('on_page_take', info, page_url, req_param)
 
             if not take_stat:
                 self.source.log_warn('page_url http take error <%s> :: <%d> %s' % (page_url, self.http.get_status_code(), self.http.get_error()))
@@ -903,6 +1021,13 @@ class spider_base:
 
     def _do_page(self, item, list_url, dbs):
         """进行细览抓取与提取信息的处理"""
+        pre = self._do_page_prep(item, list_url, dbs)
+        if pre is None:
+            return None
+        return self._do_page_done(pre, list_url, dbs)
+
+    def _do_page_prep(self, item, list_url, dbs):
+        """细览抓取之前的预处理:构造信息,过滤与概览排重.返回值:None放弃;或(info,细览抓取url,请求参数,概览排重id)"""
         info = info_t(self.source.id)
         # 将概览页提取的信息元组赋值到标准info对象
         for i in range(len(self.source.on_list_rulenames)):
@@ -929,20 +1054,31 @@ class spider_base:
 
         # 进行概览排重检查
         rid = dbs.check_repeat(info, self.source.on_check_repeats)
-        if self._is_upd_mode():
-            # 要求进行信息更新,则记录当前已有信息主键id,继续处理
-            self.updid = rid
-        else:
+        if not self._is_upd_mode() and rid is not None:
             # 不要求信息更新,如果信息已存在,则结束处理
+            self.source.log_debug("page_url <%s> is list REPEATED <%d>" % (info.url, rid))
+            return None
+        return info, take_page_url, req_param, rid
+
+    def _do_page_done(self, pre, list_url, dbs, fut=None, recheck=False):
+        """对预处理后的信息进行细览抓取,提取与细览排重;fut为并发预抓取结果,recheck告知是否需要复查概览排重.返回值:可存盘的info或None"""
+        info, take_page_url, req_param, rid = pre
+        if recheck and not self._is_upd_mode():
+            # 并发预处理时前面的条目尚未存盘,需要复查概览排重
+            rid = dbs.check_repeat(info, self.source.on_check_repeats)
             if rid is not None:
+                self._drop_fetch(fut)
                 self.source.log_debug("page_url <%s> is list REPEATED <%d>" % (info.url, rid))
                 return None
+        if self._is_upd_mode():
+            # 要求进行信息更新,则记录当前已有信息主键id,继续处理
+            self.updid = rid
 
         page_info_ok = True
         if take_page_url:
             # 需要抓取细览页并提取信息
             self.reqs += 1
-            take_stat, page_info_ok = self._do_page_take(info, list_url, take_page_url, req_param)
+            take_stat, page_info_ok = self._do_page_take(info, list_url, take_page_url, req_param, fut)
             if not take_stat:
                 return None
             self.rsps += 1
@@ -975,19 +1111,58 @@ class spider_base:
 
         return None
 
+    def _drop_fetch(self, fut):
+        """放弃细览预抓取:尚未开始的直接取消,已经发出的请求仍计入请求数"""
+        if fut is not None and not fut.cancel():
+            self.reqs += 1
+
+    def _do_page_loop_mt(self, list_items, list_url, dbs):
+        """细览并发抓取循环:顺序预处理各条目并提交抓取,再按概览条目顺序进行提取与存盘.返回值:成功保存的信息数量"""
+        infos = 0
+        tol_items = len(list_items)
+        with ThreadPoolExecutor(self.source.page_take_workers) as pool:
+            pres = []
+            for i in range(tol_items):
+                self.source.list_item_index = (i + 1, tol_items)
+                pre = self._do_page_prep(list_items[i], list_url, dbs)
+                fut = None
+                if pre is not None and pre[1]:
+                    fut = pool.submit(self._do_page_fetch, pre[0], pre[1], pre[2])
+                pres.append((pre, fut))
+
+            for i in range(tol_items):
+                pre, fut = pres[i]
+                if self._is_timeout():
+                    for pre, fut in pres[i:]:
+                        self._drop_fetch(fut)  # 超出时间预算,放弃尚未开始的抓取
+                    break
+                if pre is None:
+                    continue
+                self.source.list_item_index = (i + 1, tol_items)  # 告知采集源,当前的概览页条目索引信息
+                self.updid = None
+                info = self._do_page_done(pre, list_url, dbs, fut, True)
+                if info:
+                    infos += self.call_src_method('on_save_info', info, self.updid)
+        return infos
+
     def _do_page_loop(self, list_items, list_url, dbs):
         """执行细览抓取处理循环,返回值告知本次成功抓取并保存的信息数量"""
         infos = 0
 
         # 进行细览循环
         tol_items = len(list_items)
-        for i in range(tol_items):
-            item = list_items[i]
-            self.source.list_item_index = (i + 1, tol_items)  # 告知采集源,当前的概览页条目索引信息
-            self.updid = None
-            info = self._do_page(item, list_url, dbs)
-            if info:
-                infos += self.call_src_method('on_save_info', info, self.updid)  # 概览页处理完成
+        if self.source.page_take_workers > 1 and tol_items > 1:
+            infos = self._do_page_loop_mt(list_items, list_url, dbs)
+        else:
+            for i in range(tol_items):
+                if self._is_timeout():
+                    break  # 超出时间预算,放弃剩余的细览
+                item = list_items[i]
+                self.source.list_item_index = (i + 1, tol_items)  # 告知采集源,当前的概览页条目索引信息
+                self.updid = None
+                info = self._do_page(item, list_url, dbs)
+                if info:
+                    infos += self.call_src_method('on_save_info', info, self.updid)  # 概览页处理完成
 
         self.infos += infos
 
@@ -1002,6 +1177,10 @@ class spider_base:
             self.source.list_url_cnt = min(self.source.list_url_cnt + self.source.list_inc_cnt, self.source.list_max_cnt)
             self.list_info_bulking = 0  # 需要开启新一轮增量抓取的时候,清空本轮增量抓取数量
 
+    def _is_timeout(self):
+        """判断本次运行是否已经超出了采集源的时间预算"""
+        return self.deadline and time.time() > self.deadline
+
     def _is_upd_mode(self):
         """判断当前采集源是否需要进行信息的更新处理"""
         if info_upd_mode or self.source.info_upd_mode:
@@ -1143,34 +1322,191 @@ class spider_base:
             self._do_list_bulking()  # 尝试进行概览翻页递增
             list_url = self.call_src_method('on_list_url', self.req_param)
             dbs.update_act(self, list_url is not None)  # 进行中间状态更新
+            if list_url is not None and self._is_timeout():
+                self.source.log_warn('time budget <%d> second exhausted, stop before <%s>' % (self.source.time_budget, list_url))
+                self.source.rec_stat(995)
+                break
 
         self.rlog_end()  # 远端输出抓取结束
         self.call_src_method('on_end')
         return True
 
 
+def fp64(val):
+    """计算值的64位指纹(有符号整数,可直接存入sqlite的integer字段).None的指纹为None"""
+    if val is None:
+        return None
+    return int.from_bytes(hashlib.blake2b(str(val).encode('utf-8'), digest_size=8).digest(), 'little', signed=True)
+
+
 class db_base:
-    """采集系统数据库功能接口"""
+    """采集系统数据库功能接口.
+        数据库连接由s3pool管理:各线程的查询使用各自的只读连接,全部写操作共享单一的写连接;
+        信息保存与状态更新通过有界写队列交给单一的写线程,按数量或时间成批在一个事务中提交;
+        url/title等排重字段在内存中建立索引(含尚未提交的信息),条件中含有被索引字段时,大多数检查无需查询数据库.
+        其他排重条件按形态缓存查询语句并自动建立索引,有指纹列的字段使用整数指纹进行索引查找.
+    """
 
-    def __init__(self, fname):
-        self.db = s3db(fname)
-        self.db.opt_def()
-        self.dbq = s3query(self.db)
+    def __init__(self, fname, batch_size=200, flush_time=0.5, queue_size=2000, dedup_fields=('url', 'title'), **pragmas):
+        """pragmas为s3pool的数据库参数:cache_size/mmap_size/temp_store/synchronous"""
+        self.fname = fname
+        self.pool = s3pool(fname, **pragmas)
+        self.db = self.pool.writer  # 写连接
+        self.dbq = s3query(self.db) if self.db.opened() else None
         self.stime = int(time.time())
-        pass
+        self._lock = lock_t(True)  # 内存排重索引与排重语句缓存的保护锁
+        self.batch_size = batch_size  # 写批次的最大数量,0为每次直接写入
+        self.flush_time = flush_time  # 写批次的最长等待秒数
+        self._wq = queue.Queue(queue_size)  # 写队列 [(类型,sql,参数)],满时写入方等待
+        self._writer_thd = None
+        self.write_fails = 0  # 实际写入失败的数量(批量模式下_write/save_info的返回值只表示已进入写队列)
+        self._idx_fields = tuple(dedup_fields)  # 内存排重索引的字段
+        self._idx = None  # 内存排重索引 {字段:{值:信息id}},None为尚未装载
+        self._idx_ids = {}  # 信息id对应的索引字段值 {信息id:(值,)},用于更新信息时修正索引
+        self._idx_stale = set()  # 因信息更新而失效的索引值 {(字段,值)},这些值的检查需要查询数据库
+        self._next_id = 0  # 最后分配的信息id
+        self._id_floor = 0  # 写线程发现的数据库中已被占用的最大id
+        self._idx_fixes = []  # 写线程记录的待应用索引修正 [(原id,新id或None)]
+        self._fp_fields = ()  # 已具备指纹列的字段,由upgrade确认
+        self._cond_sqls = {}  # 排重条件形态对应的查询 {条件元组:(字段分组列表,sql)}
+        self._idx_cols = None  # tbl_infos已有索引的字段元组集合
+        self._make_info_sqls()
 
     def opened(self):
         return self.db.opened()
 
     def close(self):
+        self._stop_writer()
         if self.db:
             self.dbq.close()
             self.dbq = None
-            self.db.close()
+            self.pool.close()
             self.db = None
 
+    def lock_stats(self):
+        """获取写连接的锁统计:{'writes','contends','wait','max_wait','hold'}"""
+        return dict(self.pool.stats)
+
+    def _stop_writer(self):
+        """停止写线程,写队列中剩余的写操作全部提交后返回;进程退出时也会经由atexit调用,避免丢失尚未提交的数据"""
+        if self._writer_thd is None:
+            return
+        atexit.unregister(self._stop_writer)
+        self._wq.put(('stop', None, None))
+        self._writer_thd.join()
+        self._writer_thd = None
+
+    def _writer(self):
+        """写线程:从写队列中获取写操作,数量达到batch_size或等待超过flush_time时,成批提交"""
+        ops = []
+        first = 0
+        while True:
+            try:
+                op = self._wq.get(timeout=max(0.0, first + self.flush_time - time.time()) if ops else None)
+            except queue.Empty:
+                op = None
+            if op is not None and op[0] in ('flush', 'stop'):
+                self._flush(ops)
+                ops = []
+                if op[1]:
+                    op[1].set()  # 通知等待者,之前的写操作都已提交
+                if op[0] == 'stop':
+                    break
+                continue
+            if op is not None:
+                if not ops:
+                    first = time.time()
+                ops.append(op)
+            if ops and (op is None or len(ops) >= self.batch_size or time.time() - first >= self.flush_time):
+                self._flush(ops)
+                ops = []
+
+    def _flush(self, ops):
+        """在一个事务中执行一批写操作,相邻的同sql操作合并为executemany;失败时逐条重试并记录出错的数据"""
+        if not ops:
+            return
+        with self.pool.write() as db:
+            self._flush_ops(db, ops)
+
+    def _flush_ops(self, db, ops):
+        cur = db.conn.cursor()
+        try:
+            i = 0
+            while i < len(ops):
+                j = i + 1
+                while j < len(ops) and ops[j][1] == ops[i][1]:
+                    j += 1
+                cur.executemany(ops[i][1], [op[2] for op in ops[i:j]])
+                i = j
+            db.conn.commit()
+        except Exception as e:
+            db.conn.rollback()
+            for op in ops:
+                self._flush_one(db, cur, op)
+        finally:
+            cur.close()
+
+    def _flush_one(self, db, cur, op):
+        """单独执行一个写操作并提交,返回值:是否成功.自行分配id的信息如果id已被其他写入者占用,则改由数据库分配id;
+            信息写入失败或id变化时,记录索引修正,由持有self._lock的排重检查与信息保存应用(写线程不获取self._lock,避免与flush等待者死锁).
+        """
+        ins = op[1] == self._sql_ins_id
+        try:
+            try:
+                cur.execute(op[1], op[2])
+            except Exception as e:
+                if not ins or 'tbl_infos.id' not in str(e):
+                    raise
+                cur.execute(self._sql_ins, op[2][1:])
+                self._id_floor = cur.lastrowid
+                self._idx_fixes.append((op[2][0], cur.lastrowid))
+            db.conn.commit()
+            return True
+        except Exception as e:
+            db.conn.rollback()
+            self.write_fails += 1
+            _logger.error("%s <%s> write fail. DB error <%s>", op[0], str(op[2]), es(e))
+            if ins:
+                self._idx_fixes.append((op[2][0], None))  # 未能入库的信息不能再被判为重复
+            return False
+
+    def _write(self, tag, sql, dat):
+        """提交写操作:批量模式时放入写队列,由写线程异步提交;否则直接执行.
+            返回值:批量模式时为已进入写队列(实际的写入失败由写线程记录日志并计入write_fails);否则为是否成功
+        """
+        if self.batch_size:
+            if self._writer_thd is None:
+                with self._lock:
+                    if self._writer_thd is None:
+                        self._writer_thd = start_thread(self._writer, run=False)
+                        self._writer_thd.daemon = True
+                        self._writer_thd.start()
+                        atexit.register(self._stop_writer)  # 未调用close就退出时,提交队列中剩余的写操作
+            self._wq.put((tag, sql, dat))
+            return True
+
+        with self.pool.write() as db:
+            cur = db.conn.cursor()
+            try:
+                return self._flush_one(db, cur, (tag, sql, dat))
+            finally:
+                cur.close()
+
+    def flush(self):
+        """等待写队列中已有的写操作全部提交"""
+        if self._writer_thd is None:
+            return
+        evt = threading.Event()
+        self._wq.put(('flush', evt, None))
+        evt.wait()
+
     def register(self, name, site_url, id=None):
         """根据名字进行采集源在数据库中的注册,返回值:-1失败,成功为采集源ID"""
+        self.flush()
+        with self.pool.write():
+            return self._register(name, site_url, id)
+
+    def _register(self, name, site_url, id=None):
         rows, msg = self.dbq.query("select id,reg_time,site_url from tbl_sources where name=?", (name,))
         # 先查询指定的采集源是否存在
         if msg != '':
@@ -1210,21 +1546,50 @@ class db_base:
         _logger.info('source register OK! <%3d : %s : %s>', rows[0][0], name, site_url)
         return rows[0][0]
 
-    @guard(locker)
+    def upgrade(self):
+        """对已有的数据库进行结构升级:补充指纹列并回填,建立指纹索引.返回值:是否成功"""
+        self.flush()
+        with self._lock, self.pool.write():
+            rows, msg = self.dbq.query("pragma table_info(tbl_infos)")
+            if msg != '' or not rows:
+                _logger.error('tbl_infos upgrade fail. DB error <%s>', msg)
+                return False
+            cols = {row[1] for row in rows}
+            self.db.conn.create_function('fp64', 1, fp64, deterministic=True)
+            fields = []
+            for f in info_fp_fields:
+                col = f + '_fp'
+                sqls = [] if col in cols else ["alter table tbl_infos add column %s integer" % col, "update tbl_infos set %s=fp64(%s)" % (col, f)]
+                sqls.append('create index if not exists "idx_infos_%s" on tbl_infos(%s)' % (col, col))
+                for sql in sqls:
+                    ret, msg = self.dbq.exec(sql)
+                    if not ret:
+                        _logger.error('tbl_infos upgrade <%s> fail. DB error <%s>', sql, msg)
+                        break
+                else:
+                    fields.append(f)
+            self._fp_fields = tuple(fields)
+            self._cond_sqls.clear()
+            self._idx_cols = None
+            self._make_info_sqls()
+        return True
+
+    def _make_info_sqls(self):
+        """生成信息插入与更新的sql语句"""
+        cols = ['source_id', 'create_time', 'title', 'url', 'content', 'pub_time', 'addr', 'keyword', 'ext', 'memo']
+        cols += [f + '_fp' for f in self._fp_fields]
+        self._sql_ins = "insert into tbl_infos(%s) values(%s)" % (','.join(cols), ','.join('?' * len(cols)))
+        self._sql_ins_id = "insert into tbl_infos(id,%s) values(?,%s)" % (','.join(cols), ','.join('?' * len(cols)))
+        self._sql_upd = "update tbl_infos set %s where id=?" % ','.join(c + '=?' for c in cols)
+
     def update_act(self, spd: spider_base, during=False):
         """更新采集源的动作信息"""
         end_time = int(time.time())
         dat = (spd.begin_time, end_time, spd.reqs, spd.rsps, spd.succ, spd.infos, spd.source.id)
-        ret, msg = self.dbq.exec(
-            "update tbl_sources set last_begin_time=?,last_end_time=?,last_req_count=?,last_rsp_count=?,last_req_succ=?,last_infos_count=? where id=?",
-            dat)
-        if not ret:
-            _logger.error("update source act <%s> fail. DB error <%s>", str(dat), msg)
-            return False
-
-        return True
+        return self._write('update source act',
+                           "update tbl_sources set last_begin_time=?,last_end_time=?,last_req_count=?,last_rsp_count=?,last_req_succ=?,last_infos_count=? where id=?",
+                           dat)
 
-    @guard(locker)
     def clear_old(self, days=15, srcid=None):
         """清理旧数据,仅保留days天的数据.srcid可指定采集源编号,或全部.
             返回值:<0错误;>=0为删除的记录数
@@ -1234,16 +1599,103 @@ class db_base:
         else:
             sql = f"delete from tbl_infos where source_id={srcid} and create_time<strftime('%s',datetime('now','localtime','-{days} day'))"
 
-        ret, msg = self.dbq.exec(sql)
+        self.flush()
+        with self._lock, self.pool.write():
+            ret, msg = self.dbq.exec(sql)
+            self._idx = None  # 删除的信息未知,内存排重索引需要重新装载
         if not ret:
             _logger.error("clear source old <%s> fail. DB error <%s>", str(srcid), msg)
             return -1
 
         return msg
 
-    @guard(locker)
+    def _idx_load(self):
+        """装载内存排重索引,并得到最后的信息id"""
+        self.flush()
+        rows, msg = self.pool.query("select id,%s from tbl_infos order by id" % ','.join(self._idx_fields))
+        if msg != '':
+            _logger.error('info dedup index load fail. DB error <%s>', msg)
+            return False
+        idx = {f: {} for f in self._idx_fields}
+        self._idx_ids = {}
+        del self._idx_fixes[:]  # 重新装载后旧的修正已无意义
+        for row in rows:
+            self._idx_add(idx, row[0], row[1:])
+        seq, msg = self.pool.query("select seq from sqlite_sequence where name='tbl_infos'")
+        self._next_id = max(rows[-1][0] if rows else 0, seq[0][0] if seq else 0, self._id_floor)
+        self._idx_stale.clear()
+        self._idx = idx
+        return True
+
+    def _idx_add(self, idx, iid, vals):
+        """将信息iid的字段值vals加入排重索引,同值的信息记录最小的id"""
+        self._idx_ids[iid] = vals
+        for f, v in zip(self._idx_fields, vals):
+            if v is None:
+                continue
+            m = idx[f]
+            old = m.get(v)
+            if old is None or iid < old:
+                m[v] = iid
+
+    def _idx_update(self, iid, vals):
+        """信息iid被更新为新的字段值vals,修正排重索引"""
+        olds = self._idx_ids.get(iid)
+        if olds:
+            for f, v, n in zip(self._idx_fields, olds, vals):
+                if v is not None and v != n and self._idx[f].get(v) == iid:
+                    del self._idx[f][v]
+                    self._idx_stale.add((f, v))  # 可能还有其他信息为此值,只能查询数据库
+        self._idx_add(self._idx, iid, vals)
+
+    def _idx_fix(self):
+        """应用写线程记录的索引修正:未能入库的信息移出索引,被数据库重新分配id的信息修正id"""
+        while self._idx_fixes:
+            old, new = self._idx_fixes.pop(0)
+            vals = self._idx_ids.pop(old, None)
+            if vals is None:
+                continue
+            for f, v in zip(self._idx_fields, vals):
+                if v is not None and self._idx[f].get(v) == old:
+                    del self._idx[f][v]
+                    if new is None:
+                        self._idx_stale.add((f, v))  # 可能还有其他信息为此值,只能查询数据库
+            if new is not None:
+                self._idx_add(self._idx, new, vals)
+        self._next_id = max(self._next_id, self._id_floor)
+
+    def _idx_check(self, info: info_t, grps):
+        """使用内存排重索引判断排重条件(字段分组列表,组间为or逻辑,组内为and逻辑).
+            组内某个被索引字段的值不存在时,该组不可能满足;候选信息的被索引字段值全部相同且组内没有其他字段时,即为重复.
+            返回值:(是否已确定,已有信息id或None);有分组无法由索引确定时(如组内没有被索引的字段)返回(False,None)
+        """
+        known = True
+        for fields in grps:
+            miss = False
+            rids = set()  # 组内各被索引字段命中的候选信息id
+            for f in fields:
+                if f not in self._idx_fields:
+                    continue
+                v = info.__dict__[f]
+                rid = self._idx[f].get(v)
+                if rid is not None:
+                    rids.add(rid)
+                elif (f, v) not in self._idx_stale:
+                    miss = True
+                    break
+            if miss:
+                continue
+            for rid in sorted(rids):
+                vals = dict(zip(self._idx_fields, self._idx_ids.get(rid, ())))
+                if all(f in vals and vals[f] == info.__dict__[f] for f in fields):
+                    return True, rid
+            known = False
+        return known, None
+
     def save_info(self, info: info_t, updid=None):
-        """保存指定的信息入库,外面应进行排重判断;可指定updid进行信息的强制更新;返回值告知是否成功"""
+        """保存指定的信息入库,外面应进行排重判断;可指定updid进行信息的强制更新;返回值告知是否成功.
+            批量模式时信息先进入写队列,返回值只表示已入队,出错时由写线程记录日志并计入write_fails.
+        """
 
         def d2j(d):
             if d is None:
@@ -1256,64 +1708,109 @@ class db_base:
 
         dat = (info.source_id, int(time.time()), info.title, info.url, info.content, info.pub_time, info.addr, info.keyword, d2j(info.ext),
                info.memo)
-        if updid is None:
-            # 常规插入模式
-            sql = "insert into tbl_infos(source_id,create_time,title,url,content,pub_time,addr,keyword,ext,memo) values(?,?,?,?,?,?,?,?,?,?)"
-        else:
-            # 数据更新模式
-            dat += (updid,)
-            sql = "update tbl_infos set source_id=?,create_time=?,title=?,url=?,content=?,pub_time=?,addr=?,keyword=?,ext=?,memo=? where id=?"
-
-        ret, msg = self.dbq.exec(sql, dat)
-        if not ret:
-            _logger.error("info <%s> save fail. DB error <%s>", str(dat), msg)
-            return False
+        dat += tuple(fp64(info.__dict__[f]) for f in self._fp_fields)
+        with self._lock:
+            if self._idx_fields and self._idx is None:
+                self._idx_load()
+            if self._idx is not None:
+                self._idx_fix()
+            vals = tuple(info.__dict__[f] for f in self._idx_fields)
+            if updid is None:
+                # 常规插入模式
+                if self._idx is not None:
+                    # 由这里分配信息id,尚未提交的信息也可以在内存索引中给出id
+                    self._next_id += 1
+                    dat = (self._next_id,) + dat
+                    sql = self._sql_ins_id
+                    self._idx_add(self._idx, self._next_id, vals)
+                else:
+                    sql = self._sql_ins
+            else:
+                # 数据更新模式
+                dat += (updid,)
+                sql = self._sql_upd
+                if self._idx is not None:
+                    self._idx_update(updid, vals)
 
-        return True
+        return self._write('info save', sql, dat)
 
-    def _cat_cond(self, info: info_t, cond):
-        """ 拼装排重条件与值元组
+    def _cond_sql(self, cond):
+        """ 得到排重条件形态对应的(字段分组列表,查询sql),结果按条件形态缓存;首次遇到的条件形态会尝试为其建立索引.
             cond为['字段1','字段2']时,代表多个字段为and逻辑
             cond为[('字段1','字段2'),('字段3','字段4')]时,代表多个字段组为or逻辑,组内字段为and逻辑
         """
-        vals = ()
-        cons = ()
-
-        # 统计分组的数量
-        grps = 0
-        for i in range(len(cond)):
-            if isinstance(cond[i], tuple):
-                grps += 1
-
-        if grps:
-            # 有分组,需要先对分组中的tuple进行检查修正
-            for i in range(len(cond)):
-                if not isinstance(cond[i], tuple):
-                    cond[i] = (cond[i],)
-
-            for fields in cond:
-                # 对每个组进行处理,拼装and部分的逻辑串
-                vals += tuple(info.__dict__[c] for c in fields)
-                cons += ('(' + ' and '.join(tuple(c + '=?' for c in fields)) + ')',)
+        key = tuple(cond)
+        rst = self._cond_sqls.get(key)
+        if rst is not None:
+            return rst
+
+        if any(isinstance(c, tuple) for c in cond):
+            grps = [c if isinstance(c, tuple) else (c,) for c in cond]  # 有分组,对非分组的字段进行修正
         else:
-            # 无分组,直接拼装and部分的逻辑
-            vals = tuple(info.__dict__[c] for c in cond)
-            cons += (' and '.join(tuple(c + '=?' for c in cond)),)
+            grps = [tuple(cond)]  # 无分组,全部字段为and逻辑
+
+        cons = []
+        for fields in grps:
+            # 有指纹列的字段先比较指纹(走整数索引),再比较原值(排除指纹碰撞)
+            cons.append('(' + ' and '.join(f'{f}_fp=? and {f}=?' if f in self._fp_fields else f'{f}=?' for f in fields) + ')')
+            self._dedup_index(fields)
+        rst = self._cond_sqls[key] = (grps, "select id from tbl_infos where %s limit 1" % ' or '.join(cons))
+        return rst
 
-        # 多个and条件,进行or连接
-        cons = ' or '.join(tuple(c for c in cons))
-        return vals, cons
+    def _cond_vals(self, info: info_t, grps):
+        """按排重条件的字段分组,得到查询的参数值"""
+        vals = []
+        for fields in grps:
+            for f in fields:
+                v = info.__dict__[f]
+                if f in self._fp_fields:
+                    vals.append(fp64(v))
+                vals.append(v)
+        return vals
+
+    def _dedup_index(self, fields):
+        """确保排重字段组拥有索引(有指纹列的字段使用指纹列),已有前缀相同的索引时跳过;大文本字段不建索引"""
+        cols = tuple(f + '_fp' if f in self._fp_fields else f for f in fields if f not in {'content', 'ext'})
+        if not cols:
+            return
+        if self._idx_cols is None:
+            self._idx_cols = set()
+            rows, msg = self.pool.query("pragma index_list(tbl_infos)")
+            for row in rows or ():
+                icols, msg = self.pool.query('pragma index_info("%s")' % row[1])
+                self._idx_cols.add(tuple(c[2] for c in sorted(icols or ())))
+        if any(icols[:len(cols)] == cols for icols in self._idx_cols):
+            return
+
+        name = 'idx_infos_dd_' + '_'.join(cols)
+        self.flush()
+        with self.pool.write():
+            ret, msg = self.dbq.exec('create index if not exists "%s" on tbl_infos(%s)' % (name, ','.join(cols)))
+        if not ret:
+            _logger.error('info dedup index <%s> create fail. DB error <%s>', name, msg)
+            return
+        self._idx_cols.add(cols)
+        _logger.info('info dedup index <%s> created.', name)
 
-    @guard(locker)
     def check_repeat(self, info: info_t, cond):
         """使用指定的信息对象,根据给定的cond条件(字段名列表),判断其是否重复.
+            优先使用内存排重索引判断;索引无法确定时(如条件分组中没有被索引的字段,或值因信息更新而失效),
+            需要先等待写队列提交再查询数据库,此时批量写入退化为逐条提交,因此排重条件应尽量包含被索引的字段.
             返回值:None不重复;其他为已有信息的ID
         """
         if len(cond) == 0:
             return None  # 没有给出判重条件,则认为不重复
 
-        val, cnd = self._cat_cond(info, cond)
-        rows, msg = self.dbq.query("select id from tbl_infos where %s limit 1" % cnd, val)
+        with self._lock:
+            grps, sql = self._cond_sql(cond)
+            if self._idx_fields and (self._idx is not None or self._idx_load()):
+                self._idx_fix()
+                known, rid = self._idx_check(info, grps)
+                if known:
+                    return rid
+
+        self.flush()  # 需要查询数据库的时候,确保之前的写操作都已提交
+        rows, msg = self.pool.query(sql, self._cond_vals(info, grps))
 
         if msg != '':
             _logger.error('info <%s> repeat QUERY fail. DB error <%s>', info.__dict__.__str__(), msg)
@@ -1330,10 +1827,20 @@ class collect_manager:
 
     def __init__(self, dbs, threads=0):
         self.dbs = dbs
-        self.spiders = []
+        self.spiders = []  # 本轮运行的爬虫实例
         self.sources = []
         self.on_idle = self._on_idle
         self.threads = max(1, threads)
+        self.metrics = {}  # 各采集源的运行统计 {sid:{'name','runs','secs','last','max','reqs','infos','timeouts'}}
+        self._plan = []  # 采集源调度堆 [(下次运行时间毫秒,-order_level,序号,spdmeta)]
+        self._seq = 0  # 调度堆的入堆序号,同时间同优先级时保持注册顺序
+        self._srcs = {}  # 注册时创建的采集源实例,首次运行时复用 {sid:src}
+        self._https = {}  # 各采集源跨轮复用的http对象,保持cookie与连接 {sid:spd_base}
+        self._tasks = queue.PriorityQueue()  # 待运行的爬虫任务 (-order_level,序号,spd)
+        self._dones = queue.Queue()  # 运行结束的爬虫实例
+        self._workers = []  # 常驻工作线程
+        self._running = {}  # 运行中的爬虫 {spd:[线程,开始时间,是否已强制中断,是否可被中断]}
+        self._jobs_lock = lock_t(True)
         if self.threads > 1:
             locker_log.init()
             locker.init()
@@ -1372,28 +1879,75 @@ class collect_manager:
             return False
 
         meter = tick_meter(src.interval)  # 采集源运行间隔计时器
-        spdmeta = (spider_t, source_t, sid, mname, meter)
+        spdmeta = (spider_t, source_t, sid, mname, meter, src.order_level)
         self.sources.append(spdmeta)  # 记录采集源爬虫元数据
-        self._make_spider(spdmeta, src)  # 根据采集源爬虫元数据生成首次运行需要的爬虫实例
+        self._srcs[sid] = src  # 首次运行时使用当前的采集源实例
+        self._push_source(spdmeta, 0)  # 新注册的采集源立即到期
         return True
 
-    def _make_spider(self, spdmeta, src=None):
-        """根据采集源类型等参数生成爬虫实例"""
-        meter = spdmeta[4]
-        if not meter.hit():
-            return False  # 对于本轮不运行的采集源,跳过
+    def _push_source(self, spdmeta, due):
+        """将采集源按下次运行时间与优先级放入调度堆"""
+        self._seq += 1
+        heapq.heappush(self._plan, (due, -spdmeta[5], self._seq, spdmeta))
 
+    def _make_spider(self, spdmeta):
+        """根据采集源类型等参数生成爬虫实例"""
+        sid = spdmeta[2]
+        src = self._srcs.pop(sid, None)
         if src is None:
             src = spdmeta[1]()
-        src.id = spdmeta[2]
+        src.id = sid
         src.module_name = spdmeta[3]
         spd = spdmeta[0](src)  # 重新构造当前采集源对应的爬虫实例
-
-        if src.order_level:
-            self.spiders.insert(0, spd)
-        else:
-            self.spiders.append(spd)
-        return True
+        http = self._https.get(sid)
+        if http is not None:
+            spd.http = http  # 复用上一轮的http对象,保持会话cookie与长连接
+            spd.http.timeout = src.http_timeout
+        self._https[sid] = spd.http
+        return spd
+
+    def _take_due(self):
+        """从调度堆中取出全部到期的采集源,生成本轮需要运行的爬虫实例列表,高优先级的在前"""
+        now = int(time.time() * 1000)
+        dues = []
+        while self._plan and self._plan[0][0] <= now:
+            dues.append(heapq.heappop(self._plan))
+        dues.sort(key=lambda x: (x[1], x[0], x[2]))
+
+        with self._jobs_lock:
+            busy = {spd.source.id for spd in self._running}
+        spiders = []
+        for due, level, seq, spdmeta in dues:
+            if spdmeta[2] in busy:
+                self._push_source(spdmeta, due)  # 上轮被中止的实例仍在运行,留待下一轮
+                continue
+            meter = spdmeta[4]
+            meter.last_time = now
+            self._push_source(spdmeta, now + meter.interval)
+            spiders.append(self._make_spider(spdmeta))
+        return spiders
+
+    def _rec_metrics(self, spd, secs, timeout=False):
+        """记录采集源的本次运行统计"""
+        m = self.metrics.get(spd.source.id)
+        if m is None:
+            m = self.metrics[spd.source.id] = {'name': spd.source.name, 'runs': 0, 'secs': 0.0, 'last': 0.0, 'max': 0.0, 'reqs': 0, 'infos': 0, 'timeouts': 0}
+        m['runs'] += 1
+        m['secs'] += secs
+        m['last'] = secs
+        m['max'] = max(m['max'], secs)
+        m['reqs'] += getattr(spd, 'reqs', 0)
+        m['infos'] += getattr(spd, 'infos', 0)
+        if timeout:
+            m['timeouts'] += 1
+
+    def metrics_report(self):
+        """生成各采集源的吞吐与耗时统计.返回值:[(sid,名称,运行次数,平均耗时秒,最大耗时秒,请求数/秒,信息数/秒,超时次数)]"""
+        rst = []
+        for sid, m in self.metrics.items():
+            secs = max(m['secs'], 0.001)
+            rst.append((sid, m['name'], m['runs'], m['secs'] / m['runs'], m['max'], m['reqs'] / secs, m['infos'] / secs, m['timeouts']))
+        return rst
 
     @guard(locker)
     def _inc_infos_(self, inc):
@@ -1408,17 +1962,122 @@ class collect_manager:
         _logger.info("source <%s{%3d}> begin[%d+%d:%d]. <%s>", spd.source.name, spd.source.id, spd.source.list_url_cnt,
                      spd.source.list_inc_cnt,
                      spd.source.list_max_cnt, spd.source.url)
-        spd.run(self.dbs)
+        budget = spd.source.time_budget
+        btime = time.time()
+        spd.deadline = btime + budget if budget else 0
+        try:
+            self._job_active(spd, True)
+            spd.run(self.dbs)
+        finally:
+            self._job_active(spd, False)  # 之后的统计与入库可能持有锁,不允许再被强制中断
+            self._rec_metrics(spd, time.time() - btime, spd._is_timeout())
         self._inc_infos_(spd.infos)
         self.dbs.update_act(spd)
-        _logger.info("source <%s> end. reqs<%d> rsps<%d> succ<%d> infos<%d> vcodes<%d>", spd.source.name, spd.reqs, spd.rsps, spd.succ, spd.infos, spd.cnt_input_vcode)
+        _logger.info("source <%s> end. reqs<%d> rsps<%d> succ<%d> infos<%d> vcodes<%d> cost<%.1fs>", spd.source.name, spd.reqs, spd.rsps, spd.succ, spd.infos, spd.cnt_input_vcode, time.time() - btime)
+
+    def _worker(self):
+        """常驻工作线程:按优先级获取爬虫任务并运行,跨轮次保持存活"""
+        while True:
+            try:
+                level, seq, spd = self._tasks.get()
+            except InterruptedError:
+                continue  # 迟到的强制中断
+            if spd is None:
+                break  # 要求工作线程退出
+            try:
+                try:
+                    with self._jobs_lock:
+                        self._running[spd] = [threading.current_thread(), time.time(), False, False]
+                    self._run_one(spd)
+                except BaseException as e:
+                    _logger.warning("source <%s> run interrupted: %s", spd.source.name, ei(e))
+            except InterruptedError:
+                pass  # 强制中断落在了日志输出期间
+            self._end_job(spd)
+
+    def _job_active(self, spd, active):
+        """标记爬虫实例是否处于可被强制中断的运行期;离开运行期时撤销可能尚未送达的中断.
+            中断可能落在标记过程中,需重试直至完成"""
+        while True:
+            try:
+                with self._jobs_lock.locker:  # 直接使用底层锁,中断落在with块内时也能保证释放
+                    job = self._running.get(spd)
+                    if job is not None:
+                        job[3] = active
+                        if not active and job[2]:
+                            job[2] = False
+                            stop_thread_undo(job[0])
+                return
+            except InterruptedError:
+                continue
+
+    def _end_job(self, spd):
+        """爬虫运行结束后的登记,重试直至完成,避免工作线程退出或爬虫丢失"""
+        while True:
+            try:
+                with self._jobs_lock.locker:
+                    self._running.pop(spd, None)
+                break
+            except InterruptedError:
+                continue
+        while True:
+            try:
+                self._dones.put(spd)
+                break
+            except InterruptedError:
+                continue
+
+    def _start_workers(self):
+        """按需补足常驻工作线程"""
+        self._workers = [t for t in self._workers if t.is_alive()]
+        for i in range(self.threads - len(self._workers)):
+            thd = start_thread(self._worker, run=False)
+            thd.daemon = True
+            thd.start()
+            self._workers.append(thd)
+
+    def _check_budgets(self, stop=False):
+        """对运行超出两倍时间预算的爬虫(或stop要求停止时的全部爬虫)进行强制中断"""
+        now = time.time()
+        with self._jobs_lock:
+            for spd, job in self._running.items():
+                budget = spd.source.time_budget
+                if job[2] or not job[3] or not (stop or budget and now - job[1] > budget * 2):
+                    continue
+                job[2] = True
+                if not stop:
+                    _logger.warning("source <%s> exceeds time budget <%d> second, interrupt it.", spd.source.name, budget)
+                stop_thread(job[0])
+
+    def _run_pool(self):
+        """将本轮的爬虫提交给常驻工作线程池并等待结束.返回值:是否要求停止"""
+        self._start_workers()
+        pending = set(self.spiders)
+        for spd in self.spiders:
+            self._seq += 1
+            self._tasks.put((-spd.source.order_level, self._seq, spd))
+
+        while pending:
+            try:
+                pending.discard(self._dones.get(timeout=0.1))  # 可能收到上轮被中止的爬虫,忽略即可
+                continue
+            except queue.Empty:
+                pass
+            if self.on_idle and self.on_idle():
+                try:
+                    while True:
+                        self._tasks.get_nowait()  # 放弃尚未开始的任务
+                except queue.Empty:
+                    pass
+                self._check_budgets(True)
+                return True
+            self._check_budgets()
+        return False
 
     def run(self):
-        """对全部爬虫逐一进行调用.返回值:是否要求停止"""
+        """对到期的爬虫按优先级进行调用.返回值:是否要求停止"""
 
-        if len(self.spiders) == 0:  # 进行预处理,适应多次运行时的爬虫实例初始化
-            for spdmeta in self.sources:
-                self._make_spider(spdmeta)
+        self.spiders = self._take_due()  # 从调度堆中获取本轮到期的采集源,生成爬虫实例
 
         total_spiders = len(self.spiders)
         if total_spiders == 0:
@@ -1429,21 +2088,8 @@ class collect_manager:
         self.infos = 0
         stop = False
 
-        if self.threads > 1:  # 使用多线程并发运行全部的爬虫
-            task_ids = [i - 1 for i in range(len(self.spiders), 0, -1)]  # 待处理任务索引列表,倒序,便于后面pop使用
-            workers = []  # 工作线程对象列表
-            while len(task_ids) or len(workers):
-                ends, stop = wait_threads(workers, 0.1, idle_cb=self.on_idle)  # 在批量线程中等待任意线程结束
-                if stop:
-                    for t in workers:
-                        stop_thread(t)
-                    break
-                tc = self.threads - len(workers)
-                for i in range(tc):  # 循环补充新的工作线程
-                    if len(task_ids) == 0:
-                        break  # 没有待处理任务了,结束
-                    spd = self.spiders[task_ids.pop()]  # 得到待处理任务
-                    workers.append(start_thread(self._run_one, spd))  # 创建线程,执行任务,并记录线程对象
+        if self.threads > 1:  # 使用常驻工作线程池并发运行全部的爬虫
+            stop = self._run_pool()
         else:
             idx = 1
             for spd in self.spiders:  # 在主线程中顺序执行全部的爬虫
@@ -1461,13 +2107,25 @@ class collect_manager:
             if len(spd.source.stat) == 1 and 200 in spd.source.stat:
                 continue
             _logger.warning("<%s> | source <%s {%d}> | stat <%s> | %s", spd.source.module_name, spd.source.name, spd.source.id, spd.source.stat, spd.source.url)
-        _logger.info("spiders collect <%d>, vcodes<%d>" % (self.infos, _cnt_input_vcode))
+        for sid, name, runs, avg, most, reqs, infos, timeouts in self.metrics_report():
+            _logger.info("metrics <%s {%d}> | runs<%d> avg<%.1fs> max<%.1fs> | reqs<%.2f/s> infos<%.2f/s> | timeouts<%d>", name, sid, runs, avg, most, reqs, infos, timeouts)
+        self.dbs.flush()  # 采集数量为进入写队列的数量,提交完成后再给出实际的写入失败数量
+        _logger.info("spiders collect <%d>, write fails <%d>, vcodes<%d>" % (self.infos, self.dbs.write_fails, _cnt_input_vcode))
+        st = self.dbs.lock_stats()
+        _logger.info("db writes <%d> contends <%d> wait <%.3fs/max %.3fs> hold <%.3fs>", st['writes'], st['contends'], st['wait'], st['max_wait'], st['hold'])
 
         # 爬虫实例用过一次就作废,全部清空等待重新创建.
         self.spiders.clear()
         return stop
 
     def close(self):
+        for t in self._workers:
+            self._seq += 1
+            self._tasks.put((sys.maxsize, self._seq, None))  # 通知常驻工作线程退出
+        self._workers.clear()
+        self._https.clear()
+        self._srcs.clear()
+        self._plan.clear()
         self.spiders.clear()
         self.sources.clear()
         self.sources = None
@@ -1498,6 +2156,7 @@ def make_collect_mgr(log_path='./log_spd_tiny.txt', db_path='spd_tiny.sqlite3',
             ret, msg = dbs.db.exec(s)  # 尝试在新库中自动建表
             if not ret:
                 _logger.error("DB init create fail! < %s >" % msg)
+    dbs.upgrade()  # 旧库补充指纹列与索引
 
     cm = collect_manager(dbs, threads)
     return cm
@@ -1,5 +1,9 @@
 import array
 import math
+import mmap
+import os
+import struct
+import hashlib
 
 """
 布隆过滤器,误判率 P ≈ (1 - e^(-k*n/m))^k
@@ -28,6 +32,30 @@ def calc_bits_hash(n, p):
     return m, calc_hash_count(m, n)
 
 
+def hash64(txt, encoding='utf-8'):
+    """计算文本txt的64位哈希值,用于布隆过滤器的双重哈希"""
+    if isinstance(txt, str):
+        txt = txt.encode(encoding)
+    return int.from_bytes(hashlib.blake2b(txt, digest_size=8).digest(), 'little')
+
+
+def mix64(x):
+    """splitmix64混合函数,由64位哈希值派生与之不相关的另一个64位值"""
+    x = (x + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return x ^ (x >> 31)
+
+
+def calc_bits_pos(hash, k, m):
+    """基于单个64位哈希值hash,用双重哈希(h1+i*h2)推导k个比特位置(位数组大小为m),无需进行k次独立的哈希计算.
+        h1使用完整的64位,超大位数组的比特位置也能均匀分布;h2由hash经mix64派生,与h1不相关
+    """
+    h1 = hash
+    h2 = mix64(hash) | 1  # 保证步长为奇数
+    return [(h1 + i * h2) % m for i in range(k)]
+
+
 class bitarray_t:
     """基于长整数数组构建一个比特数组"""
     effs = 2 ** 32 - 1
@@ -63,21 +91,130 @@ class bitarray_t:
 
 
 class bloom_filter_t:
-    """基于内存数组的布隆过滤器"""
+    """基于内存数组(或文件映射)的布隆过滤器"""
     masks = tuple(1 << i for i in range(32))
+    magic = b'BLMF'
+    ver = 3  # 版本2起双重哈希的h1为64位,版本3起h2由mix64派生,与旧版本的比特位置不兼容
+    head_fmt = '<4sIQIQdQ'  # 魔数,版本,位数,哈希次数,最大元素数,错误率,已添加元素数
+    head_size = struct.calcsize(head_fmt)
 
     def __init__(self, max_items=0, error_rate=0.00000001, array_=None):
+        self._mm = None  # 文件映射对象
+        self._fp = None
+        self._fname = None  # 映射文件的路径
+        self.count = 0  # 通过add_hash/add_many添加的新元素数量
         if max_items:
             self.init(max_items, error_rate, array_)
 
     def init(self, max_items, error_rate, array_=None):
+        self.max_items = max_items
+        self.error_rate = error_rate
         self.num_bits = calc_bits_size(max_items, error_rate)
+        self.num_hashes = max(1, calc_hash_count(self.num_bits, max_items))  # 双重哈希推导的比特位置数量
         self.num_words = (self.num_bits + 31) // 32  # 计算需要的4字节长整数的数量
         if array_ is None:
-            self._array = array.array('L', [0]) * self.num_words
+            self._array = array.array('I', [0]) * self.num_words
         else:
             self._array = array_
 
+    def _head(self):
+        return struct.pack(self.head_fmt, self.magic, self.ver, self.num_bits, self.num_hashes, self.max_items, self.error_rate, self.count)
+
+    def _parse_head(self, dat):
+        """解析文件头,返回值:是否正确"""
+        magic, ver, self.num_bits, self.num_hashes, self.max_items, self.error_rate, self.count = struct.unpack(self.head_fmt, dat)
+        self.num_words = (self.num_bits + 31) // 32
+        return magic == self.magic and ver == self.ver
+
+    def dump(self, fp):
+        """将过滤器写入已打开的二进制文件fp"""
+        fp.write(self._head())
+        arr = self._array
+        if isinstance(arr, array.array) and arr.typecode != 'I':
+            arr = array.array('I', arr)
+        fp.write(arr if isinstance(arr, memoryview) else arr.tobytes())
+
+    def read(self, fp):
+        """从已打开的二进制文件fp读取过滤器,返回值:是否成功"""
+        if not self._parse_head(fp.read(self.head_size)):
+            return False
+        self._array = array.array('I')
+        self._array.frombytes(fp.read(self.num_words * 4))
+        return len(self._array) == self.num_words
+
+    def save(self, fname=None):
+        """保存过滤器到文件fname,返回值:(True,'')或(False,err).
+            文件映射模式时同步映射文件;fname为其他文件时,再另存一份副本
+        """
+        try:
+            if self._mm is not None:
+                self.flush()
+                if fname is None or os.path.abspath(fname) == self._fname:
+                    return True, ''
+            elif fname is None:
+                return False, 'no file name'
+            with open(fname + '.tmp', 'wb') as fp:
+                self.dump(fp)
+            os.replace(fname + '.tmp', fname)
+            return True, ''
+        except Exception as e:
+            return False, str(e)
+
+    def load(self, fname):
+        """从文件fname装载过滤器到内存,返回值:(True,'')或(False,err)"""
+        try:
+            with open(fname, 'rb') as fp:
+                if not self.read(fp):
+                    return False, 'bad file'
+            return True, ''
+        except Exception as e:
+            return False, str(e)
+
+    def open(self, fname, max_items=0, error_rate=0.00000001):
+        """打开文件fname作为映射位数组(文件不存在时按max_items/error_rate创建),修改直接落在文件上,重启后可继续使用.
+            返回值:(True,'')或(False,err)
+        """
+        try:
+            if not os.path.exists(fname):
+                if not max_items:
+                    return False, 'file not exists'
+                self.init(max_items, error_rate, array.array('I'))
+                with open(fname, 'wb') as fp:
+                    fp.write(self._head())
+                    fp.truncate(self.head_size + self.num_words * 4)
+            self.close()
+            self._fp = open(fname, 'r+b')
+            if not self._parse_head(self._fp.read(self.head_size)):
+                self.close()
+                return False, 'bad file'
+            self._mm = mmap.mmap(self._fp.fileno(), 0)
+            self._array = memoryview(self._mm)[self.head_size:self.head_size + self.num_words * 4].cast('I')
+            self._fname = os.path.abspath(fname)
+            return True, ''
+        except Exception as e:
+            self.close()
+            return False, str(e)
+
+    def flush(self):
+        """将映射位数组与计数同步到文件"""
+        if self._mm is None:
+            return
+        self._mm[:self.head_size] = self._head()
+        self._mm.flush()
+
+    def close(self):
+        """关闭文件映射"""
+        if self._mm is not None:
+            self.flush()
+            self._array.release()
+            self._array = array.array('I')
+            self._mm.close()
+            self._mm = None
+            self._fname = None
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
     def set(self, bitpos: []):
         """添加指定的比特位序列,返回值:告知当前序列是否已经存在"""
         olds = 0
@@ -121,3 +258,138 @@ class bloom_filter_t:
             if not self._array[wordno] & mask:
                 return False
         return True
+
+    def add_hash(self, hash):
+        """基于64位哈希值hash双重哈希推导比特位置并添加,返回值:告知是否已经存在"""
+        old = self.set(calc_bits_pos(hash, self.num_hashes, self.num_bits))
+        if not old:
+            self.count += 1
+        return old
+
+    def has_hash(self, hash):
+        """判断64位哈希值hash是否存在"""
+        return self.tst(calc_bits_pos(hash, self.num_hashes, self.num_bits))
+
+    def add_many(self, hashes):
+        """批量添加64位哈希值序列hashes(可为array('Q')),返回值:[是否已存在]列表"""
+        arr, masks, k, m = self._array, self.masks, self.num_hashes, self.num_bits
+        rst = []
+        for hash in hashes:
+            h1 = hash
+            h2 = mix64(hash) | 1
+            olds = 0
+            for i in range(k):
+                bitno = (h1 + i * h2) % m
+                wordno = bitno >> 5
+                mask = masks[bitno & 0x1f]
+                if arr[wordno] & mask:
+                    olds += 1
+                else:
+                    arr[wordno] |= mask
+            rst.append(olds == k)
+        self.count += rst.count(False)
+        return rst
+
+    def has_many(self, hashes):
+        """批量判断64位哈希值序列hashes是否存在,返回值:[是否存在]列表"""
+        arr, masks, k, m = self._array, self.masks, self.num_hashes, self.num_bits
+        rst = []
+        for hash in hashes:
+            h1 = hash
+            h2 = mix64(hash) | 1
+            for i in range(k):
+                bitno = (h1 + i * h2) % m
+                if not arr[bitno >> 5] & masks[bitno & 0x1f]:
+                    rst.append(False)
+                    break
+            else:
+                rst.append(True)
+        return rst
+
+
+class scalable_bloom_t:
+    """可扩展的布隆过滤器:当前过滤器达到容量后追加新的过滤器(容量按growth倍增,错误率按ratio收紧),总体错误率有界"""
+    magic = b'SBLM'
+
+    def __init__(self, max_items=100000, error_rate=0.00000001, growth=2, ratio=0.85):
+        self.max_items = max_items  # 首个过滤器的容量
+        self.error_rate = error_rate  # 首个过滤器的错误率
+        self.growth = growth
+        self.ratio = ratio
+        self.filters = []
+
+    def __len__(self):
+        return sum(f.count for f in self.filters)
+
+    def _grow(self):
+        """追加新的过滤器"""
+        n = len(self.filters)
+        flt = bloom_filter_t(int(self.max_items * self.growth ** n), self.error_rate * self.ratio ** n)
+        self.filters.append(flt)
+        return flt
+
+    def has_hash(self, hash):
+        """判断64位哈希值hash是否存在"""
+        for flt in self.filters:
+            if flt.has_hash(hash):
+                return True
+        return False
+
+    def add_hash(self, hash):
+        """添加64位哈希值hash,返回值:告知是否已经存在"""
+        if self.has_hash(hash):
+            return True
+        flt = self.filters[-1] if self.filters else self._grow()
+        if flt.count >= flt.max_items:
+            flt = self._grow()
+        flt.add_hash(hash)
+        return False
+
+    def add_many(self, hashes):
+        """批量添加64位哈希值序列,返回值:[是否已存在]列表"""
+        return [self.add_hash(hash) for hash in hashes]
+
+    def has_many(self, hashes):
+        """批量判断64位哈希值序列是否存在,返回值:[是否存在]列表"""
+        rst = [False] * len(hashes)
+        rest = list(range(len(hashes)))
+        for flt in self.filters:
+            if not rest:
+                break
+            hits = flt.has_many([hashes[i] for i in rest])
+            for i, hit in zip(rest, hits):
+                if hit:
+                    rst[i] = True
+            rest = [i for i, hit in zip(rest, hits) if not hit]
+        return rst
+
+    def save(self, fname):
+        """保存全部过滤器到文件fname,返回值:(True,'')或(False,err)"""
+        try:
+            with open(fname + '.tmp', 'wb') as fp:
+                fp.write(self.magic)
+                fp.write(struct.pack('<QdddI', self.max_items, self.error_rate, self.growth, self.ratio, len(self.filters)))
+                for flt in self.filters:
+                    flt.dump(fp)
+            os.replace(fname + '.tmp', fname)
+            return True, ''
+        except Exception as e:
+            return False, str(e)
+
+    def load(self, fname):
+        """从文件fname装载全部过滤器,返回值:(True,'')或(False,err)"""
+        try:
+            with open(fname, 'rb') as fp:
+                if fp.read(4) != self.magic:
+                    return False, 'bad magic'
+                max_items, self.error_rate, self.growth, self.ratio, n = struct.unpack('<QdddI', fp.read(36))
+                self.max_items = max_items
+                self.filters = []
+                for i in range(n):
+                    flt = bloom_filter_t()
+                    if not flt.read(fp):
+                        return False, f'bad filter <{i}>'
+                    self.filters.append(flt)
+            return True, ''
+        except Exception as e:
+            return False, str(e)
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
 import base64
 import re
 import select
@@ -10,6 +11,7 @@ from mutex_lock import *
 
 """
     这里实现一个简单的多线程代理转发功能核心,用于进行代理的代理转发.
+    tiny_proxy_svr_async为基于asyncio的事件驱动实现,单线程即可承载大量并发隧道.
 """
 
 
@@ -257,11 +259,199 @@ class tick_meter:
         return False
 
 
+def sock_is_alive(sock):
+    """检查空闲的连接是否仍然可用(空闲连接不应有可读事件,可读说明对方已断开或发送了意外数据)"""
+    try:
+        rlist, wlist, elist = select.select([sock], [], [], 0)
+    except (OSError, ValueError) as e:
+        return False
+    return not rlist
+
+
+class upstream_pool_t:
+    """上游代理的预连接池与健康统计.
+        连接池按(host,port,usr)分组保持预先建立的空闲连接,获取连接时优先复用,省去建连的耗时;
+        隧道建立后连接即被会话独占,不再归还.统计每个上游的成功/失败次数与平滑延迟,用于选择快速健康的上游.
+    """
+
+    def __init__(self, min_idle=2, max_idle=8, idle_ttl=30, time_out=5, fail_limit=3, fail_cool=30):
+        self.min_idle = min_idle  # 最近使用过的上游,维护时预建的空闲连接数量
+        self.max_idle = max_idle  # 每个上游最多保持的空闲连接数量
+        self.idle_ttl = idle_ttl  # 空闲连接的最长保持秒数
+        self.used_ttl = 60  # 最近使用的上游的判定秒数
+        self.time_out = time_out  # 建连超时秒数
+        self.fail_limit = fail_limit  # 连续失败次数达到此值时,视为不健康
+        self.fail_cool = fail_cool  # 不健康的上游在最后失败后冷却的秒数
+        self.idles = {}  # {key:[(sock,tm)]}
+        self.stats = {}  # {key:{'ok':成功次数,'err':失败次数,'fails':连续失败次数,'lat':平滑延迟毫秒,'last_err':最后失败时间,'last_use':最后使用时间,
+        #                  'warm_ok':预建连接成功次数,'warm_err':预建连接失败次数,'warm_lat':预建连接平滑延迟毫秒}}
+        self.locker = lock_t(True)
+        self.maintaining = False  # 是否正在进行维护
+
+    @staticmethod
+    def key(info):
+        """由目标代理信息(host,port,usr,pwd)得到连接池的分组键"""
+        return (info[0], int(info[1]), info[2] if len(info) > 2 else None)
+
+    def _stat(self, key):
+        st = self.stats.get(key)
+        if st is None:
+            st = self.stats[key] = {'ok': 0, 'err': 0, 'fails': 0, 'lat': None, 'last_err': 0, 'last_use': 0, 'warm_ok': 0, 'warm_err': 0, 'warm_lat': None}
+        return st
+
+    def record(self, info, ok, ms=None):
+        """记录上游的一次使用结果;ms为建立可用隧道的耗时毫秒"""
+        with self.locker:
+            st = self._stat(self.key(info))
+            if ok:
+                st['ok'] += 1
+                st['fails'] = 0
+                if ms is not None:
+                    st['lat'] = ms if st['lat'] is None else st['lat'] * 0.8 + ms * 0.2
+            else:
+                st['err'] += 1
+                st['fails'] += 1
+                st['last_err'] = time.time()
+
+    def record_warm(self, info, ok, ms=None):
+        """记录一次预建连接的结果;仅为TCP建连,不代表隧道可用,单独统计而不参与健康判断与代价评估"""
+        with self.locker:
+            st = self._stat(self.key(info))
+            if ok:
+                st['warm_ok'] += 1
+                if ms is not None:
+                    st['warm_lat'] = ms if st['warm_lat'] is None else st['warm_lat'] * 0.8 + ms * 0.2
+            else:
+                st['warm_err'] += 1
+
+    def is_healthy(self, info, now=None):
+        """判断上游是否健康(连续失败达到限定次数且仍在冷却期内则不健康)"""
+        st = self.stats.get(self.key(info))
+        if st is None or st['fails'] < self.fail_limit:
+            return True
+        if now is None:
+            now = time.time()
+        return now - st['last_err'] >= self.fail_cool
+
+    def cost(self, info):
+        """评估上游的预期代价:平滑延迟按失败率加权;尚无延迟样本的上游代价为0,便于得到试用"""
+        st = self.stats.get(self.key(info))
+        if st is None or st['lat'] is None:
+            return 0
+        total = st['ok'] + st['err']
+        return st['lat'] * (1 + 4 * st['err'] / total)
+
+    def pick(self, cands):
+        """从候选上游列表中选择健康且代价最小的上游;全部不健康时选择最早失败的上游进行重试"""
+        if not cands:
+            return None
+        now = time.time()
+        with self.locker:
+            goods = [c for c in cands if self.is_healthy(c, now)]
+            if not goods:
+                return min(cands, key=lambda c: self.stats[self.key(c)]['last_err'])
+            return min(goods, key=self.cost)
+
+    def _pop_idle(self, key):
+        """获取一个仍然可用的空闲连接"""
+        now = time.time()
+        with self.locker:
+            self._stat(key)['last_use'] = now
+            lst = self.idles.get(key)
+            while lst:
+                sock, tm = lst.pop()
+                if now - tm < self.idle_ttl and sock_is_alive(sock):
+                    return sock
+                sock.close()
+        return None
+
+    def put(self, info, sock):
+        """归还一个尚未使用过的连接,返回值:是否放入了连接池"""
+        key = self.key(info)
+        with self.locker:
+            lst = self.idles.setdefault(key, [])
+            if len(lst) < self.max_idle:
+                lst.append((sock, time.time()))
+                return True
+        sock.close()
+        return False
+
+    def take(self, info):
+        """获取到上游的阻塞连接:优先复用空闲连接,否则新建连接.返回值:(sock,建连毫秒)或(None,None)"""
+        sock = self._pop_idle(self.key(info))
+        if sock is not None:
+            sock.setblocking(True)
+            return sock, 0
+        begin = time.time()
+        sock = make_tcp_conn(info[0], info[1], self.time_out)
+        if sock is None:
+            self.record(info, False)
+            return None, None
+        return sock, (time.time() - begin) * 1000
+
+    async def take_async(self, info):
+        """获取到上游的非阻塞连接,用于asyncio服务.返回值:(sock,建连毫秒)或(None,None)"""
+        sock = self._pop_idle(self.key(info))
+        if sock is not None:
+            sock.setblocking(False)
+            return sock, 0
+        begin = time.time()
+        sock = await async_tcp_conn(info[0], info[1], self.time_out)
+        if sock is None:
+            self.record(info, False)
+            return None, None
+        return sock, (time.time() - begin) * 1000
+
+    def maintain(self):
+        """连接池维护:清理过期或失效的空闲连接;为最近使用过的健康上游补足预建的空闲连接"""
+        now = time.time()
+        needs = []
+        with self.locker:
+            if self.maintaining:
+                return  # 上一轮维护尚未结束
+            self.maintaining = True
+            for key, lst in self.idles.items():
+                keeps = []
+                for sock, tm in lst:
+                    if now - tm < self.idle_ttl and sock_is_alive(sock):
+                        keeps.append((sock, tm))
+                    else:
+                        sock.close()
+                lst[:] = keeps
+            for key, st in self.stats.items():
+                if now - st['last_use'] > self.used_ttl or not self.is_healthy(key, now):
+                    continue
+                cnt = self.min_idle - len(self.idles.get(key, ()))
+                if cnt > 0:
+                    needs.append((key, cnt))
+
+        try:
+            for key, cnt in needs:  # 在锁外进行建连
+                for i in range(cnt):
+                    begin = time.time()
+                    sock = make_tcp_conn(key[0], key[1], self.time_out)
+                    if sock is None:
+                        self.record_warm(key, False)
+                        break
+                    self.record_warm(key, True, (time.time() - begin) * 1000)
+                    self.put(key, sock)
+        finally:
+            self.maintaining = False
+
+    def close(self):
+        """关闭全部空闲连接"""
+        with self.locker:
+            for lst in self.idles.values():
+                for sock, tm in lst:
+                    sock.close()
+            self.idles.clear()
+
+
 # 代理服务器回调处理器句柄
 class tiny_proxy_handler:
-    def __init__(self, idle_tick=1 * 1000):
+    def __init__(self, idle_tick=1 * 1000, pool=None):
         self.meter_idle = tick_meter(idle_tick, False)
-        pass
+        self.pool = upstream_pool_t() if pool is None else pool  # 上游代理连接池与健康统计
 
     def on_idle(self):
         '通知内部目前处于空闲状态,返回值告知proxy循环是否停止'
@@ -275,6 +465,10 @@ class tiny_proxy_handler:
         """根据session中的信息,查找对应的目标代理地址"""
         return ('127.0.0.1', 8899, 'usr', 'pwd')
 
+    def pick_dst(self, cands):
+        """选择策略:从候选目标代理列表[(host,port,usr,pwd)]中选择快速健康的代理,可在on_get_dst中使用"""
+        return self.pool.pick(cands)
+
     def on_log(self, *args):
         out_list = []
         for a in args:
@@ -317,8 +511,12 @@ def tiny_proxy_svr(port, handler, maxconn=200):
         # 根据当前请求的会话信息,获取目标代理地址
         session.proxy_info = handler.on_get_dst(session)
 
-        # 连接目标代理地址
-        dst_sck = make_tcp_conn(session.proxy_info[0], session.proxy_info[1])
+        # 连接目标代理地址,优先复用连接池中的空闲连接
+        pool = getattr(handler, 'pool', None)
+        if pool is not None:
+            dst_sck, conn_ms = pool.take(session.proxy_info)
+        else:
+            dst_sck, conn_ms = make_tcp_conn(session.proxy_info[0], session.proxy_info[1]), None
         if dst_sck is None:
             session.warn('conn DST<%s:%d> proxy timeout.' % (session.proxy_info[0], session.proxy_info[1]))
             handler.on_error('cto', (session.proxy_info[0], session.proxy_info[1]))  # 通知外部,连接超时
@@ -341,9 +539,14 @@ def tiny_proxy_svr(port, handler, maxconn=200):
                 return False
 
             # 等待目标端回应
+            begin = time.time()
             if not session.dst_sock.wait_head(is_req=False) or session.dst_sock.head.get('status') != 200:
                 session.warn('recv resp CONNECT error.')
+                if pool is not None:
+                    pool.record(session.proxy_info, False)
                 return False
+            if pool is not None:
+                pool.record(session.proxy_info, True, conn_ms + (time.time() - begin) * 1000)
 
             # 给源端应答
             if not session.src_sock.send_data(RSP_CONNOK):
@@ -359,6 +562,8 @@ def tiny_proxy_svr(port, handler, maxconn=200):
             if session.src_sock.data and not session.dst_sock.send_data(session.src_sock.data):
                 session.warn('send data init error.')
                 return False
+            if pool is not None:
+                pool.record(session.proxy_info, True, conn_ms if conn_ms else None)
 
         # 进入完整的交互循环过程,两个链接任意连接中断就算结束.
         while True:
@@ -407,6 +612,8 @@ def tiny_proxy_svr(port, handler, maxconn=200):
         if clt_sock is None:
             if handler.meter_idle.hit():
                 loop = 0 if handler.on_idle() else 1  # 如果外部事件要求停止,则循环结束
+                if getattr(handler, 'pool', None) is not None:
+                    start_thread(handler.pool.maintain)  # 后台维护上游连接池
             continue
 
         # 构造proxy服务端会话对象
@@ -417,6 +624,188 @@ def tiny_proxy_svr(port, handler, maxconn=200):
         start_thread(on_req, session, handler)
 
     svr.uninit()
+    if getattr(handler, 'pool', None) is not None:
+        handler.pool.close()
+
+
+# -----------------------------------------------------------------------------
+# 基于asyncio的事件驱动代理服务,与tiny_proxy_svr的功能和handler回调一致
+async def async_read_head(sock, data=b'', wait_time=120, is_req=True, MAXSIZE=1024 * 8):
+    """在给定的时间范围内从非阻塞sock接收http头.返回值:(head,剩余数据),失败时head为None"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait_time
+    while True:
+        hb = data.find(b'\r\n\r\n')  # 查找http请求的head和body的分隔符
+        if hb != -1:
+            return parse_http_head(data[0:hb + 2], is_req), data[hb + 4:]
+        remain = deadline - loop.time()
+        if remain <= 0:
+            return None, data
+        try:
+            chunk = await asyncio.wait_for(loop.sock_recv(sock, MAXSIZE), remain)
+        except (OSError, asyncio.TimeoutError) as e:
+            return None, data
+        if not chunk:
+            return None, data  # 对方连接断开了
+        data += chunk
+
+
+async def async_tcp_conn(host, port, time_out=5):
+    """异步连接指定的目标主机端口,返回值:非阻塞的socket或None"""
+    loop = asyncio.get_running_loop()
+    s = None
+    try:
+        infos = await asyncio.wait_for(loop.getaddrinfo(host, int(port), type=socket.SOCK_STREAM), time_out)
+        family, stype, proto, _, addr = infos[0]
+        s = socket.socket(family, stype, proto)
+        s.setblocking(False)
+        await asyncio.wait_for(loop.sock_connect(s, addr), time_out)
+        return s
+    except Exception as e:
+        if s:
+            s.close()
+        return None
+
+
+async def async_pump(src, dst, bufsize=1024 * 64):
+    """将src收到的数据持续转发给dst,直到连接断开.使用固定缓冲区与内存视图转发,不产生额外的数据拷贝"""
+    loop = asyncio.get_running_loop()
+    buf = bytearray(bufsize)
+    view = memoryview(buf)
+    while True:
+        size = await loop.sock_recv_into(src, buf)
+        if not size:
+            return  # 对方连接断开
+        await loop.sock_sendall(dst, view[:size])
+
+
+async def _async_do_req(session, handler):
+    """异步代理请求处理函数"""
+    loop = asyncio.get_running_loop()
+    src = session.src_sock.sock
+    head, data = await async_read_head(src)
+    if head is None:
+        session.warn('recv src head fail')
+        return False
+    session.src_sock.head = head
+    session.src_sock.data = data
+
+    # 根据当前请求的会话信息,获取目标代理地址
+    session.proxy_info = handler.on_get_dst(session)
+
+    # 连接目标代理地址,优先复用连接池中的空闲连接
+    pool = getattr(handler, 'pool', None)
+    if pool is not None:
+        dst, conn_ms = await pool.take_async(session.proxy_info)
+    else:
+        dst, conn_ms = await async_tcp_conn(session.proxy_info[0], session.proxy_info[1]), None
+    if dst is None:
+        session.warn('conn DST<%s:%d> proxy timeout.' % (session.proxy_info[0], session.proxy_info[1]))
+        handler.on_error('cto', (session.proxy_info[0], session.proxy_info[1]))  # 通知外部,连接超时
+        return False
+    session.dst_sock = tiny_proxy_sock(dst)
+
+    # 生成目标代理需要的认证信息
+    if session.proxy_info[2]:
+        pauth = base64.b64encode(('%s:%s' % (session.proxy_info[2], session.proxy_info[3])).encode('utf-8'))
+    else:
+        pauth = None
+
+    if session.src_sock.is_CONNECT():
+        # 明确给出CONNECT方法了,需要对目标代理也发起连接请求
+        await loop.sock_sendall(dst, make_http_head(head, pauth, 'CONNECT').encode('ascii'))
+        # 等待目标端回应
+        begin = time.time()
+        rsp, rest = await async_read_head(dst, is_req=False)
+        if rsp is None or rsp.get('status') != 200:
+            session.warn('recv resp CONNECT error.')
+            if pool is not None:
+                pool.record(session.proxy_info, False)
+            return False
+        if pool is not None:
+            pool.record(session.proxy_info, True, conn_ms + (time.time() - begin) * 1000)
+        session.dst_sock.head = rsp
+        # 给源端应答,并转发双方可能已经提前到达的数据
+        await loop.sock_sendall(src, RSP_CONNOK + rest)
+    else:
+        # 初始的就是普通请求,重构http请求头后转发
+        await loop.sock_sendall(dst, make_http_head(head, pauth).encode('ascii'))
+        if pool is not None:
+            pool.record(session.proxy_info, True, conn_ms if conn_ms else None)
+    if data:
+        await loop.sock_sendall(dst, data)
+
+    # 进入完整的交互循环过程,两个链接任意连接中断就算结束.
+    pumps = [asyncio.ensure_future(async_pump(dst, src)), asyncio.ensure_future(async_pump(src, dst))]
+    try:
+        done, pending = await asyncio.wait(pumps, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for t in pumps:
+            t.cancel()
+    for t in done:
+        if t.exception():
+            session.warn('relay error.', t.exception())
+            return False
+    session.log(' End.')
+    return True
+
+
+async def _async_on_req(session, handler):
+    """异步代理请求处理入口"""
+    try:
+        if not await _async_do_req(session, handler):
+            session.warn('TinyProxyFor Fail.')
+    except Exception as e:
+        print(e)
+    session.src_sock.close()
+    if session.dst_sock:
+        session.dst_sock.close()
+
+
+async def _async_proxy_svr(port, handler, maxconn):
+    """异步代理服务器主体循环"""
+    ioloop = asyncio.get_running_loop()
+    svr = tiny_tcp_svr_sock()
+    if not svr.init(port, maxconn):
+        return
+    svr.svr_sock.setblocking(False)
+    tasks = set()
+    pool = getattr(handler, 'pool', None)
+    maintain = None
+    try:
+        loop = 1
+        while loop:
+            try:
+                clt_sock, addr = await asyncio.wait_for(ioloop.sock_accept(svr.svr_sock), 0.1)
+            except asyncio.TimeoutError:
+                if handler.meter_idle.hit():
+                    loop = 0 if handler.on_idle() else 1  # 如果外部事件要求停止,则循环结束
+                    if pool is not None and (maintain is None or maintain.done()):
+                        maintain = ioloop.run_in_executor(None, pool.maintain)  # 在线程中维护上游连接池,不阻塞事件循环
+                continue
+            except OSError as e:
+                continue
+
+            # 构造proxy服务端会话对象,启动新的连接处理任务
+            clt_sock.setblocking(False)
+            session = tiny_proxy_session(clt_sock, handler.on_log)
+            session.log(' Begin.')
+            task = asyncio.ensure_future(_async_on_req(session, handler))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+    finally:
+        for task in list(tasks):
+            task.cancel()
+        svr.uninit()
+        if pool is not None:
+            pool.close()
+
+
+def tiny_proxy_svr_async(port, handler, maxconn=1024):
+    """基于asyncio的http代理服务器,单线程事件驱动,功能与handler回调同tiny_proxy_svr;maxconn为监听队列长度"""
+    # 先进行一次空闲事件处理,更新初始的目标代理列表
+    handler.on_idle()
+    asyncio.run(_async_proxy_svr(port, handler, maxconn))
 
 
 # -----------------------------------------------------------------------------
@@ -4,6 +4,10 @@
 import socket
 import select
 import re
+import time
+import selectors
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 # Unresolved/HTTPS domain
 RSP_404 = (
@@ -25,12 +29,37 @@ RSP_FMT_CHS = (
 )
 
 
+RSP_FMT_CHUNKED = (
+    b"HTTP/1.1 %d %s\r\n"
+    b"Content-Type: %s\r\n"
+    b"Transfer-Encoding: chunked\r\n\r\n"
+)
+
+
 # -----------------------------------------------------------------------------
 def make_rsp_chs(code, data, chs, status=b'OK'):
     '用于拼装通用http回应'
     return RSP_FMT_CHS % (code, status, chs, len(data)) + data
 
 
+def make_rsp_stream(code, chunks, chs, status=b'OK', length=None):
+    """用于拼装流式http回应的生成器:给出length时使用Content-Length,否则使用chunked分块编码逐块输出.
+        on_req可以直接返回此生成器,服务器会逐块发送,不必在内存中拼装完整的回应体.
+    """
+    if length is not None:
+        yield RSP_FMT_CHS % (code, status, chs, length)
+        for chunk in chunks:
+            if chunk:
+                yield chunk
+        return
+
+    yield RSP_FMT_CHUNKED % (code, status, chs)
+    for chunk in chunks:
+        if chunk:
+            yield b'%x\r\n%s\r\n' % (len(chunk), chunk)
+    yield b'0\r\n\r\n'
+
+
 # -----------------------------------------------------------------------------
 class tiny_tcp_svr_sock:
     '超简单的tcp服务器'
@@ -72,6 +101,10 @@ class tiny_http_svr_sock:
 
     def __init__(self, s):
         self.sock = s
+        self.buf = b''  # 已接收但尚未解析的数据(可能包含流水线发来的后续请求)
+        self.head = None  # 最近一个完整请求的头
+        self.data = b""  # 最近一个完整请求的体
+        self._head = None  # 已解析但体尚未收全的请求头
 
     def _recv(self, wait_time, MAXSIZE=1024 * 8):
         # 等待数据到达
@@ -87,8 +120,8 @@ class tiny_http_svr_sock:
             return -2  # 出现错误了,返回
 
         # 得到数据了,累积
-        self.data += chunk
-        return len(self.data)
+        self.buf += chunk
+        return len(self.buf)
 
     def _parse_head(self, data):
         '解析请求,得到分解后的字典'
@@ -110,46 +143,69 @@ class tiny_http_svr_sock:
                 head[m.group(1).lower()] = m.group(2)
         return head
 
-    def _is_recv_ok(self):
-        '判断接收是否完成(头与体都完成)'
-        if self.head is None:
-            return False
-        if self.head['method'] == 'POST':
-            # post方法,需要根据头中的内容长度与实际长度判断是否接收完成
-            return int(self.head['content-length']) == len(self.data)
-        else:
-            # 不是post方法,有head就认为接收成功了
-            return True
-
-    def recv_req(self, wait_time=60):
-        '在给定的时间范围内接收请求,返回值告知是否成功,请求内容可以在head和data中获取'
-        self.head = None
-        self.data = b""
-        wait_one = 0.5
-        for i in range(int(wait_time / wait_one) + 1):
+    def _take_req(self):
+        """尝试从已接收的数据中截取一个完整的请求(头与体都完成).返回值:1完成;0未完成;-1格式错误
+            已解析但体未收全的请求头暂存在_head中,待后续数据到达后继续;完成后才更新head与data.
+        """
+        if self._head is None:
+            hb = self.buf.find(b'\r\n\r\n')  # 查找http请求的head和body的分隔符
+            if hb == -1:
+                return 0  # 没有分隔符,继续接收
+            self._head = self._parse_head(self.buf[0:hb + 2])  # 解析请求头
+            if self._head is None:
+                return -1  # 头格式错误
+            self.buf = self.buf[hb + 4:]
+
+        # 根据头中的内容长度截取body数据,其后的数据属于下一个请求
+        try:
+            size = int(self._head.get('content-length', 0))
+        except ValueError as e:
+            return -1
+        if len(self.buf) < size:
+            return 0
+        self.head = self._head
+        self.data = self.buf[:size]
+        self.buf = self.buf[size:]
+        self._head = None
+        return 1
+
+    def pending(self):
+        '判断是否有已接收但尚未成为完整请求的数据'
+        return self._head is not None or len(self.buf) > 0
+
+    def take_buffered(self):
+        """不进行接收,尝试从已接收的数据中得到下一个完整的请求(用于处理流水线请求).返回值:是否得到了请求"""
+        return self._take_req() == 1
+
+    def recv_req(self, wait_time=60, wait_one=0.5):
+        """在给定的时间范围内接收请求,返回值告知是否成功,请求内容可以在head和data中获取.
+            空闲等待wait_one秒仍无数据时返回;已收到部分请求时持续接收,直到请求完整或超过wait_time.
+        """
+        end = time.time() + wait_time
+        while True:
+            rc = self._take_req()  # 先尝试处理已经接收的数据
+            if rc:
+                return rc > 0
+            left = end - time.time()
+            if left <= 0:
+                return False
             # 进行分时循环接收
-            rc = self._recv(wait_one)
-            if rc <= 0:  # 对方断开或超时
-                # print(rc)
-                break
-
-            if self.head is None:
-                hb = self.data.find(b'\r\n\r\n')  # 查找http请求的head和body的分隔符
-                if hb == -1: continue  # 没有分隔符,继续接收
-                self.head = self._parse_head(self.data[0:hb + 2])  # 解析请求头
-                if self.head is None:
-                    return False  # 头格式错误
-                self.data = self.data[hb + 4:]  # 截取body数据
+            rc = self._recv(min(wait_one, left))
+            if rc < 0 or (rc == 0 and not self.pending()):  # 对方断开,或空闲超时
+                return False
 
-            if self._is_recv_ok():
-                return True
-
-        return self._is_recv_ok()
+    def keep_alive(self):
+        '判断当前请求之后是否保持连接'
+        return self.head is None or self.head.get('connection', '').lower() != 'close'
 
     def send_rsp(self, data):
-        '发送回应,返回值告知是否成功'
+        '发送回应,返回值告知是否成功;data可以是完整的回应数据,也可以是逐块给出回应数据的可迭代对象'
         try:
-            self.sock.sendall(data)
+            if isinstance(data, (bytes, bytearray, memoryview)):
+                self.sock.sendall(data)
+            else:
+                for chunk in data:
+                    self.sock.sendall(chunk)
         except OSError as e:
             print(e)
             return False
@@ -170,7 +226,9 @@ class tiny_svr_handler:
         return False
 
     def on_req(self, sock, head, body):
-        '代理请求处理函数'
+        """代理请求处理函数,返回完整的回应数据,或逐块给出回应数据的可迭代对象(如make_rsp_stream).
+            tiny_http_svr_mt的线程模式下会被多个线程并发调用;进程模式下在进程池中运行,此时sock为None.
+        """
         return RSP_404
 
     def on_log(self, *args):
@@ -227,6 +285,155 @@ def tiny_http_svr(port, handler):
 
     svr.uninit()
 
+
+# -----------------------------------------------------------------------------
+_proc_handler = None  # 进程池中的请求处理器
+
+
+def _proc_init(handler):
+    '进程池的初始化函数,每个工作进程只传递一次handler'
+    global _proc_handler
+    _proc_handler = handler
+
+
+def _proc_req(head, body):
+    '在进程池中调用on_req,可迭代的回应在进程内拼装为完整数据后返回'
+    rsp = _proc_handler.on_req(None, head, body)
+    if not isinstance(rsp, (bytes, bytearray)):
+        rsp = b''.join(rsp)
+    return rsp
+
+
+def _serve_conn(session, handler, procs):
+    """在线程池中运行的请求处理:session中已有一个完整的请求,连同已到达的流水线请求一起处理,按到达顺序回应.
+        返回值告知连接是否继续保持.
+    """
+    clt_sock = session.sock
+    try:
+        alive = True
+        while alive:
+            # 收集已经到达的流水线请求
+            reqs = [(session.head, session.data, session.keep_alive())]
+            while reqs[-1][2] and session.take_buffered():
+                reqs.append((session.head, session.data, session.keep_alive()))
+
+            if procs is not None:  # 流水线请求同时提交给进程池并行处理
+                rsps = [procs.submit(_proc_req, head, body) for head, body, _ in reqs]
+            for i, (head, body, keep) in enumerate(reqs):
+                handler.on_log('TinyHttpSvr Request: ', head)
+                # 调用外部函数,进行http请求的处理
+                rsp = rsps[i].result() if procs is not None else handler.on_req(clt_sock, head, body)
+                # 发送回应给客户端
+                alive = session.send_rsp(rsp) and keep
+                if not alive:
+                    break  # 发送失败或客户端要求关闭,停止
+            # 处理期间又收全的请求继续处理,否则交还给主循环等待
+            if alive and not session.take_buffered():
+                break
+        return alive
+    except Exception as e:
+        print(e)
+        return False
+
+
+def tiny_http_svr_mt(port, handler, workers=16, procs=0, maxconn=128, keep_alive=30):
+    """并发长连接http服务器主体循环功能函数:主循环用selectors等待全部客户端连接的数据,
+        请求接收完整后才交给线程池处理,空闲的长连接与慢速客户端不会占用工作线程.
+        workers - 线程池大小,即同时处理的请求数量
+        procs - 大于0时,on_req在该数量的进程池中运行(handler需可pickle,用于CPU密集的请求处理)
+        maxconn - 监听队列长度
+        keep_alive - 连接无数据到达的最大等待秒数,超过后关闭(包括请求尚未收全的连接)
+    """
+    svr = tiny_tcp_svr_sock()
+    if not svr.init(port, maxconn):
+        return
+
+    sel = selectors.DefaultSelector()
+    sel.register(svr.svr_sock, selectors.EVENT_READ, None)
+    wake_r, wake_w = socket.socketpair()  # 工作线程处理完成后唤醒主循环
+    sel.register(wake_r, selectors.EVENT_READ, wake_r)
+    thds = ThreadPoolExecutor(workers)
+    pps = ProcessPoolExecutor(procs, initializer=_proc_init, initargs=(handler,)) if procs > 0 else None
+    idles = {}  # 主循环等待中的会话 {session:最后活动时间}
+    backs = deque()  # 工作线程处理完成的会话 (session,alive)
+
+    def close(session):
+        handler.on_log('TinyHttpSvr Disconn: ', session.sock)
+        session.close()
+
+    def done(session, fut):
+        backs.append((session, fut.result()))
+        try:
+            wake_w.send(b'\0')
+        except OSError as e:
+            pass
+
+    def submit(session):
+        idles.pop(session, None)
+        thds.submit(_serve_conn, session, handler, pps).add_done_callback(lambda fut: done(session, fut))
+
+    def wait(session):
+        idles[session] = time.time()
+        sel.register(session.sock, selectors.EVENT_READ, session)
+
+    try:
+        loop = 1
+        while loop:
+            events = sel.select(0.1)
+            for key, mask in events:
+                if key.data is None:  # 新连接到达
+                    clt_sock, addr = svr.svr_sock.accept()
+                    handler.on_log('TinyHttpSvr Accept: ', clt_sock)
+                    wait(tiny_http_svr_sock(clt_sock))
+                elif key.data is wake_r:
+                    wake_r.recv(4096)
+                else:  # 客户端数据到达,累积到会话中,收全请求后交给线程池
+                    session = key.data
+                    rc = session._recv(0)
+                    if rc == 0:
+                        continue
+                    rc = session._take_req() if rc > 0 else -1
+                    if rc:
+                        sel.unregister(session.sock)
+                        if rc > 0:
+                            submit(session)
+                        else:
+                            idles.pop(session, None)
+                            close(session)
+                    else:
+                        idles[session] = time.time()
+
+            # 工作线程交还的会话:保持连接的继续等待;已经收全的请求直接再次提交
+            while backs:
+                session, alive = backs.popleft()
+                if not alive:
+                    close(session)
+                elif session._take_req() > 0:
+                    submit(session)
+                else:
+                    wait(session)
+
+            # 关闭超时的连接
+            now = time.time()
+            for session in [s for s, t in idles.items() if now - t > keep_alive]:
+                sel.unregister(session.sock)
+                del idles[session]
+                close(session)
+
+            if not events:
+                loop = 0 if handler.on_idle() else 1
+    finally:
+        svr.uninit()
+        thds.shutdown(wait=True)
+        if pps is not None:
+            pps.shutdown()
+        for session in list(idles) + [s for s, _ in backs]:
+            close(session)
+        sel.close()
+        wake_r.close()
+        wake_w.close()
+
+
 def find_chs_by_head(heads,defchs=''):
     '根据http头中的内容类型,分析查找可能存在的字符集类型'
     if 'Content-Type' not in heads:
@@ -241,5 +448,65 @@ def find_chs_by_head(heads,defchs=''):
 
 # -----------------------------------------------------------------------------
 if __name__ == "__main__":
+    import threading
+
+    class echo_handler(tiny_svr_handler):
+        stop = False
+
+        def on_idle(self):
+            return self.stop
+
+        def on_req(self, sock, head, body):
+            return make_rsp_chs(200, head['url'].encode() + b'|%d' % len(body), b'text/plain')
+
+        def do_log(self, out_str):
+            pass
+
+    def recv_rsp(f):
+        f.readline()
+        size = 0
+        while True:
+            l = f.readline()
+            if l in (b'\r\n', b''):
+                break
+            if l.lower().startswith(b'content-length:'):
+                size = int(l.split(b':')[1])
+        return f.read(size)
+
+    # 会话层:大请求体分多次到达,流水线请求的体在头之后延迟到达
+    a, b = socket.socketpair()
+    session = tiny_http_svr_sock(b)
+    big = b'x' * 40000
+    threading.Thread(target=a.sendall, args=(b'POST /big HTTP/1.1\r\nContent-Length: %d\r\n\r\n' % len(big) + big,)).start()
+    assert session.recv_req(5) and session.data == big
+    a.sendall(b'GET /a HTTP/1.1\r\n\r\nPOST /b HTTP/1.1\r\nContent-Length: 5\r\n\r\nab')
+    assert session.recv_req(5) and session.head['url'] == '/a'
+    assert not session.take_buffered()
+    a.sendall(b'cde')
+    assert session.recv_req(5) and session.head['url'] == '/b' and session.data == b'abcde'
+    a.close()
+    session.close()
+
+    # 并发服务器:大请求体,拆分到达的流水线请求,空闲长连接不占用工作线程
+    handler = echo_handler()
+    thd = threading.Thread(target=tiny_http_svr_mt, args=(18888, handler), kwargs={'workers': 2})
+    thd.start()
+    time.sleep(0.3)
+    idles = [socket.create_connection(('127.0.0.1', 18888)) for i in range(4)]
+    c = socket.create_connection(('127.0.0.1', 18888))
+    f = c.makefile('rb')
+    c.sendall(b'POST /big HTTP/1.1\r\nContent-Length: %d\r\n\r\n' % len(big) + big)
+    assert recv_rsp(f) == b'/big|40000'
+    c.sendall(b'GET /a HTTP/1.1\r\n\r\nPOST /b HTTP/1.1\r\nContent-Length: 5\r\n\r\nab')
+    assert recv_rsp(f) == b'/a|0'
+    time.sleep(0.3)
+    c.sendall(b'cde')
+    assert recv_rsp(f) == b'/b|5'
+    for s in idles:
+        s.close()
+    c.close()
+    handler.stop = True
+    thd.join()
+
     handler = tiny_svr_handler()
     tiny_http_svr(8888, handler)
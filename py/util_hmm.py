@@ -115,6 +115,12 @@ class std_hmm_t:
         # 不进行状态分隔,直接返回
         if sep_status is None:
             return ret, None
+        return ret, self._split_status(ret, sep_status)
+
+    @staticmethod
+    def _split_status(ret, sep_status):
+        """在状态列表ret中,按分隔状态sep_status拆分出有效状态区间列表[(begin,end)]"""
+        O = len(ret)
 
         def find(pos):
             """在ret列表中,从pos位置开始,查找一个有效状态序列"""
@@ -134,7 +140,70 @@ class std_hmm_t:
             if b != e:
                 seps.append((b, e))
             pos = e
-        return ret, seps
+        return seps
+
+    def _model_as(self, dtype):
+        """获取指定精度dtype的模型矩阵(A.T,B.T,PI),非float64时缓存转换结果"""
+        if dtype == self.A.dtype:
+            return self.A.T, self.B.T, self.PI
+        cache = getattr(self, '_model_cache', None)
+        if cache is None or cache[0] != dtype or cache[1] is not self.A:
+            At = np.ascontiguousarray(self.A.T, dtype=dtype)
+            Bt = np.ascontiguousarray(self.B.T, dtype=dtype)
+            cache = self._model_cache = (dtype, self.A, At, Bt, self.PI.astype(dtype))
+        return cache[2], cache[3], cache[4]
+
+    def predict_batch(self, obs_list, sep_status=None, batch=256, dtype=np.float64):
+        """使用维特比算法批量预测多个观测序列obs_list,按长度分组填充后,每个时间步对整批序列进行一次矩阵运算.
+            batch - 每批处理的序列数量
+            dtype - 计算精度,可选np.float32以降低内存与带宽
+            返回值:[(预测的状态值列表,有效区间列表或None)],与obs_list顺序一致
+        """
+        rsts = [([], None)] * len(obs_list)
+        order = sorted((i for i in range(len(obs_list)) if len(obs_list[i])), key=lambda i: len(obs_list[i]))  # 长度相近的序列归入同批,减少填充
+        At, Bt, PI = self._model_as(dtype)
+        N = self.N
+        for p in range(0, len(order), batch):
+            idxs = order[p:p + batch]
+            lens = np.array([len(obs_list[i]) for i in idxs])
+            S, T = len(idxs), int(lens[-1])
+            obs = np.zeros((S, T), dtype=np.int64)  # 填充后的观测矩阵
+            for r, i in enumerate(idxs):
+                obs[r, :lens[r]] = obs_list[i]
+
+            # 预分配计算缓冲区,循环中使用out参数原地计算
+            delta = np.empty((S, N), dtype=dtype)  # 各序列到达当前观测的每个状态的最大概率
+            temp = np.empty((S, N, N), dtype=dtype)  # [序列,当前状态,前一状态]的转移概率
+            best = np.empty((S, N), dtype=dtype)
+            arg = np.empty((S, N), dtype=np.intp)
+            psi = np.zeros((T, S, N), dtype=np.int8 if N < 128 else np.int32)  # 回溯路径矩阵
+
+            np.add(PI, Bt[obs[:, 0]], out=delta)
+            for t in range(1, T):
+                np.add(delta[:, None, :], At, out=temp)
+                np.argmax(temp, axis=2, out=arg)  # 到达当前状态的最大概率的前一状态
+                psi[t] = arg
+                np.max(temp, axis=2, out=best)
+                best += Bt[obs[:, t]]
+                live = lens > t  # 已结束的序列保持最终的delta不变
+                delta[live] = best[live]
+
+            # 利用psi向前回溯,已结束的序列从其自身的末尾开始
+            ret = np.zeros((S, T), dtype=np.int64)
+            last = np.argmax(delta, axis=1)
+            cur = last
+            rows = np.arange(S)
+            for t in range(T - 1, -1, -1):
+                live = lens > t
+                cur = np.where(lens - 1 == t, last, cur)
+                ret[live, t] = cur[live]
+                if t:
+                    cur = np.where(live, psi[t, rows, cur], cur)
+
+            for r, i in enumerate(idxs):
+                st = ret[r, :lens[r]].tolist()
+                rsts[i] = (st, None if sep_status is None else self._split_status(st, sep_status))
+        return rsts
 
 
 class train_hmm_t: